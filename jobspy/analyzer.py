@@ -0,0 +1,170 @@
+"""
+Single pass analysis of job descriptions.
+
+The job type keywords, remote keywords and salary ranges are found by one combined
+pattern over the lowercased description. Every branch of it starts with a literal,
+which lets the regex engine skip ahead to candidate positions instead of trying each
+branch everywhere. Emails are found from their "@" on the original text. Results are
+the same as those of the separate case insensitive searches the helpers of jobspy.util
+and the scrapers used to run; the few characters that case insensitive matching and
+lowercasing treat differently take a slower path that runs those searches.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+from jobspy.model import JobType
+
+email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+# min and max amounts with their k suffixes, e.g. $50k - $70k or $25.50-30
+salary_pattern = (
+    r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+    r"\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+)
+remote_keywords = ("remote", "work from home", "wfh")
+
+salary_regex = re.compile(salary_pattern)
+_email_regex = re.compile(email_pattern)
+_email_chars = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-"
+)
+# named groups would disable the literal prefix scan, matches are told apart by
+# their first character instead
+_combined_regex = re.compile(
+    r"full\s?time|part\s?time|internship|contract|remote|work from home|wfh|"
+    + salary_pattern.replace("[kK]", "k")
+)
+_job_type_by_first_char = {
+    "f": JobType.FULL_TIME,
+    "p": JobType.PART_TIME,
+    "i": JobType.INTERNSHIP,
+    "c": JobType.CONTRACT,
+}
+_job_type_regexes = {
+    job_type: re.compile(pattern, re.IGNORECASE)
+    for job_type, pattern in zip(
+        _job_type_by_first_char.values(),
+        (r"full\s?time", r"part\s?time", r"internship", r"contract"),
+    )
+}
+# İ lowercases to two characters, ı, ſ and the Kelvin sign only match i, s and k
+# case insensitively
+_case_exceptions = re.compile("[\u0130\u0131\u017f\u212a]")
+
+
+class DescriptionAnalysis:
+    """
+    What a description mentions
+    :param emails: in order of appearance
+    :param job_types: mentioned job types, in the order of JobType
+    :param is_remote: whether a remote keyword appears
+    :param salaries: (min, min k suffix, max, max k suffix) of each salary range, in
+        order of appearance
+    """
+
+    __slots__ = ("emails", "job_types", "is_remote", "salaries")
+
+    def __init__(
+        self,
+        emails: list[str],
+        job_types: list[JobType],
+        is_remote: bool,
+        salaries: list[tuple[str, str, str, str]],
+    ):
+        self.emails = emails
+        self.job_types = job_types
+        self.is_remote = is_remote
+        self.salaries = salaries
+
+    def __repr__(self) -> str:
+        return (
+            f"DescriptionAnalysis(emails={self.emails!r}, "
+            f"job_types={self.job_types!r}, is_remote={self.is_remote!r}, "
+            f"salaries={self.salaries!r})"
+        )
+
+
+def find_emails(text: str) -> list[str]:
+    """
+    Same emails as re.findall(email_pattern, text). Only the runs of address
+    characters right before each "@" are matched, instead of trying the pattern at
+    every position.
+    """
+    emails = []
+    position = 0
+    while (at := text.find("@", position)) != -1:
+        start = at
+        while start > position and text[start - 1] in _email_chars:
+            start -= 1
+        match = _email_regex.match(text, start) if start < at else None
+        if match:
+            emails.append(match.group())
+            position = match.end()
+        else:
+            position = at + 1
+    return emails
+
+
+def mentions_remote(text: str) -> bool:
+    """
+    Remote keyword check for short texts such as titles and locations
+    """
+    text = text.lower()
+    return any(keyword in text for keyword in remote_keywords)
+
+
+def analyze_description(text: str | None) -> DescriptionAnalysis:
+    """
+    Finds the emails, job types, remote keywords and salary ranges of a description
+    """
+    if not text:
+        return DescriptionAnalysis([], [], False, [])
+    if not text.isascii() and _case_exceptions.search(text):
+        return DescriptionAnalysis(
+            emails=find_emails(text),
+            job_types=[
+                job_type
+                for job_type, regex in _job_type_regexes.items()
+                if regex.search(text)
+            ],
+            is_remote=mentions_remote(text),
+            salaries=[match.groups() for match in salary_regex.finditer(text)],
+        )
+    job_types = set()
+    is_remote = False
+    salaries = []
+    for match in _combined_regex.finditer(text.lower()):
+        first_char = match.group()[0]
+        if first_char == "$":
+            # the original k suffixes
+            salaries.append(salary_regex.match(text, match.start()).groups())
+        elif first_char in _job_type_by_first_char:
+            job_types.add(_job_type_by_first_char[first_char])
+        else:
+            is_remote = True
+    return DescriptionAnalysis(
+        emails=find_emails(text),
+        job_types=[
+            job_type
+            for job_type in _job_type_by_first_char.values()
+            if job_type in job_types
+        ],
+        is_remote=is_remote,
+        salaries=salaries,
+    )
+
+
+def analyze_descriptions(texts: Iterable[str | None]) -> list[DescriptionAnalysis]:
+    """
+    Analyzes a batch of descriptions, each distinct one once
+    """
+    analyses: dict[str | None, DescriptionAnalysis] = {}
+    results = []
+    for text in texts:
+        analysis = analyses.get(text)
+        if analysis is None:
+            analysis = analyses[text] = analyze_description(text)
+        results.append(analysis)
+    return results
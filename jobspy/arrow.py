@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+from jobspy.frame import job_to_row
+from jobspy.model import Country, JobResponse
+from jobspy.util import desired_order
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency, see the "arrow" extra
+    pa = pc = pq = None
+
+# low cardinality columns stored once per distinct value
+dictionary_columns = ("site", "job_type", "interval", "currency", "listing_type")
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet output, "
+            "install it with: pip install python-jobspy[arrow]"
+        )
+
+
+def arrow_schema(fields: list[str] | None = None) -> "pa.Schema":
+    """
+    Arrow schema of the job records, following desired_order
+    :param fields: requested columns, all if None
+    """
+    _require_pyarrow()
+    types = {
+        "date_posted": pa.date32(),
+        "is_remote": pa.bool_(),
+        "min_amount": pa.float64(),
+        "max_amount": pa.float64(),
+        "company_rating": pa.float64(),
+        "company_reviews_count": pa.int64(),
+        "vacancy_count": pa.int64(),
+    }
+    schema_fields = []
+    for column in desired_order:
+        if fields is not None and column not in fields:
+            continue
+        if column in dictionary_columns:
+            column_type = pa.dictionary(pa.int32(), pa.string())
+        else:
+            column_type = types.get(column, pa.string())
+        schema_fields.append(pa.field(column, column_type))
+    return pa.schema(schema_fields)
+
+
+def rows_to_record_batch(
+    rows: list[dict], schema: "pa.Schema" = None
+) -> "pa.RecordBatch":
+    """
+    Builds a record batch from job records produced by job_to_row / iter_jobs
+    """
+    schema = schema or arrow_schema()
+    arrays = []
+    for field in schema:
+        values = [row.get(field.name) for row in rows]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(
+                pa.array(values, type=field.type.value_type).dictionary_encode()
+            )
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def batch_rows(rows: Iterable[dict], batch_size: int) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def rows_to_table(
+    rows: Iterable[dict], batch_size: int = 10000, fields: list[str] | None = None
+) -> "pa.Table":
+    """
+    Builds a Table sorted like the scrape_jobs DataFrame (by site, newest first)
+    :param fields: requested columns, all if None
+    """
+    schema = arrow_schema(fields)
+    batches = [
+        rows_to_record_batch(batch, schema) for batch in batch_rows(rows, batch_size)
+    ]
+    table = pa.Table.from_batches(batches, schema=schema).unify_dictionaries()
+    order = [
+        (column, direction)
+        for column, direction in (("site", "ascending"), ("date_posted", "descending"))
+        if column in schema.names
+    ]
+    if table.num_rows == 0 or not order:
+        return table
+    sort_keys = pa.table(
+        {
+            column: (
+                table[column].cast(pa.string()) if column == "site" else table[column]
+            )
+            for column, _ in order
+        }
+    )
+    indices = pc.sort_indices(sort_keys, sort_keys=order)
+    return table.take(indices)
+
+
+def jobs_to_arrow_table(
+    site_to_jobs: dict[str, JobResponse],
+    country: Country | None = None,
+    enforce_annual_salary: bool = False,
+) -> "pa.Table":
+    """
+    Arrow counterpart of jobs_to_dataframe, built straight from the JobPost records
+    """
+    _require_pyarrow()
+    rows = (
+        job_to_row(site, job, country, enforce_annual_salary)
+        for site, job_response in site_to_jobs.items()
+        for job in job_response.jobs
+    )
+    return rows_to_table(rows)
+
+
+def write_parquet(
+    rows: Iterable[dict],
+    path: str,
+    batch_size: int = 1000,
+    fields: list[str] | None = None,
+    **writer_kwargs,
+) -> int:
+    """
+    Streams job records to a Parquet file, one row group per batch, as they arrive
+    :param fields: requested columns, all if None
+    :return: number of jobs written
+    """
+    _require_pyarrow()
+    schema = arrow_schema(fields)
+    written = 0
+    with pq.ParquetWriter(path, schema, **writer_kwargs) as writer:
+        for batch in batch_rows(rows, batch_size):
+            writer.write_batch(rows_to_record_batch(batch, schema))
+            written += len(batch)
+    return written
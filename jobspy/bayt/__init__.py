@@ -1,28 +1,32 @@
 from __future__ import annotations
 
-import random
-import time
+from typing import AsyncIterator, Generator, Iterator, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
     JobPost,
-    JobResponse,
     Location,
     Country,
 )
-from jobspy.util import create_logger, create_session
+from jobspy.util import (
+    create_async_session,
+    create_logger,
+    create_session,
+    make_soup,
+)
 
 log = create_logger("Bayt")
 
 
 class BaytScraper(Scraper):
+    has_async_transport = True
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
+    # only the job listings of a page are parsed
+    job_strainer = SoupStrainer("li", attrs={"data-js-job": ""})
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
@@ -32,20 +36,71 @@ class BaytScraper(Scraper):
         self.session = None
         self.country = "worldwide"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+            )
+        pages = self._pages(scraper_input)
+        response = None
+        while True:
+            try:
+                url, page_jobs = pages.send(response)
+            except StopIteration:
+                return
+            if url is None:
+                yield page_jobs
+                continue
+            try:
+                response = self.session.get(url)
+            except Exception as e:
+                response = e
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        scrape_pages on an asyncio session
+        """
+        pages = self._pages(scraper_input)
+        response = None
+        async with create_async_session(
+            proxies=self.proxies, ca_cert=self.ca_cert
+        ) as session:
+            while True:
+                try:
+                    url, page_jobs = pages.send(response)
+                except StopIteration:
+                    return
+                if url is None:
+                    yield page_jobs
+                    continue
+                try:
+                    response = await session.get(url)
+                except Exception as e:
+                    response = e
+
+    def _pages(
+        self, scraper_input: ScraperInput
+    ) -> Generator[Tuple[str | None, list[JobPost]], object, None]:
+        """
+        Pagination without a transport: yields (url, []) for each page, which is sent
+        the response (or the exception of the request), then (None, jobs of the page)
+        """
         self.scraper_input = scraper_input
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
-        job_list: list[JobPost] = []
+        job_count = 0
         page = 1
         results_wanted = (
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
+        while job_count < results_wanted:
             log.info(f"Fetching Bayt jobs page {page}")
-            job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
+            response = yield self._page_url(self.scraper_input.search_term, page), []
+            job_elements = self._parse_jobs(response)
             if not job_elements:
                 break
 
@@ -54,13 +109,13 @@ class BaytScraper(Scraper):
                     "First job element snippet:\n" + job_elements[0].prettify()[:500]
                 )
 
-            initial_count = len(job_list)
+            page_jobs: list[JobPost] = []
             for job in job_elements:
                 try:
                     job_post = self._extract_job_info(job)
                     if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
+                        page_jobs.append(job_post)
+                        if job_count + len(page_jobs) >= results_wanted:
                             break
                     else:
                         log.debug(
@@ -71,25 +126,31 @@ class BaytScraper(Scraper):
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
                     continue
 
-            if len(job_list) == initial_count:
+            if not page_jobs:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
 
+            page_jobs = page_jobs[: results_wanted - job_count]
+            job_count += len(page_jobs)
+            yield None, page_jobs
+
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+    def _page_url(self, query: str, page: int) -> str:
+        """
+        The url of the job results for the given query and page number.
+        """
+        return f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
 
-    def _fetch_jobs(self, query: str, page: int) -> list | None:
+    def _parse_jobs(self, response) -> list | None:
         """
-        Grabs the job results for the given query and page number.
+        Grabs the job results out of the response (or exception) of a page request.
         """
         try:
-            url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
-            response = self.session.get(url)
+            if isinstance(response, Exception):
+                raise response
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = make_soup(response.content, self.job_strainer, response.encoding)
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
@@ -124,11 +185,11 @@ class BaytScraper(Scraper):
         location = location_tag.get_text(strip=True) if location_tag else None
 
         job_id = f"bayt-{abs(hash(job_url))}"
-        location_obj = Location(
+        location_obj = Location.build(
             city=location,
             country=Country.from_string(self.country),
         )
-        return JobPost(
+        return JobPost.build(
             id=job_id,
             title=job_title,
             company_name=company_name,
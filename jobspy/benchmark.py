@@ -0,0 +1,808 @@
+"""
+Offline benchmarks of the scrapers against recorded fixtures.
+
+The repository's fixtures directory has a small synthetic cassette per site, replayed
+as often as needed:
+
+    python -m jobspy.benchmark run fixtures --repeat 5
+
+Fixtures can also be recorded from live traffic:
+
+    python -m jobspy.benchmark record my_fixtures --search-term "software engineer" \
+        --location "Dallas, TX" --results-wanted 50
+
+The parity command checks that every html parser yields the same jobs from them,
+failing with --check if any column differs:
+
+    python -m jobspy.benchmark parity fixtures --parser html.parser --parser lxml --check
+
+The markdown command times the conversion of their descriptions by every path of
+jobspy.markdown and checks the output against markdownify:
+
+    python -m jobspy.benchmark markdown fixtures --processes 4
+
+The analyzer command compares jobspy.analyzer to the separate regex passes it replaced
+on the descriptions:
+
+    python -m jobspy.benchmark analyzer fixtures
+
+The salaries command times the salary extraction of the result frame against
+extract_salary row by row, on generated descriptions:
+
+    python -m jobspy.benchmark salaries --rows 100000
+
+The memory command reports the memory of a generated result frame per column, with
+the default and the compact dtypes:
+
+    python -m jobspy.benchmark memory --rows 50000
+
+The frame command reports the assembly time and peak memory of the result frame
+for generated jobs, next to one DataFrame per job concatenated as before:
+
+    python -m jobspy.benchmark frame --rows 1000 10000 100000
+
+The imports command times the cold imports of the package, each in a new interpreter,
+and lists the heavy dependencies they load:
+
+    python -m jobspy.benchmark imports
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+import pandas as pd
+from markdownify import markdownify
+
+from jobspy import analyzer, markdown, util
+from jobspy.frame import (
+    compact_frame,
+    extract_salaries,
+    job_to_row,
+    jobs_to_dataframe,
+)
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobResponse,
+    JobType,
+    Location,
+    Site,
+)
+from jobspy.replay import Cassette
+from jobspy.scheduler import SCRAPER_MAPPING
+from jobspy.scrape import _create_scraper_input, scrape_jobs
+from jobspy.util import desired_order
+
+
+def fixture_path(directory: str, site: Site) -> str:
+    return os.path.join(directory, f"{site.value}.json")
+
+
+def record_fixtures(
+    directory: str, sites: list[str] | None = None, **search
+) -> list[str]:
+    """
+    Runs each site once against the live website and records its traffic
+    :param directory: where the <site>.json fixtures are written
+    :param sites: site names, all sites by default
+    :param search: scrape_jobs search parameters
+    :return: fixture paths
+    """
+    paths = []
+    for site in [Site(site) for site in sites] if sites else list(Site):
+        path = fixture_path(directory, site)
+        site_search = {**search, "site_name": site.value}
+        with Cassette(path, mode="record", search=site_search):
+            scrape_jobs(**site_search)
+        paths.append(path)
+    return paths
+
+
+def _replay_once(cassette: Cassette, **overrides) -> dict:
+    """
+    Runs the cassette's search through its scraper and times every stage
+    :param overrides: search parameters replacing the recorded ones
+    """
+    cassette.load()
+    search = {**cassette.search, **overrides}
+    enforce_annual_salary = search.pop("enforce_annual_salary", False)
+    scraper_input = _create_scraper_input(
+        **{key: value for key, value in search.items() if key != "verbose"}
+    )
+    site = scraper_input.site_type[0]
+    with cassette:
+        scraper = SCRAPER_MAPPING[site]()
+        page_times, jobs = [], []
+        pages = scraper.scrape_pages(scraper_input)
+        while True:
+            start = time.perf_counter()
+            page = next(pages, None)
+            if page is None:
+                break
+            page_times.append(time.perf_counter() - start)
+            jobs.extend(page)
+    start = time.perf_counter()
+    jobs_df = jobs_to_dataframe(
+        {site.value: JobResponse(jobs=jobs)},
+        country=scraper_input.country,
+        enforce_annual_salary=enforce_annual_salary,
+    )
+    frame_time = time.perf_counter() - start
+    return {
+        "site": site.value,
+        "pages": len(page_times),
+        "jobs": len(jobs),
+        "scrape_s": sum(page_times),
+        "frame_s": frame_time,
+        "page_times": page_times,
+        "jobs_df": jobs_df,
+    }
+
+
+def benchmark_fixture(path: str, repeat: int = 3) -> dict:
+    """
+    Replays a fixture repeat times without network or sleeps
+    :return: best timings, throughput and peak memory of the run
+    """
+    cassette = Cassette(path, mode="replay")
+    with mock.patch.object(time, "sleep", lambda seconds: None):
+        runs = [_replay_once(cassette) for _ in range(max(repeat, 1))]
+        tracemalloc.start()
+        try:
+            _replay_once(cassette)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    best = min(runs, key=lambda run: run["scrape_s"] + run["frame_s"])
+    total = best["scrape_s"] + best["frame_s"]
+    return {
+        "site": best["site"],
+        "pages": best["pages"],
+        "jobs": best["jobs"],
+        "jobs_per_s": best["jobs"] / total if total else float("nan"),
+        "parse_ms_per_page": (
+            1000 * best["scrape_s"] / best["pages"] if best["pages"] else float("nan")
+        ),
+        "frame_ms": 1000 * best["frame_s"],
+        "peak_mb": peak_memory / 1024**2,
+    }
+
+
+def run_benchmarks(directory: str, repeat: int = 3) -> pd.DataFrame:
+    """
+    Benchmarks every <site>.json fixture found in directory
+    """
+    results = []
+    for site in Site:
+        path = fixture_path(directory, site)
+        if os.path.exists(path):
+            results.append(benchmark_fixture(path, repeat=repeat))
+    return pd.DataFrame(results)
+
+
+def compare_parsers(path: str, parsers: list[str] | None = None) -> pd.DataFrame:
+    """
+    Replays a fixture with each html parser and compares the jobs to the first's
+    :param parsers: names accepted by util.set_html_parser, html.parser and lxml
+        by default
+    :return: per parser, the number of jobs and the columns that differ
+    """
+    parsers = parsers or ["html.parser", "lxml"]
+    cassette = Cassette(path, mode="replay")
+    previous_parser = util.html_parser
+    frames = {}
+    try:
+        with mock.patch.object(time, "sleep", lambda seconds: None):
+            for parser in parsers:
+                util.set_html_parser(parser)
+                jobs_df = _replay_once(cassette)["jobs_df"]
+                if "id" in jobs_df:
+                    jobs_df = jobs_df.sort_values("id", ignore_index=True)
+                frames[parser] = jobs_df
+    finally:
+        util.set_html_parser(previous_parser)
+
+    reference = frames[parsers[0]]
+    results = []
+    for parser, jobs_df in frames.items():
+        if jobs_df.shape != reference.shape:
+            differing = ["<shape>"]
+        else:
+            differing = [
+                column
+                for column in reference.columns
+                if not reference[column].equals(jobs_df[column])
+            ]
+        results.append(
+            {
+                "site": cassette.search.get("site_name"),
+                "parser": parser,
+                "jobs": len(jobs_df),
+                "differing_columns": ", ".join(differing),
+            }
+        )
+    return pd.DataFrame(results)
+
+
+def _timed(convert, htmls: list[str]) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    results = [convert(html) for html in htmls]
+    return results, 1000 * (time.perf_counter() - start)
+
+
+def compare_markdown(htmls: list[str], processes: int | None = None) -> dict:
+    """
+    Converts htmls by every path of jobspy.markdown and compares them to markdownify
+    :param processes: also times convert_many on a pool of that many processes
+    :return: timings in ms and the number of conversions equal to markdownify's
+    """
+    reference, reference_ms = _timed(lambda html: markdownify(html).strip(), htmls)
+    previous = markdown.set_markdown_cache(markdown.MarkdownCache())
+    try:
+        cached, cold_ms = _timed(markdown.html_to_markdown, htmls)
+        _, warm_ms = _timed(markdown.html_to_markdown, htmls)
+        batch_ms = None
+        if processes:
+            with ProcessPoolExecutor(processes) as executor:
+                start = time.perf_counter()
+                markdown.convert_many(htmls, executor=executor)
+                batch_ms = 1000 * (time.perf_counter() - start)
+    finally:
+        markdown.set_markdown_cache(previous)
+
+    return {
+        "descriptions": len(htmls),
+        "distinct": len(set(htmls)),
+        "markdownify_ms": reference_ms,
+        "cached_cold_ms": cold_ms,
+        "cached_warm_ms": warm_ms,
+        "batch_ms": batch_ms,
+        "cached_equal": sum(a == b for a, b in zip(reference, cached)),
+    }
+
+
+def compare_markdown_fixture(path: str, processes: int | None = None) -> dict:
+    """
+    Runs compare_markdown on the HTML descriptions of a fixture, the HTML scrapers
+    convert (e.g. LinkedIn's prettified description tag), and counts the markdown
+    descriptions of the fixture equal to markdownify's conversion of that HTML, None
+    if the site's descriptions are not converted (Google's are text)
+    """
+    cassette = Cassette(path, mode="replay")
+    with mock.patch.object(time, "sleep", lambda seconds: None):
+        html_df = _replay_once(cassette, description_format="html")["jobs_df"]
+        markdown_df = _replay_once(cassette, description_format="markdown")["jobs_df"]
+    if "description" not in html_df:
+        return {"site": cassette.search.get("site_name"), **compare_markdown([])}
+    htmls = html_df["description"].dropna().tolist()
+    # pages may be scraped concurrently, so the two replays are matched by job id
+    descriptions = dict(zip(markdown_df["id"], markdown_df["description"]))
+    pairs = [
+        (html, descriptions.get(job_id))
+        for job_id, html in zip(html_df["id"], html_df["description"])
+        if isinstance(html, str)
+    ]
+    scraped_equal = None
+    if any(html != scraped for html, scraped in pairs):
+        # the conversion the scrapers made before jobspy.markdown
+        scraped_equal = sum(
+            markdownify(html).strip() == scraped for html, scraped in pairs
+        )
+    return {
+        "site": cassette.search.get("site_name"),
+        **compare_markdown(htmls, processes),
+        "scraped_equal": scraped_equal,
+    }
+
+
+def _separate_passes(text: str) -> tuple:
+    """
+    Emails, job types, remote flag and first salary range found the way the helpers
+    did before jobspy.analyzer: one regex pass (or lowercased scan) each
+    """
+    emails = re.compile(analyzer.email_pattern).findall(text)
+    keywords = {
+        JobType.FULL_TIME: r"full\s?time",
+        JobType.PART_TIME: r"part\s?time",
+        JobType.INTERNSHIP: r"internship",
+        JobType.CONTRACT: r"contract",
+    }
+    job_types = [
+        job_type
+        for job_type, pattern in keywords.items()
+        if re.search(pattern, text, re.IGNORECASE)
+    ]
+    is_remote = any(keyword in text.lower() for keyword in analyzer.remote_keywords)
+    salary = re.search(analyzer.salary_pattern, text)
+    return emails, job_types, is_remote, salary.groups() if salary else None
+
+
+def compare_analyzer(texts: list[str], repeat: int = 3) -> dict:
+    """
+    Times analyze_descriptions against the separate passes and counts the
+    descriptions where both find the same things
+    :return: best timings in ms and the number of equal results
+    """
+    texts = [text for text in texts if text]
+
+    def best(run) -> tuple[list, float]:
+        timings = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            results = run()
+            timings.append(1000 * (time.perf_counter() - start))
+        return results, min(timings)
+
+    reference, separate_ms = best(lambda: [_separate_passes(t) for t in texts])
+    analyses, single_ms = best(
+        lambda: [analyzer.analyze_description(text) for text in texts]
+    )
+    _, batch_ms = best(lambda: analyzer.analyze_descriptions(texts))
+    equal = sum(
+        (a.emails, a.job_types, a.is_remote, a.salaries[0] if a.salaries else None)
+        == expected
+        for a, expected in zip(analyses, reference)
+    )
+    return {
+        "descriptions": len(texts),
+        "separate_ms": separate_ms,
+        "analyzer_ms": single_ms,
+        "batch_ms": batch_ms,
+        "equal": equal,
+    }
+
+
+def compare_analyzer_fixture(path: str, repeat: int = 3) -> dict:
+    """
+    Runs compare_analyzer on the markdown descriptions of a fixture
+    """
+    cassette = Cassette(path, mode="replay")
+    with mock.patch.object(time, "sleep", lambda seconds: None):
+        jobs_df = _replay_once(cassette, description_format="markdown")["jobs_df"]
+    texts = jobs_df["description"].dropna().tolist() if "description" in jobs_df else []
+    return {"site": cassette.search.get("site_name"), **compare_analyzer(texts, repeat)}
+
+
+def salary_descriptions(rows: int, seed: int = 0) -> list[str | None]:
+    """
+    Descriptions mentioning hourly, monthly and yearly salary ranges in the formats
+    the salary pattern accepts, along with some without a salary
+    """
+    rng = random.Random(seed)
+    filler = "Join our team to build reliable services for our customers. " * 8
+
+    def amount(low: int, high: int) -> str:
+        value = rng.randint(low, high)
+        text = f"{value:,}" if rng.random() < 0.5 else str(value)
+        return text + (f".{rng.randint(0, 99):02d}" if rng.random() < 0.2 else "")
+
+    descriptions = []
+    for _ in range(rows):
+        kind = rng.random()
+        if kind < 0.1:
+            descriptions.append(None)
+            continue
+        if kind < 0.3:
+            salary = "Competitive pay."
+        elif kind < 0.5:
+            salary = f"${amount(15, 90)} - ${amount(20, 120)} per hour"
+        elif kind < 0.6:
+            salary = f"${amount(3000, 9000)}–{amount(4000, 12000)} a month"
+        elif kind < 0.8:
+            salary = f"${rng.randint(40, 250)}k-${rng.randint(60, 400)}K"
+        else:
+            salary = f"Salary: ${amount(40000, 250000)} — ${amount(50000, 400000)}"
+        descriptions.append(filler + salary + " " + filler)
+    return descriptions
+
+
+def compare_salaries(
+    rows: int = 100000, enforce_annual_salary: bool = False, seed: int = 0
+) -> dict:
+    """
+    Times extract_salaries against extract_salary row by row
+    :return: timings in ms, including the regex scan alone, and the number of rows
+        with equal results
+    """
+    descriptions = salary_descriptions(rows, seed)
+
+    # the regex scan both paths have to make
+    start = time.perf_counter()
+    for description in descriptions:
+        if description:
+            analyzer.salary_regex.search(description)
+    search_ms = 1000 * (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    reference = [
+        util.extract_salary(description, enforce_annual_salary=enforce_annual_salary)
+        for description in descriptions
+    ]
+    scalar_ms = 1000 * (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    salaries = extract_salaries(
+        pd.Series(descriptions, dtype=object),
+        enforce_annual_salary=enforce_annual_salary,
+    )
+    vectorized_ms = 1000 * (time.perf_counter() - start)
+
+    missing = lambda value: value is None or value != value
+    same = lambda a, b: a == b or (missing(a) and missing(b))
+    equal = sum(
+        all(same(a, b) for a, b in zip(expected, result))
+        for expected, result in zip(
+            reference, salaries.itertuples(index=False, name=None)
+        )
+    )
+    return {
+        "rows": rows,
+        "salaries": int(salaries["min_amount"].notna().sum()),
+        "search_ms": search_ms,
+        "scalar_ms": scalar_ms,
+        "vectorized_ms": vectorized_ms,
+        "equal": equal,
+    }
+
+
+def generated_jobs(rows: int, seed: int = 0) -> dict[str, JobResponse]:
+    """
+    Jobs spread over the sites, with descriptions of a few kB drawn from a set of
+    sentences, a few thousand companies and a few hundred cities
+    """
+    rng = random.Random(seed)
+    words = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10)))
+        for _ in range(2000)
+    ]
+    sentences = [
+        " ".join(rng.choices(words, k=rng.randint(8, 20))).capitalize() + "."
+        for _ in range(3000)
+    ]
+    companies = [" ".join(rng.choices(words, k=2)).title() for _ in range(3000)]
+    cities = [rng.choice(words).title() for _ in range(300)]
+    titles = [" ".join(rng.choices(words, k=3)).title() for _ in range(500)]
+    sites = [site.value for site in Site]
+    site_to_jobs = {site: JobResponse() for site in sites}
+    for i in range(rows):
+        site = sites[i % len(sites)]
+        compensation = None
+        if rng.random() < 0.4:
+            low = rng.randint(40, 150) * 1000
+            compensation = Compensation.build(
+                interval=rng.choice(list(CompensationInterval)),
+                min_amount=low,
+                max_amount=low + rng.randint(5, 60) * 1000,
+                currency="USD",
+            )
+        site_to_jobs[site].jobs.append(
+            JobPost.build(
+                id=f"{site[:2]}-{i}",
+                title=rng.choice(titles),
+                company_name=rng.choice(companies),
+                job_url=f"https://www.example.com/{site}/jobs/{i}",
+                location=Location.build(
+                    city=rng.choice(cities), state="TX", country=Country.USA
+                ),
+                description=" ".join(rng.choices(sentences, k=rng.randint(15, 40))),
+                company_url=f"https://www.example.com/company/{i % 3000}",
+                job_type=[rng.choice(list(JobType))],
+                compensation=compensation,
+                date_posted=date(2024, 1, 1) + timedelta(days=rng.randint(0, 60)),
+                is_remote=rng.random() < 0.2,
+                listing_type=rng.choice(["organic", "sponsored", None]),
+                job_level=rng.choice(["entry level", "mid-senior level", None]),
+                company_industry=rng.choice(words).title(),
+                company_num_employees=rng.choice(["1-10", "11-50", "10,000+", None]),
+                company_description=(
+                    rng.choice(sentences) if rng.random() < 0.3 else None
+                ),
+            )
+        )
+    return site_to_jobs
+
+
+def _concat_rows(site_to_jobs: dict[str, JobResponse]) -> pd.DataFrame:
+    # the assembly jobs_to_dataframe replaced: one DataFrame per job, concatenated
+    jobs_dfs = [
+        pd.DataFrame([job_to_row(site, job)]).dropna(axis=1, how="all")
+        for site, job_response in site_to_jobs.items()
+        for job in job_response.jobs
+    ]
+    jobs_df = pd.concat(jobs_dfs, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    return jobs_df[desired_order]
+
+
+def _assembly(assemble, site_to_jobs: dict[str, JobResponse]) -> tuple[float, int]:
+    # timed untraced, tracemalloc slows the assembly down several times
+    start = time.perf_counter()
+    assemble(site_to_jobs)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        assemble(site_to_jobs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak_memory
+
+
+def time_assembly(
+    rows: list[int], concat_rows: int = 1000, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Assembly time and peak memory (traced by tracemalloc) of the result frame for
+    generated jobs
+    :param rows: job counts, e.g. [1000, 10000, 100000]
+    :param concat_rows: largest count also assembled one DataFrame per job as
+        before, which takes minutes from 10k
+    :return: DataFrame of one row per job count
+    """
+    results = []
+    for count in rows:
+        site_to_jobs = generated_jobs(count, seed)
+        elapsed, peak_memory = _assembly(jobs_to_dataframe, site_to_jobs)
+        result = {
+            "rows": count,
+            "columnar_s": elapsed,
+            "columnar_peak_mb": peak_memory / 2**20,
+            "concat_s": None,
+            "concat_peak_mb": None,
+        }
+        if count <= concat_rows:
+            elapsed, peak_memory = _assembly(_concat_rows, site_to_jobs)
+            result["concat_s"] = elapsed
+            result["concat_peak_mb"] = peak_memory / 2**20
+        results.append(result)
+    return pd.DataFrame(results)
+
+
+def compare_memory(rows: int = 50000, seed: int = 0) -> pd.DataFrame:
+    """
+    Memory of a generated result frame per column, with the default and the compact
+    dtypes
+    :return: DataFrame of the columns and their total, in MB
+    """
+    jobs_df = jobs_to_dataframe(generated_jobs(rows, seed))
+    start = time.perf_counter()
+    compact_df = compact_frame(jobs_df)
+    compact_ms = 1000 * (time.perf_counter() - start)
+    report = pd.DataFrame(
+        {
+            "dtype": jobs_df.dtypes.astype(str),
+            "compact_dtype": compact_df.dtypes.map(
+                lambda dtype: (
+                    f"string[{dtype.storage}]"
+                    if isinstance(dtype, pd.StringDtype)
+                    else str(dtype)
+                )
+            ),
+            "mb": jobs_df.memory_usage(deep=True, index=False) / 2**20,
+            "compact_mb": compact_df.memory_usage(deep=True, index=False) / 2**20,
+        }
+    )
+    report.loc["total"] = ["", "", report["mb"].sum(), report["compact_mb"].sum()]
+    report["saved"] = 1 - report["compact_mb"] / report["mb"]
+    report.attrs["compact_ms"] = compact_ms
+    return report
+
+
+# timed by the imports command, each in a fresh interpreter
+import_statements = {
+    "package": "import jobspy",
+    "models": "from jobspy import Site",
+    "scrape_jobs": "from jobspy import scrape_jobs",
+    "indeed": "from jobspy import SCRAPER_MAPPING, Site; SCRAPER_MAPPING[Site.INDEED]",
+    "all scrapers": "from jobspy import SCRAPER_MAPPING; list(SCRAPER_MAPPING.values())",
+}
+heavy_modules = (
+    "pandas",
+    "numpy",
+    "pyarrow",
+    "pydantic",
+    "requests",
+    "tls_client",
+    "bs4",
+    "markdownify",
+    "regex",
+)
+_import_script = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+loaded = [name for name in sys.argv[2:] if name in sys.modules]
+print(json.dumps({"ms": 1000 * elapsed, "loaded": loaded}))
+"""
+
+
+def time_imports(
+    statements: dict[str, str] | None = None, repeat: int = 5
+) -> pd.DataFrame:
+    """
+    Cold import times of the package, each statement run repeat times in a new
+    interpreter
+    :param statements: by name, import_statements if None
+    :return: DataFrame of the fastest run of each statement and the heavy modules it
+        loaded
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+    results = []
+    for name, statement in (statements or import_statements).items():
+        runs = [
+            json.loads(
+                subprocess.run(
+                    [sys.executable, "-c", _import_script, statement, *heavy_modules],
+                    capture_output=True,
+                    check=True,
+                    env=env,
+                    text=True,
+                ).stdout
+            )
+            for _ in range(repeat)
+        ]
+        fastest = min(runs, key=lambda run: run["ms"])
+        results.append(
+            {
+                "import": name,
+                "ms": fastest["ms"],
+                "loaded": ", ".join(fastest["loaded"]),
+            }
+        )
+    return pd.DataFrame(results)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m jobspy.benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="record fixtures from live sites")
+    record.add_argument("directory")
+    record.add_argument("--site", action="append", dest="sites")
+    record.add_argument("--search-term", default="software engineer")
+    record.add_argument("--location", default="Dallas, TX")
+    record.add_argument("--results-wanted", type=int, default=50)
+    record.add_argument("--country-indeed", default="usa")
+    record.add_argument("--hours-old", type=int)
+
+    run = commands.add_parser("run", help="benchmark the recorded fixtures")
+    run.add_argument("directory")
+    run.add_argument("--repeat", type=int, default=3)
+
+    parity = commands.add_parser(
+        "parity", help="check that html parsers yield the same jobs"
+    )
+    parity.add_argument("directory")
+    parity.add_argument("--parser", action="append", dest="parsers")
+    parity.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with status 1 if the parsers yield different jobs",
+    )
+
+    markdown_parser = commands.add_parser(
+        "markdown", help="time and check the markdown conversion of descriptions"
+    )
+    markdown_parser.add_argument("directory")
+    markdown_parser.add_argument("--processes", type=int)
+
+    analyzer_parser = commands.add_parser(
+        "analyzer", help="compare the description analyzer to separate passes"
+    )
+    analyzer_parser.add_argument("directory")
+    analyzer_parser.add_argument("--repeat", type=int, default=3)
+
+    salaries_parser = commands.add_parser(
+        "salaries", help="compare vectorized and row by row salary extraction"
+    )
+    salaries_parser.add_argument("--rows", type=int, default=100000)
+    salaries_parser.add_argument("--enforce-annual-salary", action="store_true")
+
+    memory_parser = commands.add_parser(
+        "memory", help="memory of the result frame with and without compact dtypes"
+    )
+    memory_parser.add_argument("--rows", type=int, default=50000)
+
+    frame_parser = commands.add_parser(
+        "frame", help="assembly time and peak memory of the result frame"
+    )
+    frame_parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    frame_parser.add_argument("--concat-rows", type=int, default=1000)
+
+    imports_parser = commands.add_parser(
+        "imports", help="cold import times of the package"
+    )
+    imports_parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        search = {
+            "search_term": args.search_term,
+            "google_search_term": f"{args.search_term} jobs near {args.location}",
+            "location": args.location,
+            "results_wanted": args.results_wanted,
+            "country_indeed": args.country_indeed,
+            "hours_old": args.hours_old,
+        }
+        for path in record_fixtures(args.directory, args.sites, **search):
+            print(path)
+    elif args.command == "parity":
+        results = [
+            compare_parsers(fixture_path(args.directory, site), args.parsers)
+            for site in Site
+            if os.path.exists(fixture_path(args.directory, site))
+        ]
+        report = pd.concat(results, ignore_index=True) if results else None
+        if report is not None:
+            print(report.to_string())
+        if args.check:
+            if report is None:
+                parser.exit(1, f"no fixtures found in {args.directory}\n")
+            differing = report[report["differing_columns"] != ""]
+            if len(differing):
+                parser.exit(1, f"parsers differ on: {', '.join(differing['site'])}\n")
+    elif args.command == "markdown":
+        results = [
+            compare_markdown_fixture(fixture_path(args.directory, site), args.processes)
+            for site in Site
+            if os.path.exists(fixture_path(args.directory, site))
+        ]
+        results_df = pd.DataFrame(results)
+        if "scraped_equal" in results_df:
+            results_df["scraped_equal"] = results_df["scraped_equal"].astype("Int64")
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(results_df.to_string())
+    elif args.command == "analyzer":
+        results = [
+            compare_analyzer_fixture(fixture_path(args.directory, site), args.repeat)
+            for site in Site
+            if os.path.exists(fixture_path(args.directory, site))
+        ]
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(pd.DataFrame(results).to_string())
+    elif args.command == "salaries":
+        results = [
+            compare_salaries(args.rows, args.enforce_annual_salary),
+        ]
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(pd.DataFrame(results).to_string())
+    elif args.command == "memory":
+        report = compare_memory(args.rows)
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(report.to_string())
+        print(f"compact_frame: {report.attrs['compact_ms']:.0f}ms")
+    elif args.command == "frame":
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(time_assembly(args.rows, args.concat_rows).to_string())
+    elif args.command == "imports":
+        with pd.option_context("display.float_format", "{:.1f}".format):
+            print(time_imports(repeat=args.repeat).to_string())
+    else:
+        with pd.option_context("display.float_format", "{:.2f}".format):
+            print(run_benchmarks(args.directory, repeat=args.repeat).to_string())
+
+
+if __name__ == "__main__":
+    main()
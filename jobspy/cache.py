@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from jobspy.model import JobResponse, ScraperInput, Site
+from jobspy.util import create_logger
+
+log = create_logger("Cache")
+
+default_cache_path = os.path.join("~", ".cache", "jobspy", "searches.sqlite")
+# fields that change how results are fetched, not the results
+fetch_fields = {"glassdoor_description_batch_size"}
+
+
+def search_key(
+    site: Site, scraper_input: ScraperInput, exclude: set[str] | None = None
+) -> str:
+    """
+    Canonical hash of a search on one site
+    :param site: site being scraped
+    :param scraper_input: search criteria, site_type is ignored
+    :param exclude: other ScraperInput fields to leave out of the key
+    :return: hex digest
+    """
+    fields = scraper_input.model_dump(
+        mode="json", exclude={"site_type", *fetch_fields, *(exclude or ())}
+    )
+    canonical = json.dumps(
+        {"site": site.value, **fields}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Persistent cache of JobResponses keyed by site + search criteria.
+    Entries expire after ttl seconds and the least recently used ones are evicted
+    once the cache holds more than max_entries searches or max_bytes of results.
+    """
+
+    def __init__(
+        self,
+        path: str = default_cache_path,
+        ttl: float = 3600,
+        max_entries: int = 1000,
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "key TEXT PRIMARY KEY, created REAL, accessed REAL, "
+                "size INTEGER, payload BLOB)"
+            )
+
+    def get(self, site: Site, scraper_input: ScraperInput) -> JobResponse | None:
+        key = search_key(site, scraper_input)
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT created, payload FROM searches WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            created, payload = row
+            if now - created > self.ttl:
+                self._conn.execute("DELETE FROM searches WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE searches SET accessed = ? WHERE key = ?", (now, key)
+            )
+        try:
+            job_response = pickle.loads(payload)
+        except Exception as e:
+            log.warning(f"dropping unreadable cache entry: {e}")
+            self.delete(site, scraper_input)
+            return None
+        log.info(f"cache hit for {site.value}")
+        return job_response
+
+    def set(self, site: Site, scraper_input: ScraperInput, job_response: JobResponse):
+        key = search_key(site, scraper_input)
+        payload = pickle.dumps(job_response, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?)",
+                (key, now, now, len(payload), payload),
+            )
+            self._conn.execute(
+                "DELETE FROM searches WHERE created < ?", (now - self.ttl,)
+            )
+            self._conn.execute(
+                "DELETE FROM searches WHERE key IN ("
+                " SELECT key FROM ("
+                "  SELECT key,"
+                "   SUM(size) OVER (ORDER BY accessed DESC) AS total_size,"
+                "   ROW_NUMBER() OVER (ORDER BY accessed DESC) AS position"
+                "  FROM searches"
+                " ) WHERE total_size > ? OR position > ?"
+                ")",
+                (self.max_bytes, self.max_entries),
+            )
+
+    def delete(self, site: Site, scraper_input: ScraperInput):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM searches WHERE key = ?",
+                (search_key(site, scraper_input),),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM searches")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Callable, Iterator, Tuple
+
+import pandas as pd
+
+from jobspy.cache import SearchCache
+from jobspy.incremental import IncrementalState
+from jobspy.metrics import ScrapeMetrics
+from jobspy.model import Site
+from jobspy.proxy import ProxyPool
+from jobspy.scheduler import Scheduler
+from jobspy.scrape import scrape_jobs, scrape_jobs_many
+from jobspy.util import set_logger_level
+
+
+class JobSpyClient:
+    """
+    Long-lived scraping client for service processes. It owns one scheduler: a bounded
+    pool of workers, per-site concurrency limits and the scrapers themselves, which
+    keep their sessions (and keep-alive connections), ZipRecruiter cookies, Glassdoor
+    csrf tokens and location lookups between searches. Proxies are shared as one
+    ProxyPool, so their health carries over too.
+
+        with JobSpyClient(proxies=[...], max_workers=8) as client:
+            jobs = client.scrape_jobs(site_name="indeed", search_term="engineer")
+            more = client.scrape_jobs(site_name="indeed", search_term="designer")
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | ProxyPool | None = None,
+        ca_cert: str | None = None,
+        max_workers: int | None = None,
+        site_concurrency: dict[Site | str, int] | int | None = None,
+        cache: SearchCache | None = None,
+        incremental: IncrementalState | None = None,
+        verbose: int | None = None,
+    ):
+        if proxies and not isinstance(proxies, ProxyPool):
+            proxies = ProxyPool(proxies)
+        self.proxies = proxies
+        self.scheduler = Scheduler(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            max_workers=max_workers,
+            site_concurrency=site_concurrency,
+            cache=cache,
+            incremental=incremental,
+        )
+        self.closed = False
+        set_logger_level(verbose)
+
+    def _check_open(self):
+        if self.closed:
+            raise RuntimeError("JobSpyClient is closed")
+
+    def scrape_jobs(
+        self,
+        on_metrics: Callable[[ScrapeMetrics], None] | None = None,
+        **search,
+    ) -> pd.DataFrame:
+        """
+        Scrapes one search on the client's scrapers
+        :param search: scrape_jobs parameters (site_name, search_term, location, ...)
+        :return: Pandas DataFrame containing job data
+        """
+        self._check_open()
+        search.setdefault("verbose", None)
+        return scrape_jobs(on_metrics=on_metrics, scheduler=self.scheduler, **search)
+
+    def scrape_jobs_many(
+        self,
+        queries: list[dict],
+        stream: bool = False,
+        dedupe: bool = False,
+        compact: bool = False,
+        on_metrics: Callable[[ScrapeMetrics], None] | None = None,
+    ) -> pd.DataFrame | Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Scrapes many searches on the client's scrapers, see jobspy.scrape_jobs_many
+        """
+        self._check_open()
+        return scrape_jobs_many(
+            queries,
+            stream=stream,
+            verbose=None,
+            dedupe=dedupe,
+            compact=compact,
+            on_metrics=on_metrics,
+            scheduler=self.scheduler,
+        )
+
+    def close(self, wait: bool = True):
+        """
+        Stops the workers and closes the scrapers' sessions
+        """
+        if not self.closed:
+            self.closed = True
+            self.scheduler.shutdown(wait=wait)
+
+    def __enter__(self) -> JobSpyClient:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
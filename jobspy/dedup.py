@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import re
+import string
+
+import numpy as np
+import pandas as pd
+
+_shingle_multiplier = np.uint64(1099511628211)
+_empty_slot = np.iinfo(np.uint32).max
+_non_word = re.compile(r"[\W_]+")
+# str.translate is much faster than the regex on long descriptions
+_punctuation = str.maketrans(
+    {
+        char: " "
+        for char in string.punctuation
+        + "\u2022\u2013\u2014\u2018\u2019\u201c\u201d\u2026\u00b7"
+    }
+)
+_company_suffix = re.compile(
+    r"\b(inc|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|lp|llp)\b"
+)
+
+
+def normalize_text(text) -> str:
+    """
+    Lowercases and strips punctuation, markup and extra whitespace
+    """
+    if not isinstance(text, str):
+        return ""
+    return _non_word.sub(" ", text.lower()).strip()
+
+
+def normalize_description(description) -> str:
+    if not isinstance(description, str):
+        return ""
+    return " ".join(description.lower().translate(_punctuation).split())
+
+
+def normalize_company(company) -> str:
+    return " ".join(_company_suffix.sub(" ", normalize_text(company)).split())
+
+
+def normalize_location(location) -> str:
+    # the city is the most consistently formatted part across sites
+    if not isinstance(location, str):
+        return ""
+    return normalize_text(location.split(",")[0])
+
+
+class _DisjointSet:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i: int, j: int):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+class MinHasher:
+    """
+    One permutation MinHash of word shingles: every shingle is hashed once and the
+    signature keeps the smallest hash falling in each of num_perm buckets. The share of
+    equal slots between two signatures estimates the Jaccard similarity of the texts.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        shingle_size: int = 5,
+        seed: int = 1,
+        chunk_size: int = 2000,
+    ):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.chunk_size = chunk_size
+        # multiply-shift hash (a * x + b) over 64-bit words, a odd
+        self.a = np.uint64(rng.integers(0, 2**63, dtype=np.uint64) * 2 + 1)
+        self.b = np.uint64(rng.integers(0, 2**63, dtype=np.uint64))
+
+    def signatures(self, texts: list[str]) -> np.ndarray:
+        """
+        :param texts: normalized, non-empty texts
+        :return: uint32 array of shape (len(texts), num_perm)
+        """
+        result = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        for start in range(0, len(texts), self.chunk_size):
+            chunk = texts[start : start + self.chunk_size]
+            result[start : start + len(chunk)] = self._chunk_signatures(chunk)
+        return result
+
+    def _chunk_signatures(self, texts: list[str]) -> np.ndarray:
+        k = self.shingle_size
+        # every text is padded so no shingle starting inside it reaches the next one
+        padding = [""] * (k - 1)
+        words, valid, counts = [], [], []
+        for text in texts:
+            text_words = text.split()
+            shingle_count = max(len(text_words) - k + 1, 1)
+            words.extend(text_words)
+            words.extend(padding)
+            valid.append(np.arange(len(text_words) + k - 1) < shingle_count)
+            counts.append(shingle_count)
+
+        word_hashes = pd.util.hash_array(np.array(words, dtype=object))
+        shingle_hashes = word_hashes.copy()
+        for offset in range(1, k):
+            shingle_hashes[:-offset] = (
+                shingle_hashes[:-offset] * _shingle_multiplier + word_hashes[offset:]
+            )
+        hashes = shingle_hashes[np.concatenate(valid)] * self.a + self.b
+        slots = (hashes >> np.uint64(16)) % np.uint64(self.num_perm)
+        values = (hashes >> np.uint64(32)).astype(np.uint32)
+        rows = np.repeat(np.arange(len(texts)), counts)
+
+        signatures = np.full((len(texts), self.num_perm), _empty_slot, dtype=np.uint32)
+        np.minimum.at(signatures, (rows, slots.astype(np.intp)), values)
+        # short texts leave slots empty, they borrow the next filled slot of their row
+        for row in np.flatnonzero((signatures == _empty_slot).any(axis=1)):
+            filled = np.flatnonzero(signatures[row] != _empty_slot)
+            source = np.searchsorted(filled, np.arange(self.num_perm)) % len(filled)
+            signatures[row] = signatures[row, filled[source]]
+        return signatures
+
+
+def cluster_duplicates(
+    jobs_df: pd.DataFrame,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> pd.Series:
+    """
+    Clusters postings that are the same job, typically seen on several sites.
+    Rows are joined when their normalized title, non-empty company and city are equal,
+    or when their companies do not differ (one may be missing) and MinHash estimates
+    their descriptions to be at least threshold similar. Descriptions are only
+    compared with the first row of each LSH bucket they fall in, so the work grows
+    roughly linearly with the number of rows, but two similar rows are missed when
+    neither is first in a bucket they share and no other comparison joins them.
+    :param jobs_df: frame with title, company, location and description columns
+    :param threshold: estimated Jaccard similarity of descriptions to join two rows
+    :param num_perm: MinHash signature length, must be divisible by bands
+    :param bands: LSH bands, more bands find less similar candidates
+    :return: cluster id per row (int), equal for duplicates, aligned with jobs_df
+    """
+    size = len(jobs_df)
+    rows_per_band = num_perm // bands
+    titles = [normalize_text(title) for title in jobs_df["title"]]
+    companies = [normalize_company(company) for company in jobs_df["company"]]
+    cities = [normalize_location(location) for location in jobs_df["location"]]
+    clusters = _DisjointSet(size)
+
+    first_with_key: dict[tuple, int] = {}
+    for i, key in enumerate(zip(titles, companies, cities)):
+        # postings without a title or company are too vague to join on these alone
+        if not key[0] or not key[1]:
+            continue
+        first = first_with_key.setdefault(key, i)
+        if first != i:
+            clusters.union(first, i)
+
+    texts = [normalize_description(text) for text in jobs_df["description"]]
+    described = [i for i, text in enumerate(texts) if text]
+    if described:
+        # identical descriptions (reposts, syndicated ads) are hashed once
+        unique_texts, text_index = np.unique(
+            np.array([texts[i] for i in described], dtype=object),
+            return_inverse=True,
+        )
+        hasher = MinHasher(num_perm=num_perm)
+        signatures = hasher.signatures(list(unique_texts))[text_index.ravel()]
+    else:
+        signatures = np.empty((0, num_perm), dtype=np.uint32)
+
+    band_mixer = np.random.default_rng(0).integers(
+        1, 2**63, size=rows_per_band, dtype=np.uint64
+    )
+    for band in range(bands):
+        band_slice = slice(band * rows_per_band, (band + 1) * rows_per_band)
+        buckets = (signatures[:, band_slice].astype(np.uint64) * band_mixer).sum(axis=1)
+        _, first_index, bucket_index = np.unique(
+            buckets, return_index=True, return_inverse=True
+        )
+        firsts = first_index[bucket_index.ravel()]
+        # each row is only compared with the first row of its bucket
+        for position in np.flatnonzero(firsts != np.arange(len(firsts))):
+            first, row = described[firsts[position]], described[position]
+            if clusters.find(first) == clusters.find(row):
+                continue
+            if (
+                companies[first]
+                and companies[row]
+                and companies[first] != companies[row]
+            ):
+                continue
+            similarity = np.mean(signatures[firsts[position]] == signatures[position])
+            if similarity >= threshold:
+                clusters.union(first, row)
+
+    roots = [clusters.find(i) for i in range(size)]
+    return pd.Series(
+        pd.factorize(pd.Series(roots, dtype="int64"))[0],
+        index=jobs_df.index,
+        name="cluster_id",
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from itertools import product
+
+import pandas as pd
+
+from jobspy.client import JobSpyClient
+from jobspy.model import Site
+from jobspy.scrape import _get_site_types, scrape_jobs_many
+
+
+def plan_queries(
+    query: dict,
+    hours_old: list[int] | None = None,
+    job_types: list[str] | None = None,
+    locations: list[str] | None = None,
+    company_ids_per_query: int | None = None,
+) -> list[dict]:
+    """
+    Plans sub-queries of one search, one per combination of the given splits, so that
+    together they find more jobs than the sites' result caps (LinkedIn's 1000,
+    Glassdoor's 900, Naukri's 50 pages) let one query return. results_wanted applies
+    to every sub-query.
+    :param query: scrape_jobs search parameters
+    :param hours_old: posting age limits in hours, e.g. [24, 72, 168]. Sites only filter
+        on "posted within", so these are nested windows, not disjoint age ranges: each
+        one also matches the jobs of the narrower ones and does not split the search
+        past a cap by itself. Ages above the query's hours_old are dropped
+    :param job_types: one sub-query per job type (fulltime, parttime, internship,
+        contract); jobs without a type are only found by the unsplit query. Indeed
+        ignores the job type when hours_old is set, so its sub-queries with an age
+        limit are planned once, without a job type
+    :param locations: one sub-query per location, e.g. nearby cities
+    :param company_ids_per_query: splits the query's linkedin_company_ids into groups
+    :return: sub-queries, the query itself if nothing is split
+    """
+    query = dict(query)
+    splits = []
+    if hours_old:
+        limit = query.get("hours_old")
+        windows = sorted({h for h in hours_old if not limit or h <= limit})
+        splits.append([{"hours_old": hours} for hours in windows])
+    if job_types:
+        splits.append([{"job_type": job_type} for job_type in job_types])
+    if locations:
+        splits.append([{"location": location} for location in locations])
+    company_ids = query.get("linkedin_company_ids")
+    if company_ids_per_query and company_ids:
+        size = max(company_ids_per_query, 1)
+        splits.append(
+            [
+                {"linkedin_company_ids": company_ids[i : i + size]}
+                for i in range(0, len(company_ids), size)
+            ]
+        )
+    splits = [split for split in splits if split]
+    if not splits:
+        return [query]
+    sites = _get_site_types(query.get("site_name"))
+    queries = []
+    for combination in product(*splits):
+        sub_query = dict(query)
+        for changes in combination:
+            sub_query.update(changes)
+        if job_types and sub_query.get("hours_old") and Site.INDEED in sites:
+            # the job type splits would repeat the same Indeed search
+            other_sites = [site.value for site in sites if site != Site.INDEED]
+            if other_sites:
+                queries.append({**sub_query, "site_name": other_sites})
+            sub_query = {**sub_query, "site_name": Site.INDEED.value}
+            sub_query.pop("job_type")
+            if sub_query in queries:
+                continue
+        queries.append(sub_query)
+    return queries
+
+
+def scrape_jobs_fanout(
+    query: dict,
+    hours_old: list[int] | None = None,
+    job_types: list[str] | None = None,
+    locations: list[str] | None = None,
+    company_ids_per_query: int | None = None,
+    client: JobSpyClient | None = None,
+    **options,
+) -> pd.DataFrame:
+    """
+    Scrapes the sub-queries of plan_queries concurrently and merges them, keeping
+    each job id once (from the first sub-query that found it)
+    :param client: runs the sub-queries on a JobSpyClient instead of a new scheduler
+    :param options: scrape_jobs_many parameters (proxies, max_workers,
+        site_concurrency, cache, dedupe, on_metrics, ...)
+    :return: DataFrame of the jobs, whose query_index points into the plan, stored
+        in attrs["queries"]
+    """
+    queries = plan_queries(
+        query,
+        hours_old=hours_old,
+        job_types=job_types,
+        locations=locations,
+        company_ids_per_query=company_ids_per_query,
+    )
+    # the merge needs the job ids, even if the query's fields leave them out
+    fields = query.get("fields")
+    drop_id = bool(fields) and "id" not in fields
+    scraped_queries = (
+        [{**sub_query, "fields": [*fields, "id"]} for sub_query in queries]
+        if drop_id
+        else queries
+    )
+    if client is not None:
+        jobs_df = client.scrape_jobs_many(scraped_queries, **options)
+    else:
+        jobs_df = scrape_jobs_many(scraped_queries, **options)
+    if "id" in jobs_df:
+        jobs_df = jobs_df.drop_duplicates("id", ignore_index=True)
+    if drop_id:
+        jobs_df = jobs_df.drop(columns="id")
+    jobs_df.attrs["queries"] = queries
+    return jobs_df
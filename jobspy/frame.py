@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+from importlib.util import find_spec
+
+import numpy as np
+import pandas as pd
+
+from jobspy.analyzer import salary_regex
+from jobspy.model import (
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobResponse,
+    SalarySource,
+    salary_columns,
+)
+from jobspy.util import convert_to_annual, desired_order, extract_salary
+
+# columns that are not plain python objects in the result frame
+column_dtypes = {
+    "min_amount": "float64",
+    "max_amount": "float64",
+    "company_rating": "float64",
+    "company_reviews_count": "float64",
+    "vacancy_count": "float64",
+}
+# dtypes of the compact result frame, see compact_frame; other job columns are text
+category_columns = (
+    "site",
+    "job_type",
+    "salary_source",
+    "interval",
+    "currency",
+    "listing_type",
+    "job_level",
+    "work_from_home_type",
+)
+nullable_dtypes = {
+    "min_amount": "Float64",
+    "max_amount": "Float64",
+    "is_remote": "boolean",
+    "company_rating": "Float64",
+    "company_reviews_count": "Int64",
+    "vacancy_count": "Int64",
+}
+# wages per year of each interval, as in convert_to_annual
+annual_multipliers = {
+    CompensationInterval.HOURLY.value: 2080,
+    CompensationInterval.DAILY.value: 260,
+    CompensationInterval.WEEKLY.value: 52,
+    CompensationInterval.MONTHLY.value: 12,
+}
+
+
+def job_to_row(
+    site: str,
+    job: JobPost,
+    country: Country | None = None,
+    enforce_annual_salary: bool = False,
+    fields: list[str] | None = None,
+) -> dict:
+    """
+    Flattens a JobPost into a row keyed by the columns of desired_order
+    :param site: site value the job was scraped from
+    :param job: the job post
+    :param country: country of the search, salaries are parsed from USA descriptions
+    :param enforce_annual_salary: converts wages to annual salary
+    :param fields: requested columns, descriptions are only parsed for salary ones
+    :return: dict
+    """
+    row = {
+        "id": job.id,
+        "site": site,
+        "job_url": job.job_url,
+        "job_url_direct": job.job_url_direct,
+        "title": job.title,
+        "company": job.company_name,
+        "location": job.location.display_location() if job.location else None,
+        "date_posted": job.date_posted,
+        "job_type": (
+            ", ".join(job_type.value[0] for job_type in job.job_type)
+            if job.job_type
+            else None
+        ),
+        "salary_source": None,
+        "interval": None,
+        "min_amount": None,
+        "max_amount": None,
+        "currency": None,
+        "is_remote": job.is_remote,
+        "job_level": job.job_level,
+        "job_function": job.job_function,
+        "listing_type": job.listing_type,
+        "emails": ", ".join(job.emails) if job.emails else None,
+        "description": job.description,
+        "company_industry": job.company_industry,
+        "company_url": job.company_url,
+        "company_logo": job.company_logo,
+        "company_url_direct": job.company_url_direct,
+        "company_addresses": job.company_addresses,
+        "company_num_employees": job.company_num_employees,
+        "company_revenue": job.company_revenue,
+        "company_description": job.company_description,
+        # naukri-specific fields
+        "skills": ", ".join(job.skills) if job.skills else None,
+        "experience_range": job.experience_range,
+        "company_rating": job.company_rating,
+        "company_reviews_count": job.company_reviews_count,
+        "vacancy_count": job.vacancy_count,
+        "work_from_home_type": job.work_from_home_type,
+    }
+
+    compensation = job.compensation
+    if compensation:
+        row["interval"] = compensation.interval.value if compensation.interval else None
+        row["min_amount"] = compensation.min_amount
+        row["max_amount"] = compensation.max_amount
+        row["currency"] = compensation.currency
+        row["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            row["interval"]
+            and row["interval"] != "yearly"
+            and row["min_amount"]
+            and row["max_amount"]
+        ):
+            convert_to_annual(row)
+    elif country == Country.USA and (
+        fields is None or any(column in fields for column in salary_columns)
+    ):
+        (
+            row["interval"],
+            row["min_amount"],
+            row["max_amount"],
+            row["currency"],
+        ) = extract_salary(
+            job.description,
+            enforce_annual_salary=enforce_annual_salary,
+        )
+        row["salary_source"] = SalarySource.DESCRIPTION.value
+
+    if not row["min_amount"]:
+        row["salary_source"] = None
+    return row
+
+
+def extract_salaries(
+    descriptions: pd.Series,
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+) -> pd.DataFrame:
+    """
+    extract_salary over a whole column of descriptions, with the same results
+    :return: DataFrame of interval, min_amount, max_amount and currency, indexed like
+        descriptions
+    """
+    # a search loop keeping only the matches beats Series.str.extract, which builds a
+    # row of groups for every description
+    search = salary_regex.search
+    matched, ranges = [], []
+    for position, text in enumerate(descriptions.tolist()):
+        if isinstance(text, str) and (match := search(text)) is not None:
+            matched.append(position)
+            ranges.append(match.groups())
+    matched = np.array(matched, dtype=np.intp)
+    min_amounts, min_suffixes, max_amounts, max_suffixes = (
+        zip(*ranges) if ranges else ((),) * 4
+    )
+
+    def amounts(values: tuple[str, ...]) -> np.ndarray:
+        return np.trunc(
+            np.array([value.replace(",", "") for value in values], dtype=float)
+        )
+
+    # a k suffix on either amount applies to both
+    thousands = np.where(
+        [
+            bool(min_suffix or max_suffix)
+            for min_suffix, max_suffix in zip(min_suffixes, max_suffixes)
+        ],
+        1000,
+        1,
+    )
+    min_salary = amounts(min_amounts) * thousands
+    max_salary = amounts(max_amounts) * thousands
+
+    hourly = min_salary < hourly_threshold
+    monthly = ~hourly & (min_salary < monthly_threshold)
+    yearly = ~hourly & ~monthly
+    annual_min = np.select(
+        [hourly, monthly], [min_salary * 2080, min_salary * 12], min_salary
+    )
+    # no annual max when the max is above the threshold of the min's interval
+    annual_max = np.select(
+        [
+            hourly & (max_salary < hourly_threshold),
+            monthly & (max_salary < monthly_threshold),
+            yearly,
+        ],
+        [max_salary * 2080, max_salary * 12, max_salary],
+        np.nan,
+    )
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (annual_max != 0)
+            & (lower_limit <= annual_min)
+            & (annual_min <= upper_limit)
+            & (lower_limit <= annual_max)
+            & (annual_max <= upper_limit)
+            & (annual_min < annual_max)
+        )
+    if enforce_annual_salary:
+        min_salary, max_salary = annual_min, annual_max
+    found = matched[valid]
+    interval = np.full(len(descriptions), None, dtype=object)
+    interval[found] = np.select(
+        [hourly, monthly],
+        [CompensationInterval.HOURLY.value, CompensationInterval.MONTHLY.value],
+        CompensationInterval.YEARLY.value,
+    )[valid]
+    min_amount = np.full(len(descriptions), np.nan)
+    min_amount[found] = min_salary[valid]
+    max_amount = np.full(len(descriptions), np.nan)
+    max_amount[found] = max_salary[valid]
+    currency = np.full(len(descriptions), None, dtype=object)
+    currency[found] = "USD"
+    return pd.DataFrame(
+        {
+            "interval": interval,
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+            "currency": currency,
+        },
+        index=descriptions.index,
+    )
+
+
+def add_salaries(
+    columns: dict[str, list],
+    from_description: list[bool],
+    enforce_annual_salary: bool = False,
+):
+    """
+    Salary handling of job_to_row for every row at once, on rows built without a
+    country or enforce_annual_salary. Replaces the salary columns with Series.
+    :param from_description: rows whose salary is parsed from the description
+    """
+    interval = pd.Series(columns["interval"], dtype=object)
+    min_amount = pd.Series(columns["min_amount"], dtype="float64")
+    max_amount = pd.Series(columns["max_amount"], dtype="float64")
+    currency = pd.Series(columns["currency"], dtype=object)
+    salary_source = pd.Series(columns["salary_source"], dtype=object)
+
+    if enforce_annual_salary:
+        multiplier = interval.map(annual_multipliers)
+        converted = (
+            interval.notna()
+            & interval.ne(CompensationInterval.YEARLY.value)
+            & min_amount.fillna(0).ne(0)
+            & max_amount.fillna(0).ne(0)
+        )
+        min_amount = min_amount.mask(converted, min_amount * multiplier.fillna(1))
+        max_amount = max_amount.mask(converted, max_amount * multiplier.fillna(1))
+        interval = interval.mask(converted, CompensationInterval.YEARLY.value)
+
+    from_description = np.asarray(from_description, dtype=bool)
+    if from_description.any():
+        descriptions = pd.Series(columns["description"], dtype=object)[from_description]
+        salaries = extract_salaries(
+            descriptions, enforce_annual_salary=enforce_annual_salary
+        )
+        interval[from_description] = salaries["interval"].to_numpy()
+        min_amount[from_description] = salaries["min_amount"].to_numpy()
+        max_amount[from_description] = salaries["max_amount"].to_numpy()
+        currency[from_description] = salaries["currency"].to_numpy()
+        salary_source[from_description] = np.where(
+            salaries["min_amount"].fillna(0).to_numpy() != 0,
+            SalarySource.DESCRIPTION.value,
+            None,
+        )
+
+    columns["interval"] = interval
+    columns["min_amount"] = min_amount
+    columns["max_amount"] = max_amount
+    columns["currency"] = currency
+    columns["salary_source"] = salary_source
+
+
+def rows_to_dataframe(columns: dict[str, list]) -> pd.DataFrame:
+    """
+    Builds the result frame in one step from per-column value lists
+    :param columns: column name -> values (lists or Series), one entry per job
+    :return: DataFrame ordered by desired_order and sorted by site and date posted
+    """
+    if not columns or not len(columns[desired_order[0]]):
+        return pd.DataFrame()
+    jobs_df = pd.DataFrame(
+        {
+            column: pd.Series(
+                columns[column], dtype=column_dtypes.get(column, "object")
+            )
+            for column in desired_order
+        }
+    )
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def jobs_to_dataframe(
+    site_to_jobs: dict[str, JobResponse],
+    country: Country | None = None,
+    enforce_annual_salary: bool = False,
+    fields: list[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Assembles the jobs of every site into a single DataFrame column by column
+    :param site_to_jobs: site value -> JobResponse
+    :param country: country of the search
+    :param enforce_annual_salary: converts wages to annual salary
+    :param fields: requested columns, the others are still present (see select_fields)
+    :return: DataFrame
+    """
+    columns: dict[str, list] = {column: [] for column in desired_order}
+    parse_salaries = country == Country.USA and (
+        fields is None or any(column in fields for column in salary_columns)
+    )
+    from_description = []
+    for site, job_response in site_to_jobs.items():
+        for job in job_response.jobs:
+            # salaries are parsed and annualized by add_salaries
+            row = job_to_row(site, job, fields=fields)
+            for column, values in columns.items():
+                values.append(row[column])
+            from_description.append(parse_salaries and not job.compensation)
+    add_salaries(columns, from_description, enforce_annual_salary)
+    return rows_to_dataframe(columns)
+
+
+def compact_frame(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the job columns to compact dtypes: categories for the low cardinality
+    ones, Arrow backed strings for text (python strings without pyarrow), nullable
+    numbers and datetime64 dates. Columns added to the result frame, such as
+    query_index and cluster_id, are left as they are.
+    """
+    string_dtype = pd.StringDtype("pyarrow" if find_spec("pyarrow") else "python")
+    dtypes = {}
+    for column in jobs_df.columns:
+        if column in category_columns:
+            dtypes[column] = "category"
+        elif column in nullable_dtypes:
+            dtypes[column] = nullable_dtypes[column]
+        elif column in desired_order and column != "date_posted":
+            dtypes[column] = string_dtype
+    jobs_df = jobs_df.astype(dtypes)
+    if "date_posted" in jobs_df:
+        jobs_df["date_posted"] = pd.to_datetime(jobs_df["date_posted"])
+    return jobs_df
+
+
+def select_fields(jobs_df: pd.DataFrame, fields: list[str] | None) -> pd.DataFrame:
+    """
+    Keeps the requested job columns, along with columns added to the result frame
+    such as query_index and cluster_id. Done last, as deduplication needs the title,
+    company and location.
+    :param fields: requested columns, all if None
+    """
+    if fields is None:
+        return jobs_df
+    return jobs_df[
+        [
+            column
+            for column in jobs_df.columns
+            if column in fields or column not in desired_order
+        ]
+    ]
+
+
+def select_row_fields(row: dict, fields: list[str] | None) -> dict:
+    """
+    Row counterpart of select_fields
+    """
+    if fields is None:
+        return row
+    return {column: value for column, value in row.items() if column in fields}
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import contextvars
 import re
 import json
 import requests
-from typing import Tuple
+from typing import Iterator, Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
+    description_query,
     get_cursor_for_page,
     parse_compensation,
+    parse_description,
     parse_location,
 )
 from jobspy.util import (
@@ -22,11 +25,11 @@ from jobspy.util import (
 from jobspy.exception import GlassdoorException
 from jobspy.model import (
     JobPost,
-    JobResponse,
     DescriptionFormat,
     Scraper,
     ScraperInput,
     Site,
+    salary_columns,
 )
 
 log = create_logger("Glassdoor")
@@ -49,31 +52,40 @@ class Glassdoor(Scraper):
         self.jobs_per_page = 30
         self.max_pages = 30
         self.seen_urls = set()
+        # (glassdoor url, location, is_remote) -> location id and type
+        self.locations: dict[tuple, tuple[int | str, str]] = {}
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Glassdoor for jobs with scraper_input criteria.
+        Scrapes Glassdoor for jobs with scraper_input criteria, one page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: iterator of the jobs on each page.
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
-        self.base_url = self.scraper_input.country.get_glassdoor_url()
-
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
-        )
-        token = self._get_csrf_token()
-        headers["gd-csrf-token"] = token if token else fallback_token
-        self.session.headers.update(headers)
+        self.seen_urls = set()
+        base_url = self.scraper_input.country.get_glassdoor_url()
+        if self.session is None or base_url != self.base_url:
+            # the csrf token is tied to the country domain, reuse it between searches
+            self.base_url = base_url
+            self.session = create_session(
+                proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            )
+            token = self._get_csrf_token()
+            headers["gd-csrf-token"] = token if token else fallback_token
+            self.session.headers.update(headers)
 
-        location_id, location_type = self._get_location(
-            scraper_input.location, scraper_input.is_remote
-        )
-        if location_type is None:
-            log.error("Glassdoor: location not parsed")
-            return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
+        location_key = (self.base_url, scraper_input.location, scraper_input.is_remote)
+        if location_key not in self.locations:
+            location_id, location_type = self._get_location(
+                scraper_input.location, scraper_input.is_remote
+            )
+            if location_type is None:
+                log.error("Glassdoor: location not parsed")
+                return
+            self.locations[location_key] = location_id, location_type
+        location_id, location_type = self.locations[location_key]
+        job_count = 0
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
@@ -82,17 +94,21 @@ class Glassdoor(Scraper):
         for page in range(range_start, range_end):
             log.info(f"search page: {page} / {range_end - 1}")
             try:
-                jobs, cursor = self._fetch_jobs_page(
+                jobs, cursor, mostly_known = self._fetch_jobs_page(
                     scraper_input, location_id, location_type, page, cursor
                 )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
-                    break
             except Exception as e:
                 log.error(f"Glassdoor: {str(e)}")
                 break
-        return JobResponse(jobs=job_list)
+            jobs = jobs[: scraper_input.results_wanted - job_count]
+            job_count += len(jobs)
+            if jobs:
+                yield jobs
+            if not jobs or job_count >= scraper_input.results_wanted:
+                break
+            if mostly_known:
+                log.info(f"page {page} is mostly known jobs, stopping")
+                break
 
     def _fetch_jobs_page(
         self,
@@ -101,9 +117,10 @@ class Glassdoor(Scraper):
         location_type: str,
         page_num: int,
         cursor: str | None,
-    ) -> Tuple[list[JobPost], str | None]:
+    ) -> Tuple[list[JobPost], str | None, bool]:
         """
         Scrapes a page of Glassdoor for jobs with scraper_input criteria
+        :return: new jobs found on page, next page cursor, whether the page is mostly known jobs
         """
         jobs = []
         self.scraper_input = scraper_input
@@ -127,13 +144,41 @@ class Glassdoor(Scraper):
             Exception,
         ) as e:
             log.error(f"Glassdoor: {str(e)}")
-            return jobs, None
+            return jobs, None, False
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
+        page_ids = [
+            f'gd-{job_data["jobview"]["job"]["listingId"]}' for job_data in jobs_data
+        ]
+        mostly_known = self.is_mostly_known(page_ids)
+        # known jobs are skipped before their description is fetched
+        jobs_data = [
+            job_data
+            for job_data, job_id in zip(jobs_data, page_ids)
+            if job_id not in self.known_ids
+        ]
 
+        descriptions = {}
+        # salaries missing from the listing are parsed from the description
+        if scraper_input.wants("description", "emails", *salary_columns):
+            descriptions = self._fetch_job_descriptions(
+                [
+                    job_data["jobview"]["job"]["listingId"]
+                    for job_data in jobs_data
+                    if self._job_url(job_data["jobview"]["job"]["listingId"])
+                    not in self.seen_urls
+                ]
+            )
+        # worker threads record into the run's metrics too
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
             future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._process_job,
+                    job,
+                    descriptions,
+                ): job
+                for job in jobs_data
             }
             for future in as_completed(future_to_job_data):
                 try:
@@ -143,9 +188,10 @@ class Glassdoor(Scraper):
                 except Exception as exc:
                     raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
 
-        return jobs, get_cursor_for_page(
+        cursor = get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
         )
+        return jobs, cursor, mostly_known
 
     def _get_csrf_token(self):
         """
@@ -159,12 +205,15 @@ class Glassdoor(Scraper):
             token = matches[0]
         return token
 
-    def _process_job(self, job_data):
+    def _job_url(self, job_id) -> str:
+        return f"{self.base_url}job-listing/j?jl={job_id}"
+
+    def _process_job(self, job_data, descriptions: dict):
         """
-        Processes a single job and fetches its description.
+        Processes a single job with its prefetched description.
         """
         job_id = job_data["jobview"]["job"]["listingId"]
-        job_url = f"{self.base_url}job-listing/j?jl={job_id}"
+        job_url = self._job_url(job_id)
         if job_url in self.seen_urls:
             return None
         self.seen_urls.add(job_url)
@@ -185,10 +234,12 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        description = descriptions.get(job_id)
+        if (
+            description
+            and self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+        ):
+            description = markdown_converter(description)
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -199,7 +250,7 @@ class Glassdoor(Scraper):
             .get("adOrderSponsorshipLevel", "")
             .lower()
         )
-        return JobPost(
+        return JobPost.build(
             id=f"gd-{job_id}",
             title=title,
             company_url=company_url if company_id else None,
@@ -210,48 +261,86 @@ class Glassdoor(Scraper):
             compensation=compensation,
             is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=(
+                extract_emails_from_text(description)
+                if description and self.scraper_input.wants("emails")
+                else None
+            ),
             company_logo=company_logo,
             listing_type=listing_type,
         )
 
+    def _fetch_job_descriptions(self, job_ids: list) -> dict:
+        """
+        Fetches the descriptions of a page's jobs, several JobDetailQuery operations per
+        request (the /graph endpoint takes a list), with the batches sent concurrently.
+        :return: job id -> description html, None where it could not be fetched
+        """
+        batch_size = max(self.scraper_input.glassdoor_description_batch_size, 1)
+        batches = [
+            job_ids[i : i + batch_size] for i in range(0, len(job_ids), batch_size)
+        ]
+        descriptions = {}
+        if not batches:
+            return descriptions
+        with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._fetch_description_batch,
+                    batch,
+                )
+                for batch in batches
+            ]
+            for future in futures:
+                descriptions.update(future.result())
+        return descriptions
+
+    def _fetch_description_batch(self, job_ids: list) -> dict:
+        """
+        Fetches descriptions in one request, falling back to a request per job if the
+        batched one fails
+        """
+        if len(job_ids) > 1:
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/graph",
+                    timeout_seconds=15,
+                    data=json.dumps([description_query(job_id) for job_id in job_ids]),
+                )
+                if response.status_code == 200:
+                    results = response.json()
+                    if isinstance(results, list) and len(results) == len(job_ids):
+                        return {
+                            job_id: parse_description(result)
+                            for job_id, result in zip(job_ids, results)
+                        }
+                log.debug(
+                    f"Glassdoor: batched descriptions failed with status code "
+                    f"{response.status_code}, fetching them one by one"
+                )
+            except Exception as e:
+                log.debug(f"Glassdoor: batched descriptions failed: {str(e)}")
+        descriptions = {}
+        for job_id in job_ids:
+            try:
+                descriptions[job_id] = self._fetch_job_description(job_id)
+            except Exception:
+                descriptions[job_id] = None
+        return descriptions
+
     def _fetch_job_description(self, job_id):
         """
         Fetches the job description for a single job ID.
         """
-        url = f"{self.base_url}/graph"
-        body = [
-            {
-                "operationName": "JobDetailQuery",
-                "variables": {
-                    "jl": job_id,
-                    "queryString": "q",
-                    "pageTypeEnum": "SERP",
-                },
-                "query": """
-                query JobDetailQuery($jl: Long!, $queryString: String, $pageTypeEnum: PageTypeEnum) {
-                    jobview: jobView(
-                        listingId: $jl
-                        contextHolder: {queryString: $queryString, pageTypeEnum: $pageTypeEnum}
-                    ) {
-                        job {
-                            description
-                            __typename
-                        }
-                        __typename
-                    }
-                }
-                """,
-            }
-        ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(
+            f"{self.base_url}/graph",
+            timeout_seconds=15,
+            data=json.dumps([description_query(job_id)]),
+        )
         if res.status_code != 200:
             return None
-        data = res.json()[0]
-        desc = data["data"]["jobview"]["job"]["description"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
-        return desc
+        return parse_description(res.json()[0])
 
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
         if not location or is_remote:
@@ -1,3 +1,4 @@
+from jobspy.glassdoor.constant import description_query_template
 from jobspy.model import Compensation, CompensationInterval, Location, JobType
 
 
@@ -15,7 +16,7 @@ def parse_compensation(data: dict) -> Compensation | None:
         interval = CompensationInterval.get_interval(pay_period)
     min_amount = int(adjusted_pay.get("p10") // 1)
     max_amount = int(adjusted_pay.get("p90") // 1)
-    return Compensation(
+    return Compensation.build(
         interval=interval,
         min_amount=min_amount,
         max_amount=max_amount,
@@ -33,10 +34,35 @@ def parse_location(location_name: str) -> Location | None:
     if not location_name or location_name == "Remote":
         return
     city, _, state = location_name.partition(", ")
-    return Location(city=city, state=state)
+    return Location.build(city=city, state=state)
 
 
 def get_cursor_for_page(pagination_cursors, page_num):
     for cursor_data in pagination_cursors:
         if cursor_data["pageNumber"] == page_num:
             return cursor_data["cursor"]
+
+
+def description_query(job_id) -> dict:
+    """
+    JobDetailQuery operation fetching the description of one job
+    """
+    return {
+        "operationName": "JobDetailQuery",
+        "variables": {
+            "jl": job_id,
+            "queryString": "q",
+            "pageTypeEnum": "SERP",
+        },
+        "query": description_query_template,
+    }
+
+
+def parse_description(result: dict) -> str | None:
+    """
+    Description html from the result of a JobDetailQuery operation, None on errors
+    """
+    try:
+        return result["data"]["jobview"]["job"]["description"]
+    except (KeyError, TypeError):
+        return None
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 import re
 import json
-from typing import Tuple
+from typing import AsyncIterator, Generator, Iterator, Tuple
 from datetime import datetime, timedelta
 
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
@@ -12,15 +12,17 @@ from jobspy.model import (
     ScraperInput,
     Site,
     JobPost,
-    JobResponse,
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
+from jobspy.analyzer import analyze_description
+from jobspy.util import create_async_session, create_session
 from jobspy.google.util import log, find_job_info_initial_page, find_job_info
 
 
 class Google(Scraper):
+    has_async_transport = True
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
     ):
@@ -38,53 +40,123 @@ class Google(Scraper):
         self.url = "https://www.google.com/search"
         self.jobs_url = "https://www.google.com/async/callback:550"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Google for jobs with scraper_input criteria.
+        Scrapes Google for jobs with scraper_input criteria, one page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: iterator of the jobs on each page.
+        """
+        if self.session is None:
+            self.session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+            )
+        pages = self._pages(scraper_input)
+        response = None
+        while True:
+            try:
+                request, page_jobs = pages.send(response)
+            except StopIteration:
+                return
+            if request is None:
+                yield page_jobs
+                continue
+            url, kwargs = request
+            try:
+                response = self.session.get(url, **kwargs)
+            except Exception as e:
+                response = e
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        scrape_pages on an asyncio session
+        """
+        pages = self._pages(scraper_input)
+        response = None
+        async with create_async_session(
+            proxies=self.proxies, ca_cert=self.ca_cert
+        ) as session:
+            while True:
+                try:
+                    request, page_jobs = pages.send(response)
+                except StopIteration:
+                    return
+                if request is None:
+                    yield page_jobs
+                    continue
+                url, kwargs = request
+                try:
+                    response = await session.get(url, **kwargs)
+                except Exception as e:
+                    response = e
+
+    def _pages(
+        self, scraper_input: ScraperInput
+    ) -> Generator[Tuple[tuple | None, list[JobPost]], object, None]:
+        """
+        Pagination without a transport: yields ((url, request kwargs), []) for each
+        page, which is sent the response (or the exception of the request), then
+        (None, jobs of the page) once it is parsed
         """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
+        self.seen_urls = set()
+        window_start = scraper_input.offset
+        window_end = scraper_input.offset + scraper_input.results_wanted
+        position = 0
 
-        self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
-        )
-        forward_cursor, job_list = self._get_initial_cursor_and_jobs()
+        def in_window(jobs: list[JobPost]) -> list[JobPost]:
+            nonlocal position
+            page_jobs = jobs[
+                max(window_start - position, 0) : max(window_end - position, 0)
+            ]
+            position += len(jobs)
+            return page_jobs
+
+        params = {"q": self._initial_query(), "udm": "8"}
+        response = yield (self.url, {"headers": headers_initial, "params": params}), []
+        if isinstance(response, Exception):
+            raise response
+        forward_cursor, jobs = self._parse_initial_page(response.text)
+        if jobs := in_window(jobs):
+            yield None, jobs
         if forward_cursor is None:
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
             )
-            return JobResponse(jobs=job_list)
+            return
 
         page = 1
 
-        while (
-            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
-            and forward_cursor
-        ):
+        while len(self.seen_urls) < window_end and forward_cursor:
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
+            params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
+            response = (
+                yield (self.jobs_url, {"headers": headers_jobs, "params": params}),
+                [],
+            )
             try:
-                jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
+                if isinstance(response, Exception):
+                    raise response
+                jobs, forward_cursor = self._parse_jobs(response.text)
             except Exception as e:
                 log.error(f"failed to get jobs on page: {page}, {e}")
                 break
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            if jobs := in_window(jobs):
+                yield None, jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
-    def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
-        """Gets initial cursor and jobs to paginate through job listings"""
+    def _initial_query(self) -> str:
+        """Builds the search query of the initial page"""
         query = f"{self.scraper_input.search_term} jobs"
 
         def get_time_range(hours_old):
@@ -119,14 +191,14 @@ class Google(Scraper):
 
         if self.scraper_input.google_search_term:
             query = self.scraper_input.google_search_term
+        return query
 
-        params = {"q": query, "udm": "8"}
-        response = self.session.get(self.url, headers=headers_initial, params=params)
-
+    def _parse_initial_page(self, text: str) -> Tuple[str, list[JobPost]]:
+        """Gets initial cursor and jobs to paginate through job listings"""
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, response.text)
+        match_fc = re.search(pattern_fc, text)
         data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_raw = find_job_info_initial_page(response.text)
+        jobs_raw = find_job_info_initial_page(text)
         jobs = []
         for job_raw in jobs_raw:
             job_post = self._parse_job(job_raw)
@@ -134,11 +206,6 @@ class Google(Scraper):
                 jobs.append(job_post)
         return data_async_fc, jobs
 
-    def _get_jobs_next_page(self, forward_cursor: str) -> Tuple[list[JobPost], str]:
-        params = {"fc": [forward_cursor], "fcv": ["3"], "async": [async_param]}
-        response = self.session.get(self.jobs_url, headers=headers_jobs, params=params)
-        return self._parse_jobs(response.text)
-
     def _parse_jobs(self, job_data: str) -> Tuple[list[JobPost], str]:
         """
         Parses jobs on a page with next page cursor
@@ -184,19 +251,25 @@ class Google(Scraper):
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
+        analysis = analyze_description(
+            description if self.scraper_input.wants("emails", "job_type") else None
+        )
+        # only "remote" and "wfh" mark Google jobs remote, not "work from home"
+        text = description.lower() if description else ""
+        is_remote = "remote" in text or "wfh" in text
 
-        job_post = JobPost(
+        job_post = JobPost.build(
             id=f"go-{job_info[28]}",
             title=title,
             company_name=company_name,
-            location=Location(
+            location=Location.build(
                 city=city, state=state, country=country[0] if country else None
             ),
             job_url=job_url,
             date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
+            is_remote=is_remote,
             description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
+            emails=analysis.emails if self.scraper_input.wants("emails") else None,
+            job_type=analysis.job_types or None,
         )
         return job_post
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable
+
+from jobspy.cache import search_key
+from jobspy.model import JobResponse, ScraperInput, Site
+
+default_state_path = os.path.join("~", ".cache", "jobspy", "seen_jobs.sqlite")
+
+# fields that do not change which postings a search matches
+ignored_fields = {"results_wanted", "offset", "description_format", "fields"}
+
+
+class IncrementalState:
+    """
+    Local store of the job ids already collected for each search (site + criteria).
+    Scrapers skip known jobs, including their detail requests, and stop paginating
+    once a page is mostly made of them, so scheduled runs only fetch new postings.
+    Ids not seen again for retention_days are forgotten.
+    """
+
+    def __init__(
+        self, path: str = default_state_path, retention_days: float | None = 90
+    ):
+        self.path = os.path.expanduser(path)
+        self.retention_days = retention_days
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_jobs ("
+                "query TEXT, job_id TEXT, last_seen REAL, "
+                "PRIMARY KEY (query, job_id))"
+            )
+
+    @staticmethod
+    def query_key(site: Site, scraper_input: ScraperInput) -> str:
+        return search_key(site, scraper_input, exclude=ignored_fields)
+
+    def known_ids(self, site: Site, scraper_input: ScraperInput) -> set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM seen_jobs WHERE query = ?",
+                (self.query_key(site, scraper_input),),
+            ).fetchall()
+        return {job_id for (job_id,) in rows}
+
+    def record(self, site: Site, scraper_input: ScraperInput, job_ids: Iterable[str]):
+        query = self.query_key(site, scraper_input)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_jobs VALUES (?, ?, ?)",
+                [(query, job_id, now) for job_id in job_ids if job_id],
+            )
+            if self.retention_days is not None:
+                self._conn.execute(
+                    "DELETE FROM seen_jobs WHERE last_seen < ?",
+                    (now - self.retention_days * 86400,),
+                )
+
+    def filter_new(
+        self, site: Site, scraper_input: ScraperInput, job_response: JobResponse
+    ) -> JobResponse:
+        """
+        Records the jobs of a search result that was not scraped (e.g. a cache hit)
+        :return: the result without the jobs known before
+        """
+        known_ids = self.known_ids(site, scraper_input)
+        self.record(site, scraper_input, [job.id for job in job_response.jobs])
+        return JobResponse(
+            jobs=[job for job in job_response.jobs if job.id not in known_ids]
+        )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM seen_jobs")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
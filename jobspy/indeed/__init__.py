@@ -2,23 +2,25 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Tuple
+from typing import AsyncIterator, Generator, Iterator, Tuple
 
+from jobspy.analyzer import analyze_description
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
+from jobspy.markdown import convert_many
 from jobspy.model import (
     Scraper,
     ScraperInput,
     Site,
     JobPost,
     Location,
-    JobResponse,
     JobType,
     DescriptionFormat,
+    salary_columns,
 )
 from jobspy.util import (
-    extract_emails_from_text,
     markdown_converter,
+    create_async_session,
     create_session,
     create_logger,
 )
@@ -27,6 +29,8 @@ log = create_logger("Indeed")
 
 
 class Indeed(Scraper):
+    has_async_transport = True
+
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
     ):
@@ -47,47 +51,88 @@ class Indeed(Scraper):
         self.base_url = None
         self.api_url = "https://apis.indeed.com/graphql"
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Indeed for jobs with scraper_input criteria
+        Scrapes Indeed for jobs with scraper_input criteria, one search page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
+        """
+        pages = self._pages(scraper_input)
+        response = None
+        while True:
+            try:
+                request, page_jobs = pages.send(response)
+            except StopIteration:
+                return
+            if request is not None:
+                response = self.session.post(self.api_url, verify=False, **request)
+            elif page_jobs:
+                yield page_jobs
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        scrape_pages on an asyncio session
+        """
+        pages = self._pages(scraper_input)
+        response = None
+        async with create_async_session(proxies=self.proxies, verify=False) as session:
+            while True:
+                try:
+                    request, page_jobs = pages.send(response)
+                except StopIteration:
+                    return
+                if request is not None:
+                    response = await session.post(self.api_url, **request)
+                elif page_jobs:
+                    yield page_jobs
+
+    def _pages(
+        self, scraper_input: ScraperInput
+    ) -> Generator[Tuple[dict | None, list[JobPost]], object, None]:
+        """
+        Pagination without a transport: yields (request, []) for each search page,
+        which is sent the response, then (None, jobs of the page) once it is parsed
         """
         self.scraper_input = scraper_input
+        self.seen_urls = set()
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
+        window_start = scraper_input.offset
+        window_end = scraper_input.offset + scraper_input.results_wanted
+        position = 0
         page = 1
 
         cursor = None
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while len(self.seen_urls) < window_end:
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
-            jobs, cursor = self._scrape_page(cursor)
+            response = yield self._page_request(cursor), []
+            jobs, cursor, mostly_known = self._parse_page(response)
             if not jobs:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
-            page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
+            page_jobs = jobs[
+                max(window_start - position, 0) : max(window_end - position, 0)
             ]
-        )
+            position += len(jobs)
+            yield None, page_jobs
+            if mostly_known:
+                log.info(f"page {page} is mostly known jobs, stopping")
+                break
+            page += 1
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _page_request(self, cursor: str | None) -> dict:
         """
-        Scrapes a page of Indeed for jobs with scraper_input criteria
+        Request of a page of Indeed jobs with scraper_input criteria
         :param cursor:
-        :return: jobs found on page, next page cursor
+        :return: keyword arguments of the api_url POST
         """
-        jobs = []
-        new_cursor = None
         filters = self._build_filters()
         search_term = (
             self.scraper_input.search_term.replace('"', '\\"')
@@ -110,29 +155,42 @@ class Indeed(Scraper):
         }
         api_headers_temp = api_headers.copy()
         api_headers_temp["indeed-co"] = self.api_country_code
-        response = self.session.post(
-            self.api_url,
-            headers=api_headers_temp,
-            json=payload,
-            timeout=10,
-            verify=False,
-        )
+        return {"headers": api_headers_temp, "json": payload, "timeout": 10}
+
+    def _parse_page(self, response) -> Tuple[list[JobPost], str | None, bool]:
+        """
+        Parses a page of Indeed jobs
+        :param response: of the _page_request
+        :return: new jobs found on page, next page cursor, whether the page is mostly known jobs
+        """
+        jobs = []
+        new_cursor = None
         if not response.ok:
             log.info(
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
-            return jobs, new_cursor
+            return jobs, new_cursor, False
         data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
 
+        mostly_known = self.is_mostly_known(
+            [f'in-{job["job"]["key"]}' for job in jobs]
+        )
+
+        jobs = [
+            job["job"]
+            for job in jobs
+            if f'in-{job["job"]["key"]}' not in self.known_ids
+        ]
+        descriptions = self._convert_descriptions(jobs)
         job_list = []
         for job in jobs:
-            processed_job = self._process_job(job["job"])
+            processed_job = self._process_job(job, descriptions)
             if processed_job:
                 job_list.append(processed_job)
 
-        return job_list, new_cursor
+        return job_list, new_cursor, mostly_known
 
     def _build_filters(self):
         """
@@ -192,27 +250,51 @@ class Indeed(Scraper):
                 """
         return filters_str
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _convert_descriptions(self, jobs: list[dict]) -> dict:
+        """
+        Converts the descriptions of a page to markdown as one batch
+        :return: job key -> markdown description
+        """
+        if not (
+            self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+            and self.scraper_input.wants(
+                "description", "emails", "is_remote", *salary_columns
+            )
+        ):
+            return {}
+        markdown = convert_many([job["description"]["html"] for job in jobs])
+        return {job["key"]: description for job, description in zip(jobs, markdown)}
+
+    def _process_job(self, job: dict, descriptions: dict) -> JobPost | None:
         """
         Parses the job dict into JobPost model
         :param job: dict to parse
+        :param descriptions: markdown descriptions of the page, by job key
         :return: JobPost if it's a new job
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
         if job_url in self.seen_urls:
             return
         self.seen_urls.add(job_url)
-        description = job["description"]["html"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+        description = None
+        # remote and salary detection read the description too
+        if self.scraper_input.wants(
+            "description", "emails", "is_remote", *salary_columns
+        ):
+            description = job["description"]["html"]
+            if job["key"] in descriptions:
+                description = descriptions[job["key"]]
+            elif self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+                description = markdown_converter(description)
 
+        analysis = analyze_description(description)
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
         date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
         employer = job["employer"].get("dossier") if job["employer"] else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
         rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
+        return JobPost.build(
             id=f'in-{job["key"]}',
             title=job["title"],
             description=description,
@@ -221,7 +303,7 @@ class Indeed(Scraper):
             company_url_direct=(
                 employer["links"]["corporateWebsite"] if employer else None
             ),
-            location=Location(
+            location=Location.build(
                 city=job.get("location", {}).get("city"),
                 state=job.get("location", {}).get("admin1Code"),
                 country=job.get("location", {}).get("countryCode"),
@@ -233,8 +315,8 @@ class Indeed(Scraper):
             job_url_direct=(
                 job["recruit"].get("viewJobUrl") if job.get("recruit") else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
-            is_remote=is_job_remote(job, description),
+            emails=analysis.emails if self.scraper_input.wants("emails") else None,
+            is_remote=is_job_remote(job, analysis.is_remote),
             company_addresses=(
                 employer_details["addresses"][0]
                 if employer_details.get("addresses")
@@ -1,3 +1,4 @@
+from jobspy.analyzer import mentions_remote
 from jobspy.model import CompensationInterval, JobType, Compensation
 from jobspy.util import get_enum_from_job_type
 
@@ -37,7 +38,7 @@ def get_compensation(compensation: dict) -> Compensation | None:
         return None
     min_range = comp["range"].get("min")
     max_range = comp["range"].get("max")
-    return Compensation(
+    return Compensation.build(
         interval=interval,
         min_amount=int(min_range) if min_range is not None else None,
         max_amount=int(max_range) if max_range is not None else None,
@@ -49,23 +50,16 @@ def get_compensation(compensation: dict) -> Compensation | None:
     )
 
 
-def is_job_remote(job: dict, description: str) -> bool:
+def is_job_remote(job: dict, description_is_remote: bool) -> bool:
     """
-    Searches the description, location, and attributes to check if job is remote
+    Searches the location and attributes to check if job is remote
+    :param description_is_remote: DescriptionAnalysis.is_remote of the description
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
     is_remote_in_attributes = any(
-        any(keyword in attr["label"].lower() for keyword in remote_keywords)
-        for attr in job["attributes"]
+        mentions_remote(attr["label"]) for attr in job["attributes"]
     )
-    is_remote_in_description = any(
-        keyword in description.lower() for keyword in remote_keywords
-    )
-    is_remote_in_location = any(
-        keyword in job["location"]["formatted"]["long"].lower()
-        for keyword in remote_keywords
-    )
-    return is_remote_in_attributes or is_remote_in_description or is_remote_in_location
+    is_remote_in_location = mentions_remote(job["location"]["formatted"]["long"])
+    return is_remote_in_attributes or description_is_remote or is_remote_in_location
 
 
 def get_compensation_interval(interval: str) -> CompensationInterval:
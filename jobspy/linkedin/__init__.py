@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import math
-import random
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Generator, Iterator, Optional, Tuple
 from urllib.parse import urlparse, urlunparse, unquote
 
 import regex as re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
 from jobspy.exception import LinkedInException
@@ -20,34 +21,50 @@ from jobspy.linkedin.util import (
     parse_job_level,
     parse_company_industry
 )
+from jobspy.analyzer import analyze_description
 from jobspy.model import (
     JobPost,
     Location,
-    JobResponse,
     Country,
     Compensation,
     DescriptionFormat,
     Scraper,
     ScraperInput,
     Site,
+    salary_columns,
 )
 from jobspy.util import (
-    extract_emails_from_text,
     currency_parser,
     markdown_converter,
+    create_async_session,
     create_session,
     remove_attributes,
     create_logger,
+    make_soup,
 )
 
 log = create_logger("LinkedIn")
 
 
 class LinkedIn(Scraper):
+    has_async_transport = True
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
+    # only the job cards of a search page are parsed
+    card_strainer = SoupStrainer("div", class_="base-search-card")
+    # result columns that need the job's detail page
+    detail_columns = (
+        "description",
+        "job_level",
+        "company_industry",
+        "job_type",
+        "job_url_direct",
+        "company_logo",
+        "job_function",
+        "emails",
+        "is_remote",
+        *salary_columns,
+    )
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
@@ -68,109 +85,273 @@ class LinkedIn(Scraper):
         self.scraper_input = None
         self.country = "worldwide"
         self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+        # job detail pages fetched at the same time with linkedin_fetch_description
+        self.detail_workers = 5
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes LinkedIn for jobs with scraper_input criteria
+        Scrapes LinkedIn for jobs with scraper_input criteria, one search page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
+        """
+        pages = self._pages(scraper_input)
+        executor = None
+        result = None
+
+        def get(url: str, kwargs: dict):
+            try:
+                return self.session.get(url, **kwargs)
+            except Exception as e:
+                return e
+
+        try:
+            while True:
+                try:
+                    op, arg = pages.send(result)
+                except StopIteration:
+                    return
+                result = None
+                if op == "get":
+                    result = get(*arg)
+                elif op == "start":
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=self.detail_workers)
+                    # worker threads record into the run's metrics too
+                    result = [
+                        executor.submit(contextvars.copy_context().run, get, *request)
+                        for request in arg
+                    ]
+                elif op == "wait":
+                    result = [future.result() for future in arg]
+                else:
+                    yield arg
+        finally:
+            pages.close()
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        scrape_pages on an asyncio session, detail_workers detail pages at a time
+        """
+        pages = self._pages(scraper_input)
+        tasks: list[asyncio.Task] = []
+        result = None
+        async with create_async_session(
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            headers=headers,
+            clear_cookies=True,
+        ) as session:
+            workers = asyncio.Semaphore(self.detail_workers)
+
+            async def get(url: str, kwargs: dict):
+                try:
+                    return await session.get(url, **kwargs)
+                except Exception as e:
+                    return e
+
+            async def get_detail(url: str, kwargs: dict):
+                async with workers:
+                    return await get(url, kwargs)
+
+            try:
+                while True:
+                    try:
+                        op, arg = pages.send(result)
+                    except StopIteration:
+                        return
+                    result = None
+                    if op == "get":
+                        result = await get(*arg)
+                    elif op == "start":
+                        result = [
+                            asyncio.ensure_future(get_detail(*request))
+                            for request in arg
+                        ]
+                        tasks.extend(result)
+                    elif op == "wait":
+                        result = await asyncio.gather(*arg)
+                    else:
+                        yield arg
+            finally:
+                pages.close()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _pages(
+        self, scraper_input: ScraperInput
+    ) -> Generator[Tuple[str, object], object, None]:
+        """
+        Pagination without a transport, as operations that are sent their result:
+        ("get", request) the response (or the exception of the request), ("start",
+        requests) a handle on the detail pages it starts fetching, ("wait", handle)
+        their responses, and ("jobs", jobs of a page) nothing.
+        Requests are (url, request kwargs).
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = known_count = 0
         seen_ids = set()
         start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
         request_count = 0
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+        fetch_desc = scraper_input.linkedin_fetch_description and scraper_input.wants(
+            *self.detail_columns
+        )
+        # detail pages of a search page are fetched while the next search page loads
+        pending: list[tuple[Tag, str]] = []
+        details = None
+        # jobs collected so far plus those whose detail page is being fetched
+        continue_search = lambda: (
+            job_count + len(pending) < scraper_input.results_wanted and start < 1000
         )
         while continue_search():
             request_count += 1
             log.info(
                 f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
             )
-            params = {
-                "keywords": scraper_input.search_term,
-                "location": scraper_input.location,
-                "distance": scraper_input.distance,
-                "f_WT": 2 if scraper_input.is_remote else None,
-                "f_JT": (
-                    job_type_code(scraper_input.job_type)
-                    if scraper_input.job_type
-                    else None
-                ),
-                "pageNum": 0,
-                "start": start,
-                "f_AL": "true" if scraper_input.easy_apply else None,
-                "f_C": (
-                    ",".join(map(str, scraper_input.linkedin_company_ids))
-                    if scraper_input.linkedin_company_ids
-                    else None
-                ),
-            }
-            if seconds_old is not None:
-                params["f_TPR"] = f"r{seconds_old}"
-
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                response = self.session.get(
-                    f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?",
-                    params=params,
-                    timeout=10,
-                )
-                if response.status_code not in range(200, 400):
-                    if response.status_code == 429:
-                        err = (
-                            f"429 Response - Blocked by LinkedIn for too many requests"
-                        )
-                    else:
-                        err = f"LinkedIn response status code {response.status_code}"
-                        err += f" - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-            except Exception as e:
-                if "Proxy responded with" in str(e):
-                    log.error(f"LinkedIn: Bad proxy")
-                else:
-                    log.error(f"LinkedIn: {str(e)}")
-                return JobResponse(jobs=job_list)
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("div", class_="base-search-card")
-            if len(job_cards) == 0:
-                return JobResponse(jobs=job_list)
+            response = yield "get", self._search_request(
+                scraper_input, start, seconds_old
+            )
+            job_cards = self._parse_search_page(response)
+            if pending:
+                responses = yield "wait", details
+                page_jobs = self._detail_jobs(pending, responses)
+                pending = []
+                job_count += len(page_jobs)
+                yield "jobs", page_jobs
+            if not job_cards:
+                return
 
+            page_cards = []
             for job_card in job_cards:
                 href_tag = job_card.find("a", class_="base-card__full-link")
                 if href_tag and "href" in href_tag.attrs:
                     href = href_tag.attrs["href"].split("?")[0]
-                    job_id = href.split("-")[-1]
+                    page_cards.append((job_card, href.split("-")[-1]))
+            mostly_known = self.is_mostly_known(
+                [f"li-{job_id}" for _, job_id in page_cards]
+            )
 
-                    if job_id in seen_ids:
-                        continue
-                    seen_ids.add(job_id)
-
-                    try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
-                        job_post = self._process_job(job_card, job_id, fetch_desc)
-                        if job_post:
-                            job_list.append(job_post)
-                        if not continue_search():
-                            break
-                    except Exception as e:
-                        raise LinkedInException(str(e))
+            page_jobs = []
+            for job_card, job_id in page_cards:
+                if not continue_search():
+                    break
+                if job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
+                if f"li-{job_id}" in self.known_ids:
+                    known_count += 1
+                    continue
+                if fetch_desc:
+                    pending.append((job_card, job_id))
+                    continue
+                try:
+                    job_post = self._process_job(job_card, job_id, {})
+                except Exception as e:
+                    raise LinkedInException(str(e))
+                if job_post:
+                    page_jobs.append(job_post)
+                    job_count += 1
+            if pending:
+                details = yield "start", [
+                    self._detail_request(job_id) for _, job_id in pending
+                ]
+            if page_jobs:
+                yield "jobs", page_jobs
 
+            if mostly_known:
+                log.info("search page is mostly known jobs, stopping")
+                break
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                start += len(job_list)
+                start += job_count + len(pending) + known_count
+        if pending:
+            responses = yield "wait", details
+            yield "jobs", self._detail_jobs(pending, responses)
+
+    def _search_request(
+        self, scraper_input: ScraperInput, start: int, seconds_old: int | None
+    ) -> tuple[str, dict]:
+        """
+        Builds the request of a search page
+        :return: url, request kwargs
+        """
+        params = {
+            "keywords": scraper_input.search_term,
+            "location": scraper_input.location,
+            "distance": scraper_input.distance,
+            "f_WT": 2 if scraper_input.is_remote else None,
+            "f_JT": (
+                job_type_code(scraper_input.job_type)
+                if scraper_input.job_type
+                else None
+            ),
+            "pageNum": 0,
+            "start": start,
+            "f_AL": "true" if scraper_input.easy_apply else None,
+            "f_C": (
+                ",".join(map(str, scraper_input.linkedin_company_ids))
+                if scraper_input.linkedin_company_ids
+                else None
+            ),
+        }
+        if seconds_old is not None:
+            params["f_TPR"] = f"r{seconds_old}"
+
+        params = {k: v for k, v in params.items() if v is not None}
+        return f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search?", {
+            "params": params,
+            "timeout": 10,
+        }
+
+    def _parse_search_page(self, response) -> list[Tag]:
+        """
+        Reads the response (or exception) of a search page request
+        :return: its job cards, empty on errors
+        """
+        if isinstance(response, Exception):
+            if "Proxy responded with" in str(response):
+                log.error(f"LinkedIn: Bad proxy")
+            else:
+                log.error(f"LinkedIn: {str(response)}")
+            return []
+        if response.status_code not in range(200, 400):
+            if response.status_code == 429:
+                err = f"429 Response - Blocked by LinkedIn for too many requests"
+            else:
+                err = f"LinkedIn response status code {response.status_code}"
+                err += f" - {response.text}"
+            log.error(err)
+            return []
+
+        soup = make_soup(response.content, self.card_strainer, response.encoding)
+        return soup.select("div.base-search-card")
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+    def _detail_jobs(
+        self, cards: list[tuple[Tag, str]], responses: list
+    ) -> list[JobPost]:
+        """
+        Builds the jobs of a search page from their cards and detail page responses
+        """
+        page_jobs = []
+        for (job_card, job_id), response in zip(cards, responses):
+            try:
+                job_post = self._process_job(
+                    job_card, job_id, self._parse_job_details(response)
+                )
+            except Exception as e:
+                raise LinkedInException(str(e))
+            if job_post:
+                page_jobs.append(job_post)
+        return page_jobs
 
     def _process_job(
-        self, job_card: Tag, job_id: str, full_descr: bool
+        self, job_card: Tag, job_id: str, job_details: dict
     ) -> Optional[JobPost]:
         salary_tag = job_card.find("span", class_="job-search-card__salary-info")
 
@@ -182,7 +363,7 @@ class LinkedIn(Scraper):
             salary_max = salary_values[1]
             currency = salary_text[0] if salary_text[0] != "$" else "USD"
 
-            compensation = Compensation(
+            compensation = Compensation.build(
                 min_amount=int(salary_min),
                 max_amount=int(salary_max),
                 currency=currency,
@@ -215,13 +396,11 @@ class LinkedIn(Scraper):
                 date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
             except:
                 date_posted = None
-        job_details = {}
-        if full_descr:
-            job_details = self._get_job_details(job_id)
-            description = job_details.get("description")
-        is_remote = is_job_remote(title, description, location)
+        description = job_details.get("description")
+        analysis = analyze_description(description)
+        is_remote = is_job_remote(title, analysis.is_remote, location)
 
-        return JobPost(
+        return JobPost.build(
             id=f"li-{job_id}",
             title=title,
             company_name=company,
@@ -236,33 +415,36 @@ class LinkedIn(Scraper):
             company_industry=job_details.get("company_industry"),
             description=job_details.get("description"),
             job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(description),
+            emails=analysis.emails if self.scraper_input.wants("emails") else None,
             company_logo=job_details.get("company_logo"),
             job_function=job_details.get("job_function"),
         )
 
-    def _get_job_details(self, job_id: str) -> dict:
+    def _detail_request(self, job_id: str) -> tuple[str, dict]:
         """
-        Retrieves job description and other job details by going to the job page url
-        :param job_page_url:
+        Builds the request of the job page url
+        :return: url, request kwargs
+        """
+        return f"{self.base_url}/jobs/view/{job_id}", {"timeout": 5}
+
+    def _parse_job_details(self, response) -> dict:
+        """
+        Retrieves job description and other job details from the job page response
+        :param response: or the exception of the request
         :return: dict
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/jobs/view/{job_id}", timeout=5
-            )
-            response.raise_for_status()
-        except:
+        if isinstance(response, Exception) or not response.ok:
             return {}
-        if "linkedin.com/signup" in response.url:
+        if "linkedin.com/signup" in str(response.url):
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        div_content = soup.find(
-            "div", class_=lambda x: x and "show-more-less-html__markup" in x
-        )
+        soup = make_soup(response.content, encoding=response.encoding)
+        div_content = soup.select_one('div[class*="show-more-less-html__markup"]')
         description = None
-        if div_content is not None:
+        # remote, email and salary detection read the description too
+        if div_content is not None and self.scraper_input.wants(
+            "description", "emails", "is_remote", *salary_columns
+        ):
             div_content = remove_attributes(div_content)
             description = div_content.prettify(formatter="html")
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
@@ -282,7 +464,7 @@ class LinkedIn(Scraper):
 
         company_logo = (
             logo_image.get("data-delayed-url")
-            if (logo_image := soup.find("img", {"class": "artdeco-entity-image"}))
+            if (logo_image := soup.select_one("img.artdeco-entity-image"))
             else None
         )
         return {
@@ -301,7 +483,7 @@ class LinkedIn(Scraper):
         :param metadata_card
         :return: location
         """
-        location = Location(country=Country.from_string(self.country))
+        location = Location.build(country=Country.from_string(self.country))
         if metadata_card is not None:
             location_tag = metadata_card.find(
                 "span", class_="job-search-card__location"
@@ -310,7 +492,7 @@ class LinkedIn(Scraper):
             parts = location_string.split(", ")
             if len(parts) == 2:
                 city, state = parts
-                location = Location(
+                location = Location.build(
                     city=city,
                     state=state,
                     country=Country.from_string(self.country),
@@ -318,7 +500,7 @@ class LinkedIn(Scraper):
             elif len(parts) == 3:
                 city, state, country = parts
                 country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
+                location = Location.build(city=city, state=state, country=country)
         return location
 
     def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
@@ -1,5 +1,6 @@
 from bs4 import BeautifulSoup
 
+from jobspy.analyzer import mentions_remote
 from jobspy.model import JobType, Location
 from jobspy.util import get_enum_from_job_type
 
@@ -85,12 +86,13 @@ def parse_company_industry(soup_industry: BeautifulSoup) -> str | None:
     return industry
 
 
-def is_job_remote(title: dict, description: str, location: Location) -> bool:
+def is_job_remote(title: str, description_is_remote: bool, location: Location) -> bool:
     """
-    Searches the title, location, and description to check if job is remote
+    Searches the title and location to check if job is remote
+    :param description_is_remote: DescriptionAnalysis.is_remote of the description
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    location = location.display_location()
-    full_string = f'{title} {description} {location}'.lower()
-    is_remote = any(keyword in full_string for keyword in remote_keywords)
-    return is_remote
+    return (
+        description_is_remote
+        or mentions_remote(title)
+        or mentions_remote(location.display_location())
+    )
@@ -0,0 +1,205 @@
+"""
+Conversion of job descriptions from HTML to markdown.
+
+The same descriptions (employer boilerplate, reposted jobs) come back again and again,
+so conversions are cached by a hash of their HTML: in memory, and optionally in a
+sqlite file shared by later runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
+
+from markdownify import MarkdownConverter
+
+from jobspy.metrics import record_conversion
+
+# only keeps its options, safe to share between threads
+_converter = MarkdownConverter()
+
+
+def content_key(html: str) -> str:
+    return hashlib.blake2b(
+        html.encode("utf-8", "surrogatepass"), digest_size=16
+    ).hexdigest()
+
+
+def convert_html(html: str) -> str:
+    """
+    Uncached conversion, same output as markdownify(html).strip()
+    """
+    return _converter.convert(html).strip()
+
+
+class MarkdownCache:
+    """
+    Converted descriptions keyed by a hash of their HTML. The max_entries most recently
+    used are kept in memory; with a path, conversions are also stored in a sqlite file
+    for later runs, which keeps the max_disk_entries newest.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        path: str | None = None,
+        max_disk_entries: int = 200000,
+    ):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = None
+        if path:
+            path = os.path.expanduser(path)
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS markdown ("
+                    "key TEXT PRIMARY KEY, created REAL, markdown TEXT)"
+                )
+
+    def _remember(self, key: str, markdown: str):
+        self._entries[key] = markdown
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            markdown = self._entries.get(key)
+            if markdown is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT markdown FROM markdown WHERE key = ?", (key,)
+                ).fetchone()
+                markdown = row[0] if row else None
+            if markdown is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, markdown)
+            return markdown
+
+    def set(self, key: str, markdown: str):
+        with self._lock:
+            self._remember(key, markdown)
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO markdown VALUES (?, ?, ?)",
+                    (key, time.time(), markdown),
+                )
+                self._writes += 1
+                if self._writes % 1000 == 0:
+                    self._conn.execute(
+                        "DELETE FROM markdown WHERE key IN (SELECT key FROM markdown "
+                        "ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM markdown")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+markdown_cache: MarkdownCache | None = MarkdownCache()
+# runs convert_many batches, e.g. a ProcessPoolExecutor
+markdown_executor: Executor | None = None
+
+
+def set_markdown_cache(cache: MarkdownCache | None) -> MarkdownCache | None:
+    """
+    Replaces the cache of every conversion, None disables caching
+    :return: previous cache
+    """
+    global markdown_cache
+    previous, markdown_cache = markdown_cache, cache
+    return previous
+
+
+def set_markdown_executor(executor: Executor | None) -> Executor | None:
+    """
+    Offloads large convert_many batches to executor, e.g. ProcessPoolExecutor(4)
+    :return: previous executor
+    """
+    global markdown_executor
+    previous, markdown_executor = markdown_executor, executor
+    return previous
+
+
+def _cached(key: str, convert, *args) -> str:
+    cache = markdown_cache
+    markdown = cache.get(key) if cache else None
+    if markdown is None:
+        start = time.perf_counter()
+        markdown = convert(*args)
+        record_conversion(time.perf_counter() - start)
+        if cache:
+            cache.set(key, markdown)
+    return markdown
+
+
+def html_to_markdown(html: str | None) -> str | None:
+    """
+    Converts a description, reusing earlier conversions of the same HTML
+    """
+    if html is None:
+        return None
+    return _cached(content_key(html), convert_html, html)
+
+
+def convert_many(
+    htmls: list[str | None], executor: Executor | None = None, min_batch: int = 32
+) -> list[str | None]:
+    """
+    Converts a batch of descriptions, each distinct one once
+    :param executor: converts the uncached descriptions when there are at least
+        min_batch of them, the markdown_executor if None
+    :return: markdown of each description, in order
+    """
+    executor = executor or markdown_executor
+    cache = markdown_cache
+    keys = [content_key(html) if html is not None else None for html in htmls]
+    converted: dict[str, str] = {}
+    missing: dict[str, str] = {}
+    for key, html in zip(keys, htmls):
+        if key is None or key in converted or key in missing:
+            continue
+        markdown = cache.get(key) if cache else None
+        if markdown is None:
+            missing[key] = html
+        else:
+            converted[key] = markdown
+    if missing:
+        start = time.perf_counter()
+        if executor is not None and len(missing) >= min_batch:
+            chunksize = max(len(missing) // 32, 1)
+            results = executor.map(convert_html, missing.values(), chunksize=chunksize)
+        else:
+            results = map(convert_html, missing.values())
+        for key, markdown in zip(missing, results):
+            converted[key] = markdown
+            if cache:
+                cache.set(key, markdown)
+        record_conversion(time.perf_counter() - start)
+    return [converted[key] if key is not None else None for key in keys]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from jobspy.model import Site
+
+
+class SiteMetrics:
+    """
+    Counters and timings (seconds) of the scrapes of one site.
+    parse_time is the scraping time not spent in requests, sleeps or markdown
+    conversion, i.e. HTML/JSON parsing and building the JobPosts.
+    """
+
+    def __init__(self, site: str):
+        self.site = site
+        self.requests = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.status_codes: Counter[int] = Counter()
+        self.retries = 0
+        self.request_time = 0.0
+        self.sleep_time = 0.0
+        self.conversion_time = 0.0
+        self.scrape_time = 0.0
+        self.jobs = 0
+        self.cache_hits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def parse_time(self) -> float:
+        waiting = self.request_time + self.sleep_time + self.conversion_time
+        return max(self.scrape_time - waiting, 0.0)
+
+    def add(self, **values):
+        with self._lock:
+            for name, value in values.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def add_response(self, status_code: int | None, size: int, elapsed: float):
+        with self._lock:
+            self.requests += 1
+            self.request_time += elapsed
+            if status_code is None:
+                self.errors += 1
+            else:
+                self.status_codes[status_code] += 1
+                self.bytes_received += size
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "status_codes": dict(self.status_codes),
+            "retries": self.retries,
+            "request_time": self.request_time,
+            "sleep_time": self.sleep_time,
+            "parse_time": self.parse_time,
+            "conversion_time": self.conversion_time,
+            "scrape_time": self.scrape_time,
+            "jobs": self.jobs,
+            "cache_hits": self.cache_hits,
+        }
+
+
+class ScrapeMetrics:
+    """
+    Metrics of one scrape_jobs (or iter_jobs, scrape_jobs_many, ...) call, per site,
+    plus the time spent building the DataFrame and the whole call (set by finish)
+    """
+
+    def __init__(self):
+        self.sites: dict[str, SiteMetrics] = {}
+        self.frame_time = 0.0
+        self.total_time = 0.0
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def site(self, site: Site | str) -> SiteMetrics:
+        name = site.value if isinstance(site, Site) else site
+        with self._lock:
+            if name not in self.sites:
+                self.sites[name] = SiteMetrics(name)
+            return self.sites[name]
+
+    @contextmanager
+    def collect(self, site: Site | str) -> Iterator[SiteMetrics]:
+        """
+        Attributes the requests, sleeps and conversions made by this thread (or task)
+        inside the block to the site
+        """
+        site_metrics = self.site(site)
+        token = _current_site.set(site_metrics)
+        start = time.perf_counter()
+        try:
+            yield site_metrics
+        finally:
+            site_metrics.add(scrape_time=time.perf_counter() - start)
+            _current_site.reset(token)
+
+    @contextmanager
+    def timed(self, name: str):
+        """
+        Adds the duration of the block to an attribute such as frame_time
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            setattr(self, name, getattr(self, name) + time.perf_counter() - start)
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self.started
+
+    def to_dict(self) -> dict:
+        return {
+            "sites": {name: metrics.to_dict() for name, metrics in self.sites.items()},
+            "frame_time": self.frame_time,
+            "total_time": self.total_time,
+        }
+
+
+_current_site: ContextVar[SiteMetrics | None] = ContextVar(
+    "jobspy_site_metrics", default=None
+)
+
+
+def current_site_metrics() -> SiteMetrics | None:
+    return _current_site.get()
+
+
+def record_response(response, elapsed: float):
+    """
+    Counts a response (None when the request failed) for the site being scraped
+    """
+    site_metrics = _current_site.get()
+    if site_metrics is None:
+        return
+    if response is None:
+        site_metrics.add_response(None, 0, elapsed)
+        return
+    site_metrics.add_response(
+        response.status_code, len(response.content or b""), elapsed
+    )
+    # retries done by the urllib3 adapter of requests sessions
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    if retries is not None and retries.history:
+        site_metrics.add(retries=len(retries.history))
+
+
+def record_retry():
+    site_metrics = _current_site.get()
+    if site_metrics is not None:
+        site_metrics.add(retries=1)
+
+
+def record_sleep(seconds: float):
+    site_metrics = _current_site.get()
+    if site_metrics is not None:
+        site_metrics.add(sleep_time=seconds)
+
+
+def record_conversion(seconds: float):
+    site_metrics = _current_site.get()
+    if site_metrics is not None:
+        site_metrics.add(conversion_time=seconds)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 from abc import ABC, abstractmethod
-from typing import Optional
-from datetime import date
+from concurrent.futures import Executor
+from functools import cache
+from importlib.util import find_spec
+from typing import AsyncIterator, Callable, ClassVar, Iterator, Optional
+from datetime import date, datetime
 from enum import Enum
 from pydantic import BaseModel
 
@@ -177,7 +182,68 @@ class Country(Enum):
         )
 
 
-class Location(BaseModel):
+# scrapers build their models without validation, see Record.build
+validate_records = False
+
+
+def set_record_validation(enabled: bool) -> bool:
+    """
+    Validates the JobPost, Location and Compensation records built by the scrapers,
+    e.g. while working on a scraper
+    :return: previous setting
+    """
+    global validate_records
+    previous, validate_records = validate_records, enabled
+    return previous
+
+
+def to_date(value: date | datetime | str) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+@cache
+def _record_defaults(cls: type[BaseModel]) -> dict:
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in cls.model_fields.items()
+        if not field.is_required()
+    }
+
+
+class Record(BaseModel):
+    """
+    Model the scrapers build from values already parsed into the annotated types,
+    apart from the conversions listed in coercions
+    """
+
+    # field -> conversion of the values the scrapers pass in another type
+    coercions: ClassVar[dict[str, Callable]] = {}
+
+    @classmethod
+    def build(cls, **values):
+        """
+        Model with the values assigned as they are, as model_construct does but
+        without its per-field work, which in pydantic 2 costs more than validating.
+        Validated like cls(**values) when set_record_validation(True).
+        """
+        if validate_records:
+            return cls(**values)
+        for name, coerce in cls.coercions.items():
+            if values.get(name) is not None:
+                values[name] = coerce(values[name])
+        record = cls.__new__(cls)
+        object.__setattr__(record, "__dict__", {**_record_defaults(cls), **values})
+        object.__setattr__(record, "__pydantic_fields_set__", set(values))
+        object.__setattr__(record, "__pydantic_extra__", None)
+        object.__setattr__(record, "__pydantic_private__", None)
+        return record
+
+
+class Location(Record):
     country: Country | str | None = None
     city: Optional[str] = None
     state: Optional[str] = None
@@ -223,19 +289,25 @@ class CompensationInterval(Enum):
             return cls[pay_period].value if pay_period in cls.__members__ else None
 
 
-class Compensation(BaseModel):
+class Compensation(Record):
     interval: Optional[CompensationInterval] = None
     min_amount: float | None = None
     max_amount: float | None = None
     currency: Optional[str] = "USD"
 
+    coercions = {
+        "interval": CompensationInterval,
+        "min_amount": float,
+        "max_amount": float,
+    }
+
 
 class DescriptionFormat(Enum):
     MARKDOWN = "markdown"
     HTML = "html"
 
 
-class JobPost(BaseModel):
+class JobPost(Record):
     id: str | None = None
     title: str
     company_name: str | None
@@ -279,6 +351,13 @@ class JobPost(BaseModel):
     vacancy_count: int | None = None  #from vacancy
     work_from_home_type: str | None = None  #from clusters.wfhType (e.g., "Hybrid", "Remote")
 
+    coercions = {
+        "date_posted": to_date,
+        "company_rating": float,
+        "company_reviews_count": int,
+        "vacancy_count": int,
+    }
+
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
 
@@ -298,6 +377,10 @@ class SalarySource(Enum):
     DESCRIPTION = "description"
 
 
+# result columns filled from a job's compensation, or parsed from its description
+salary_columns = ("salary_source", "interval", "min_amount", "max_amount", "currency")
+
+
 class ScraperInput(BaseModel):
     site_type: list[Site]
     search_term: str | None = None
@@ -312,19 +395,98 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    # JobDetailQuery operations per Glassdoor request, 1 fetches descriptions one by one
+    glassdoor_description_batch_size: int = 10
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     results_wanted: int = 15
     hours_old: int | None = None
+    # result columns requested, all if None; scrapers skip the work of the others
+    fields: list[str] | None = None
+
+    def wants(self, *columns: str) -> bool:
+        """
+        :return: whether any of the result columns is requested
+        """
+        return self.fields is None or any(column in self.fields for column in columns)
 
 
 class Scraper(ABC):
+    # incremental scraping stops paginating once this share of a page is already known
+    known_page_ratio = 0.8
+    # whether scrape_pages_async is implemented on an asyncio transport
+    has_async_transport = False
+
     def __init__(
         self, site: Site, proxies: list[str] | None = None, ca_cert: str | None = None
     ):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
+        # JobPost ids collected by earlier runs of the same search, skipped when seen
+        self.known_ids: set[str] = set()
+        # known ids the search pages returned again, so their last_seen is refreshed
+        self.seen_known_ids: set[str] = set()
+
+    def is_mostly_known(self, page_ids: list[str]) -> bool:
+        """
+        Whether a search page is mostly made of jobs collected by earlier runs.
+        The known ids of the page are noted in seen_known_ids.
+        """
+        if not self.known_ids or not page_ids:
+            return False
+        known = [job_id for job_id in page_ids if job_id in self.known_ids]
+        self.seen_known_ids.update(known)
+        return len(known) / len(page_ids) >= self.known_page_ratio
 
     @abstractmethod
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Yields the jobs of each search page as soon as the page is parsed
+        """
+        ...
+
+    def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Same as scrape_pages on an asyncio session, for has_async_transport scrapers
+        """
+        raise NotImplementedError
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        return JobResponse(
+            jobs=[job for page in self.scrape_pages(scraper_input) for job in page]
+        )
+
+    def close(self):
+        """
+        Closes the scraper's session, if it has made one
+        """
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+
+    async def scrape_async(
+        self, scraper_input: ScraperInput, executor: Executor | None = None
+    ) -> JobResponse:
+        """
+        Awaitable scrape. Scrapers with an asyncio transport (httpx installed) send
+        their requests and wait between them on the event loop. The others (sites
+        that need tls_client's browser fingerprint) fetch each search page on the
+        executor, the loop's default if None.
+        """
+        if self.has_async_transport and find_spec("httpx"):
+            pages = self.scrape_pages_async(scraper_input)
+            return JobResponse(jobs=[job async for page in pages for job in page])
+        loop = asyncio.get_running_loop()
+        # run_in_executor does not carry context variables (e.g. run metrics) over
+        context = contextvars.copy_context()
+        pages = self.scrape_pages(scraper_input)
+        jobs: list[JobPost] = []
+        while True:
+            page = await loop.run_in_executor(executor, context.run, next, pages, None)
+            if page is None:
+                break
+            jobs.extend(page)
+        return JobResponse(jobs=jobs)
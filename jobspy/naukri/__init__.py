@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import AsyncIterator, Generator, Iterator, Optional, Tuple
 
 import regex as re
 import requests
 
+from jobspy.analyzer import analyze_description
 from jobspy.exception import NaukriException
 from jobspy.naukri.constant import headers as naukri_headers
 from jobspy.naukri.util import (
@@ -19,7 +18,6 @@ from jobspy.naukri.util import (
 from jobspy.model import (
     JobPost,
     Location,
-    JobResponse,
     Country,
     Compensation,
     DescriptionFormat,
@@ -28,9 +26,9 @@ from jobspy.model import (
     Site,
 )
 from jobspy.util import (
-    extract_emails_from_text,
     currency_parser,
     markdown_converter,
+    create_async_session,
     create_session,
     create_logger,
 )
@@ -38,10 +36,18 @@ from jobspy.util import (
 log = create_logger("Naukri")
 
 class Naukri(Scraper):
+    has_async_transport = True
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 20  
+    # result columns parsed from the job description
+    description_columns = (
+        "description",
+        "job_type",
+        "company_industry",
+        "is_remote",
+        "work_from_home_type",
+        "emails",
+    )
 
     def __init__(
         self, proxies: list[str] | str | None = None, ca_cert: str | None = None
@@ -63,14 +69,66 @@ class Naukri(Scraper):
         self.country = "India"  #naukri is india-focused by default
         log.info("Naukri scraper initialized")
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes Naukri API for jobs with scraper_input criteria
+        Scrapes Naukri API for jobs with scraper_input criteria, one page at a time
         :param scraper_input:
-        :return: job_response
+        :return: iterator of the jobs on each page
+        """
+        pages = self._pages(scraper_input)
+        response = None
+        while True:
+            try:
+                params, page_jobs = pages.send(response)
+            except StopIteration:
+                return
+            if params is None:
+                yield page_jobs
+                continue
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=10)
+            except Exception as e:
+                response = e
+
+    async def scrape_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        scrape_pages on an asyncio session
+        """
+        pages = self._pages(scraper_input)
+        response = None
+        async with create_async_session(
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            headers=naukri_headers,
+            clear_cookies=True,
+        ) as session:
+            while True:
+                try:
+                    params, page_jobs = pages.send(response)
+                except StopIteration:
+                    return
+                if params is None:
+                    yield page_jobs
+                    continue
+                try:
+                    response = await session.get(
+                        self.base_url, params=params, timeout=10
+                    )
+                except Exception as e:
+                    response = e
+
+    def _pages(
+        self, scraper_input: ScraperInput
+    ) -> Generator[Tuple[dict | None, list[JobPost]], object, None]:
+        """
+        Pagination without a transport: yields (params, []) for each search page,
+        which is sent the response (or the exception of the request), then
+        (None, jobs of the page) once it is parsed
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
@@ -79,7 +137,7 @@ class Naukri(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: job_count < scraper_input.results_wanted and page <= 50  # Arbitrary limit
         )
 
         while continue_search():
@@ -105,13 +163,15 @@ class Naukri(Scraper):
                 params["days"] = seconds_old // 86400  # Convert to days
 
             params = {k: v for k, v in params.items() if v is not None}
+            log.debug(f"Sending request to {self.base_url} with params: {params}")
+            response = yield params, []
             try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
+                if isinstance(response, Exception):
+                    raise response
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
-                    return JobResponse(jobs=job_list)
+                    return
                 data = response.json()
                 job_details = data.get("jobDetails", [])
                 log.info(f"Received {len(job_details)} job entries from API")
@@ -120,8 +180,9 @@ class Naukri(Scraper):
                     break
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
+                return
 
+            page_jobs: list[JobPost] = []
             for job in job_details:
                 job_id = job.get("jobId")
                 if not job_id or job_id in seen_ids:
@@ -130,10 +191,14 @@ class Naukri(Scraper):
                 log.debug(f"Processing job ID: {job_id}")
 
                 try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
+                    fetch_desc = (
+                        scraper_input.linkedin_fetch_description
+                        and scraper_input.wants(*self.description_columns)
+                    )
                     job_post = self._process_job(job, job_id, fetch_desc)
                     if job_post:
-                        job_list.append(job_post)
+                        page_jobs.append(job_post)
+                        job_count += 1
                         log.info(f"Added job: {job_post.title} (ID: {job_id})")
                     if not continue_search():
                         break
@@ -141,13 +206,11 @@ class Naukri(Scraper):
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
 
+            yield None, page_jobs
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
                 page += 1
 
-        job_list = job_list[:scraper_input.results_wanted]
-        log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
-        return JobResponse(jobs=job_list)
+        log.info(f"Scraping completed. Total jobs collected: {job_count}")
 
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
@@ -170,7 +233,8 @@ class Naukri(Scraper):
 
         job_type = parse_job_type(description) if description else None
         company_industry = parse_company_industry(description) if description else None
-        is_remote = is_job_remote(title, description or "", location)
+        analysis = analyze_description(description)
+        is_remote = is_job_remote(title, analysis.is_remote, location)
         company_logo = job.get("logoPathV3") or job.get("logoPath")
 
         # Naukri-specific fields
@@ -182,7 +246,7 @@ class Naukri(Scraper):
         vacancy_count = job.get("vacancy")
         work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
 
-        job_post = JobPost(
+        job_post = JobPost.build(
             id=f"nk-{job_id}",
             title=title,
             company_name=company,
@@ -195,7 +259,7 @@ class Naukri(Scraper):
             job_type=job_type,
             company_industry=company_industry,
             description=description,
-            emails=extract_emails_from_text(description or ""),
+            emails=analysis.emails if self.scraper_input.wants("emails") else None,
             company_logo=company_logo,
             skills=skills,
             experience_range=experience_range,
@@ -211,14 +275,14 @@ class Naukri(Scraper):
         """
         Extracts location data from placeholders
         """
-        location = Location(country=Country.INDIA)
+        location = Location.build(country=Country.INDIA)
         for placeholder in placeholders:
             if placeholder.get("type") == "location":
                 location_str = placeholder.get("label", "")
                 parts = location_str.split(", ")
                 city = parts[0] if parts else None
                 state = parts[1] if len(parts) > 1 else None
-                location = Location(city=city, state=state, country=Country.INDIA)
+                location = Location.build(city=city, state=state, country=Country.INDIA)
                 log.debug(f"Parsed location: {location.display_location()}")
                 break
         return location
@@ -250,7 +314,7 @@ class Naukri(Scraper):
                         max_salary *= 10000000
 
                     log.debug(f"Parsed salary: {min_salary} - {max_salary} INR")
-                    return Compensation(
+                    return Compensation.build(
                         min_amount=int(min_salary),
                         max_amount=int(max_salary),
                         currency=currency,
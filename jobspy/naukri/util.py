@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from bs4 import BeautifulSoup
+from jobspy.analyzer import mentions_remote
 from jobspy.model import JobType, Location
 from jobspy.util import get_enum_from_job_type
 
@@ -24,11 +25,13 @@ def parse_company_industry(soup: BeautifulSoup) -> str | None:
     return industry_tag.get_text(strip=True) if industry_tag else None
 
 
-def is_job_remote(title: str, description: str, location: Location) -> bool:
+def is_job_remote(title: str, description_is_remote: bool, location: Location) -> bool:
     """
-    Searches the title, description, and location to check if the job is remote
+    Searches the title and location to check if the job is remote
+    :param description_is_remote: DescriptionAnalysis.is_remote of the description
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    location_str = location.display_location()
-    full_string = f"{title} {description} {location_str}".lower()
-    return any(keyword in full_string for keyword in remote_keywords)
\ No newline at end of file
+    return (
+        description_is_remote
+        or mentions_remote(title)
+        or mentions_remote(location.display_location())
+    )
\ No newline at end of file
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+import time
+
+# proxy standing for the direct connection
+DIRECT = "http://localhost"
+
+
+def format_proxy(proxy: str) -> str:
+    """
+    Adds the http:// scheme to proxies given as host:port
+    """
+    if proxy.startswith(("http://", "https://", "socks5://")):
+        return proxy
+    return f"http://{proxy}"
+
+
+class ProxyHealth:
+    """
+    Running health of one proxy: latency and error rate are exponentially weighted
+    moving averages, so recent requests count the most
+    """
+
+    def __init__(self, proxy: str):
+        self.proxy = proxy
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.failures = 0  # consecutive errors or throttled responses
+        self.ejections = 0  # consecutive ejections, sets the next cool-off
+        self.ejected_until = 0.0
+        self.probe = False  # gets the next request after its cool-off
+
+    def score(self) -> float:
+        """
+        Expected cost of a request through the proxy, lower is better. Latency is
+        inflated by the error rate. Proxies without latency yet, or back from a
+        cool-off, score 0 to be tried.
+        """
+        if self.latency is None or self.probe:
+            return 0.0
+        return self.latency * (1 + 4 * self.error_rate)
+
+    def to_dict(self, now: float) -> dict:
+        return {
+            "proxy": self.proxy,
+            "requests": self.requests,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "latency": self.latency,
+            "error_rate": round(self.error_rate, 4),
+            "score": self.score(),
+            "ejected": self.ejected_until > now,
+            "cool_off": max(self.ejected_until - now, 0.0),
+            "ejections": self.ejections,
+        }
+
+
+class ProxyPool:
+    """
+    Picks the proxy for each request by health instead of a blind rotation. Proxies
+    that are not ejected take turns, but one is passed over when the next is clearly
+    better (tolerance times lower score), steering load away from slow or failing ones.
+    After max_failures consecutive errors or 429 responses a proxy is ejected for
+    cool_off seconds, doubled for each further ejection up to max_cool_off; a
+    success resets both. A pool can be passed as proxies to share it between searches.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str,
+        max_failures: int = 3,
+        cool_off: float = 30.0,
+        max_cool_off: float = 600.0,
+        alpha: float = 0.2,
+        tolerance: float = 2.0,
+    ):
+        if isinstance(proxies, str):
+            proxies = [proxies]
+        if not proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self.proxies = [format_proxy(proxy) for proxy in dict.fromkeys(proxies)]
+        self.max_failures = max_failures
+        self.cool_off = cool_off
+        self.max_cool_off = max_cool_off
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self._health = {proxy: ProxyHealth(proxy) for proxy in self.proxies}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def acquire(self, skip=None) -> str:
+        """
+        :param skip: optional predicate of proxies to avoid if others are available,
+            e.g. those cooling off for the requested host
+        :return: proxy to send the next request through
+        """
+        with self._lock:
+            now = time.monotonic()
+            count = len(self.proxies)
+            order = [self.proxies[(self._next + i) % count] for i in range(count)]
+            healthy = [p for p in order if self._health[p].ejected_until <= now]
+            preferred = [p for p in healthy if not (skip and skip(p))]
+            if not preferred:
+                if healthy:
+                    preferred = healthy
+                else:
+                    # every proxy is ejected, use the one returning first
+                    preferred = [
+                        min(order, key=lambda p: self._health[p].ejected_until)
+                    ]
+            proxy = preferred[0]
+            if len(preferred) > 1 and self._clearly_better(preferred[1], proxy):
+                proxy = preferred[1]
+            self._next = (self.proxies.index(proxy) + 1) % count
+            return proxy
+
+    def _clearly_better(self, proxy: str, other: str) -> bool:
+        # comparable proxies keep their turn so the load (and rate limits) is spread
+        score, other_score = self._health[proxy].score(), self._health[other].score()
+        return score * self.tolerance < other_score and other_score - score > 0.05
+
+    def report(self, proxy: str, elapsed: float, status_code: int | None):
+        """
+        Updates the health of proxy after a request
+        :param elapsed: seconds the request took
+        :param status_code: of the response, None if the request failed
+        """
+        health = self._health.get(proxy)
+        if health is None:
+            return
+        throttled = status_code == 429
+        failed = status_code is None or status_code >= 500 or throttled
+        with self._lock:
+            health.requests += 1
+            health.errors += status_code is None or status_code >= 500
+            health.throttled += throttled
+            health.probe = False
+            health.error_rate += self.alpha * (failed - health.error_rate)
+            if status_code is not None:
+                health.latency = (
+                    elapsed
+                    if health.latency is None
+                    else health.latency + self.alpha * (elapsed - health.latency)
+                )
+            if not failed:
+                health.failures = health.ejections = 0
+                return
+            health.failures += 1
+            if health.failures >= self.max_failures:
+                cool_off = min(self.max_cool_off, self.cool_off * 2**health.ejections)
+                health.ejected_until = time.monotonic() + cool_off
+                health.ejections += 1
+                # a failed probe after the cool-off ejects it again right away
+                health.failures = self.max_failures - 1
+                health.probe = True
+
+    def stats(self) -> list[dict]:
+        """
+        :return: snapshot of the health of each proxy
+        """
+        with self._lock:
+            now = time.monotonic()
+            return [self._health[proxy].to_dict(now) for proxy in self.proxies]
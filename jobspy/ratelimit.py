@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from pydantic import BaseModel
+
+from jobspy.metrics import record_sleep
+from jobspy.model import Site
+
+# host pattern a site's limit applies to, matched against whole labels of the host
+site_hosts = {
+    Site.LINKEDIN: "linkedin.com",
+    Site.INDEED: "indeed.com",
+    Site.ZIP_RECRUITER: "ziprecruiter.com",
+    Site.GLASSDOOR: "glassdoor",
+    Site.GOOGLE: "google.com",
+    Site.BAYT: "bayt.com",
+    Site.NAUKRI: "naukri.com",
+}
+
+
+class RateLimit(BaseModel):
+    rate: float  # requests per second through each proxy (or the direct connection)
+    burst: int = 1  # requests allowed back to back after an idle period
+    host_rate: float | None = None  # optional cap shared by all proxies
+    host_burst: int = 1
+
+
+# pacing of the search pages that used to be fixed sleeps between them
+default_rate_limits: dict[str, RateLimit | None] = {
+    "linkedin.com": RateLimit(rate=0.2),  # search pages, 3-7s apart before
+    # job pages, the 5 detail_workers of a search page start together
+    "linkedin.com/jobs/view": RateLimit(rate=1.0, burst=5),
+    "api.ziprecruiter.com": RateLimit(rate=0.2, burst=2),  # cookie event + 1st page
+    "bayt.com": RateLimit(rate=0.3),
+    "naukri.com": RateLimit(rate=0.2),
+}
+
+
+class BackoffPolicy(BaseModel):
+    """
+    How sessions retry throttled responses: after Retry-After (or an exponential
+    delay) through the next proxy, until budget seconds have passed since the first
+    attempt, when the last throttled response is returned to the scraper
+    """
+
+    budget: float = 120.0
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    statuses: tuple[int, ...] = (429,)
+
+    def retry_delay(self, response, attempt: int) -> float | None:
+        """
+        :return: seconds to wait before retrying, None if response is not throttled
+        """
+        if response is None or response.status_code not in self.statuses:
+            return None
+        retry_after = retry_after_seconds(response)
+        if retry_after is not None:
+            return retry_after
+        return min(self.max_delay, self.base_delay * 2**attempt)
+
+
+def retry_after_seconds(response) -> float | None:
+    """
+    Parses a Retry-After header given in seconds or as an HTTP date
+    """
+    value = (response.headers or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, going into debt if none is left, so concurrent callers queue up
+        :return: seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+
+def _host_matches(host: str, pattern: str) -> bool:
+    return f".{pattern}." in f".{host}."
+
+
+def _split_pattern(pattern: str) -> tuple[str, str]:
+    """
+    :return: host pattern and path prefix ("" for the whole host)
+    """
+    host, _, path = pattern.partition("/")
+    return host, f"/{path}" if path else ""
+
+
+class RateLimiter:
+    """
+    Token buckets per (host, proxy), plus per host when a host_rate is set, shared
+    by every session. Sessions wait on it before each request, so the request rate to
+    a site grows with the number of proxies while each proxy stays within its limit.
+    Limits are keyed by site or host pattern, the most specific matching one applies.
+    A pattern may end with a path prefix, e.g. "linkedin.com/jobs/view", whose
+    requests then have buckets of their own.
+    """
+
+    def __init__(self, limits: dict[Site | str, RateLimit | float | None] = None):
+        self.limits: dict[str, RateLimit | None] = {}
+        self._buckets: dict[tuple, TokenBucket] = {}
+        self._cool_off: dict[tuple, float] = {}
+        self._host_limits: dict[str, list[tuple[str, RateLimit | None]]] = {}
+        self._lock = threading.Lock()
+        self.update(default_rate_limits if limits is None else limits)
+
+    def update(self, limits: dict[Site | str, RateLimit | float | None]):
+        """
+        Sets the limits of sites or hosts, e.g. {"linkedin": 0.5, "indeed": None}.
+        A site's limit also replaces the limits of the paths of its host.
+        :param limits: RateLimit, requests per second, or None for no limit
+        """
+        with self._lock:
+            for key, limit in limits.items():
+                if isinstance(limit, (int, float)):
+                    limit = RateLimit(rate=limit)
+                if isinstance(key, Site) or key in Site._value2member_map_:
+                    key = site_hosts[Site(key)]
+                    for pattern in list(self.limits):
+                        if pattern.startswith(f"{key}/"):
+                            self.limits[pattern] = limit
+                self.limits[key] = limit
+            self._buckets.clear()
+            self._host_limits.clear()
+
+    def reset(self):
+        """
+        Restores default_rate_limits
+        """
+        with self._lock:
+            self.limits.clear()
+        self.update(default_rate_limits)
+
+    def _limit(self, host: str, path: str) -> tuple[str, RateLimit | None]:
+        """
+        :return: path prefix of the most specific matching pattern, and its limit
+        """
+        if host not in self._host_limits:
+            # most specific first
+            self._host_limits[host] = sorted(
+                (
+                    (_split_pattern(pattern)[1], limit)
+                    for pattern, limit in self.limits.items()
+                    if _host_matches(host, _split_pattern(pattern)[0])
+                ),
+                key=lambda prefix_limit: len(prefix_limit[0]),
+                reverse=True,
+            )
+        for prefix, limit in self._host_limits[host]:
+            if path.startswith(prefix):
+                return prefix, limit
+        return "", None
+
+    def _bucket(self, key: tuple, rate: float, burst: int) -> TokenBucket:
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket(rate, burst)
+        return self._buckets[key]
+
+    def cool_off(self, url: str, proxy: str | None, seconds: float):
+        """
+        Holds back requests to url's host through proxy, e.g. after a 429 response
+        """
+        key = (urlparse(url).hostname or "", proxy)
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._cool_off[key] = max(self._cool_off.get(key, 0.0), until)
+
+    def cooling_off(self, url: str, proxy: str | None) -> bool:
+        key = (urlparse(url).hostname or "", proxy)
+        with self._lock:
+            return self._cool_off.get(key, 0.0) > time.monotonic()
+
+    def reserve(
+        self, url: str, proxy: str | None = None, timeout: float | None = None
+    ) -> float | None:
+        """
+        Books a request to url through proxy
+        :param timeout: longest acceptable wait, None to wait as long as needed
+        :return: seconds to wait before sending it, None without booking if it would
+            exceed timeout
+        """
+        parsed = urlparse(url)
+        host = parsed.hostname or ""
+        with self._lock:
+            cool_off = self._cool_off.get((host, proxy), 0.0) - time.monotonic()
+            if cool_off <= 0:
+                self._cool_off.pop((host, proxy), None)
+            if timeout is not None and cool_off > timeout:
+                return None
+            prefix, limit = self._limit(host, parsed.path)
+            buckets = []
+            if limit is not None:
+                buckets.append(
+                    self._bucket((host, prefix, proxy), limit.rate, limit.burst)
+                )
+                if limit.host_rate:
+                    buckets.append(
+                        self._bucket((host, prefix), limit.host_rate, limit.host_burst)
+                    )
+        return max([0.0, cool_off, *(bucket.reserve() for bucket in buckets)])
+
+    def wait(
+        self, url: str, proxy: str | None = None, timeout: float | None = None
+    ) -> float | None:
+        """
+        Blocks until a request to url through proxy is allowed, see reserve
+        :return: seconds waited, None without waiting if it would exceed timeout
+        """
+        delay = self.reserve(url, proxy, timeout)
+        if delay:
+            record_sleep(delay)
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(
+        self, url: str, proxy: str | None = None, timeout: float | None = None
+    ) -> float | None:
+        """
+        Same as wait, sleeping without blocking the event loop
+        """
+        delay = self.reserve(url, proxy, timeout)
+        if delay:
+            record_sleep(delay)
+            await asyncio.sleep(delay)
+        return delay
+
+
+rate_limiter = RateLimiter()
+backoff_policy = BackoffPolicy()
+
+
+def set_rate_limits(limits: dict[Site | str, RateLimit | float | None]):
+    """
+    Changes the limits used by every session, see RateLimiter.update
+    """
+    rate_limiter.update(limits)
+
+
+def set_backoff_policy(**settings):
+    """
+    Changes how every session retries throttled responses, e.g. budget=300
+    """
+    for name, value in settings.items():
+        setattr(backoff_policy, name, value)
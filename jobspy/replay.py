@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict, deque
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from jobspy.metrics import record_response
+from jobspy.util import create_logger, set_session_hook
+
+log = create_logger("Replay")
+
+# response headers left out of cassettes, so fixtures can be shared without sessions
+private_headers = {"set-cookie", "cookie", "authorization"}
+
+
+class ReplayMiss(requests.exceptions.ConnectionError):
+    """
+    Raised when a replayed session is asked for a request that was never recorded
+    """
+
+
+def request_key(method: str, url: str, params=None, data=None, json_body=None) -> str:
+    """
+    Identifies a request by method, full url (with params) and body, ignoring headers
+    """
+    prepared = requests.Request(method.upper(), url, params=params).prepare()
+    if json_body is not None:
+        body = json.dumps(json_body, sort_keys=True, separators=(",", ":"))
+    elif isinstance(data, dict):
+        body = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    elif isinstance(data, (list, tuple)):
+        body = urlencode(data)
+    elif isinstance(data, bytes):
+        body = data.decode("utf-8", errors="replace")
+    else:
+        body = data or ""
+    body_hash = hashlib.sha1(body.encode("utf-8")).hexdigest()[:16]
+    return f"{method.upper()} {prepared.url} {body_hash}"
+
+
+def _encode_body(content: bytes) -> dict:
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(interaction: dict) -> bytes:
+    if "base64" in interaction:
+        return base64.b64decode(interaction["base64"])
+    return interaction.get("text", "").encode("utf-8")
+
+
+class Cassette:
+    """
+    Records or replays the HTTP traffic of every session made by create_session.
+    In record mode the real sessions are wrapped and each response is stored; on exit
+    the interactions are written to path as JSON, together with the optional search
+    parameters they were recorded for. In replay mode no network is used: responses
+    are served from the file in recorded order for each request, and unknown requests
+    raise ReplayMiss.
+
+        with Cassette("fixtures/linkedin.json", mode="record", search={...}):
+            scrape_jobs(site_name="linkedin", ...)
+    """
+
+    def __init__(self, path: str, mode: str = "replay", search: dict | None = None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"mode must be 'record' or 'replay', not {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.search = search or {}
+        self.interactions: list[dict] = []
+        self._responses: dict[str, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._previous_hook = None
+        if mode == "replay":
+            self.load()
+
+    def load(self):
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.search = data.get("search", {})
+        self.interactions = data["interactions"]
+        self._responses.clear()
+        for interaction in self.interactions:
+            self._responses[interaction["key"]].append(interaction)
+
+    def save(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"search": self.search, "interactions": self.interactions}, f, indent=1
+            )
+
+    def record(self, key: str, response):
+        interaction = {
+            "key": key,
+            "status_code": response.status_code,
+            "url": str(response.url),
+            "headers": {
+                name: value
+                for name, value in (response.headers or {}).items()
+                if name.lower() not in private_headers
+            },
+            **_encode_body(response.content or b""),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def replay(self, key: str) -> requests.Response:
+        with self._lock:
+            recorded = self._responses.get(key)
+            if not recorded:
+                raise ReplayMiss(f"no recorded response for {key}")
+            # the last response of a request is kept for any further repeats
+            interaction = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        response = requests.Response()
+        response.status_code = interaction["status_code"]
+        response.url = interaction["url"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response._content = _decode_body(interaction)
+        response.encoding = "utf-8"
+        return response
+
+    def session_hook(self, session, **options):
+        if self.mode == "record":
+            return RecordingSession(session, self)
+        return ReplaySession(self)
+
+    def __enter__(self) -> Cassette:
+        self._previous_hook = set_session_hook(self.session_hook)
+        return self
+
+    def __exit__(self, *exc_info):
+        set_session_hook(self._previous_hook)
+        if self.mode == "record":
+            self.save()
+            log.info(f"recorded {len(self.interactions)} responses to {self.path}")
+
+
+class RecordingSession:
+    """
+    Wraps a requests or tls_client session and stores each response in a Cassette
+    """
+
+    def __init__(self, session, cassette: Cassette):
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_cassette", cassette)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._session, name, value)
+
+    def request(self, method: str, url: str, **kwargs):
+        response = getattr(self._session, method.lower())(url, **kwargs)
+        key = request_key(
+            method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json")
+        )
+        self._cassette.record(key, response)
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+class ReplaySession(requests.Session):
+    """
+    Session answering every request from a Cassette, without network access
+    """
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def request(self, method, url, params=None, data=None, json=None, **kwargs):
+        response = None
+        try:
+            response = self.cassette.replay(
+                request_key(method, url, params, data, json)
+            )
+            return response
+        finally:
+            record_response(response, 0.0)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from importlib import import_module
+from typing import Callable
+
+from jobspy.cache import SearchCache
+from jobspy.incremental import IncrementalState
+from jobspy.metrics import ScrapeMetrics
+from jobspy.model import JobResponse, Scraper, ScraperInput, Site
+from jobspy.util import create_logger
+
+
+class ScraperRegistry(MutableMapping):
+    """
+    Scraper classes by site. Each is given as "module:class" and imported on first
+    use, so a search only loads the scrapers (and http clients) of its sites.
+    Classes assigned to a site are used as they are.
+    """
+
+    def __init__(self, paths: dict[Site, str]):
+        self._paths = dict(paths)
+        self._classes: dict[Site, type[Scraper]] = {}
+
+    def __getitem__(self, site: Site) -> type[Scraper]:
+        scraper_class = self._classes.get(site)
+        if scraper_class is None:
+            module_name, _, class_name = self._paths[site].partition(":")
+            scraper_class = getattr(import_module(module_name), class_name)
+            self._classes[site] = scraper_class
+        return scraper_class
+
+    def __setitem__(self, site: Site, scraper_class: type[Scraper]):
+        self._paths[site] = f"{scraper_class.__module__}:{scraper_class.__name__}"
+        self._classes[site] = scraper_class
+
+    def __delitem__(self, site: Site):
+        del self._paths[site]
+        self._classes.pop(site, None)
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"ScraperRegistry({self._paths!r})"
+
+
+SCRAPER_MAPPING = ScraperRegistry(
+    {
+        Site.LINKEDIN: "jobspy.linkedin:LinkedIn",
+        Site.INDEED: "jobspy.indeed:Indeed",
+        Site.ZIP_RECRUITER: "jobspy.ziprecruiter:ZipRecruiter",
+        Site.GLASSDOOR: "jobspy.glassdoor:Glassdoor",
+        Site.GOOGLE: "jobspy.google:Google",
+        Site.BAYT: "jobspy.bayt:BaytScraper",
+        Site.NAUKRI: "jobspy.naukri:Naukri",
+    }
+)
+
+# how many searches may hit a site at the same time
+default_site_concurrency = {
+    Site.LINKEDIN: 2,
+    Site.INDEED: 8,
+    Site.ZIP_RECRUITER: 4,
+    Site.GLASSDOOR: 4,
+    Site.GOOGLE: 2,
+    Site.BAYT: 2,
+    Site.NAUKRI: 2,
+}
+
+
+def site_log_name(site: Site) -> str:
+    cap_name = site.value.capitalize()
+    return "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
+
+
+class Scheduler:
+    """
+    Runs site scrapes for any number of searches on one bounded pool of workers.
+    Each site has its own concurrency limit, and idle scrapers (with their sessions and
+    warm-up state) are reused by later searches instead of being rebuilt.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        max_workers: int | None = None,
+        site_concurrency: dict[Site | str, int] | int | None = None,
+        cache: SearchCache | None = None,
+        incremental: IncrementalState | None = None,
+        metrics: ScrapeMetrics | None = None,
+    ):
+        self.proxies = proxies
+        self.ca_cert = ca_cert
+        self.cache = cache
+        self.incremental = incremental
+        self.metrics = metrics
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        limits = dict(default_site_concurrency)
+        if isinstance(site_concurrency, int):
+            limits = {site: site_concurrency for site in Site}
+        elif site_concurrency:
+            for site, limit in site_concurrency.items():
+                limits[Site(site) if isinstance(site, str) else site] = limit
+        self.site_limits = {site: max(limit, 1) for site, limit in limits.items()}
+        # searches waiting for a free slot of their site, and the slots taken
+        self._pending: dict[Site, deque[tuple[Future, Callable]]] = defaultdict(deque)
+        self._running: dict[Site, int] = defaultdict(int)
+        self._idle_scrapers: dict[Site, list[Scraper]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _acquire_scraper(self, site: Site) -> Scraper:
+        with self._lock:
+            if self._idle_scrapers[site]:
+                return self._idle_scrapers[site].pop()
+        scraper_class = SCRAPER_MAPPING[site]
+        return scraper_class(proxies=self.proxies, ca_cert=self.ca_cert)
+
+    def _release_scraper(self, site: Site, scraper: Scraper):
+        with self._lock:
+            self._idle_scrapers[site].append(scraper)
+
+    def scrape_site(
+        self,
+        site: Site,
+        scraper_input: ScraperInput,
+        metrics: ScrapeMetrics | None = None,
+    ) -> JobResponse:
+        """
+        Scrapes one site for one search in the calling thread, regardless of the
+        site's concurrency limit (see submit)
+        :param metrics: of the search, the scheduler's if None
+        """
+        metrics = metrics or self.metrics
+        if self.cache:
+            job_response = self.cache.get(site, scraper_input)
+            if job_response is not None:
+                if self.incremental:
+                    job_response = self.incremental.filter_new(
+                        site, scraper_input, job_response
+                    )
+                if metrics:
+                    metrics.site(site).add(cache_hits=1, jobs=len(job_response.jobs))
+                return job_response
+        collect = metrics.collect(site) if metrics else nullcontext()
+        with collect:
+            scraper = self._acquire_scraper(site)
+            known_ids = (
+                self.incremental.known_ids(site, scraper_input)
+                if self.incremental
+                else set()
+            )
+            scraper.known_ids = known_ids
+            scraper.seen_known_ids = set()
+            try:
+                # scrapers may clamp fields such as results_wanted on their input
+                job_response = scraper.scrape(scraper_input.model_copy())
+                seen_known_ids = scraper.seen_known_ids
+            finally:
+                self._release_scraper(site, scraper)
+        if metrics:
+            metrics.site(site).add(jobs=len(job_response.jobs))
+        create_logger(site_log_name(site)).info(f"finished scraping")
+        # without the known jobs, the response is not the search's full result
+        if self.cache and not known_ids:
+            self.cache.set(site, scraper_input, job_response)
+        if self.incremental:
+            self.incremental.record(
+                site,
+                scraper_input,
+                [job.id for job in job_response.jobs] + list(seen_known_ids),
+            )
+        return job_response
+
+    def submit(
+        self, scraper_input: ScraperInput, metrics: ScrapeMetrics | None = None
+    ) -> dict[Future, Site]:
+        """
+        Schedules every site of the search. Each site's searches wait in its own
+        queue and only reach the pool once the site has a free slot, so searches
+        held back by a busy site never occupy workers other sites could use.
+        :return: future -> site
+        """
+        future_to_site = {}
+        for site in scraper_input.site_type:
+            future = Future()
+            call = partial(self.scrape_site, site, scraper_input, metrics)
+            with self._lock:
+                self._pending[site].append((future, call))
+            future_to_site[future] = site
+            self._dispatch(site)
+        return future_to_site
+
+    def _dispatch(self, site: Site):
+        # hands the site's pending searches to the pool while it has free slots
+        with self._lock:
+            limit = self.site_limits.get(site, 1)
+            while self._pending[site] and self._running[site] < limit:
+                future, call = self._pending[site].popleft()
+                if not future.set_running_or_notify_cancel():
+                    continue
+                self._running[site] += 1
+                self.executor.submit(self._run, site, future, call)
+
+    def _run(self, site: Site, future: Future, call: Callable):
+        try:
+            future.set_result(call())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._running[site] -= 1
+            self._dispatch(site)
+
+    def run(
+        self, scraper_input: ScraperInput, metrics: ScrapeMetrics | None = None
+    ) -> dict[str, JobResponse]:
+        """
+        Scrapes every site of the search and waits for all of them
+        :return: site value -> JobResponse
+        """
+        site_to_jobs = {}
+        future_to_site = self.submit(scraper_input, metrics)
+        for future in as_completed(future_to_site):
+            site_to_jobs[future_to_site[future].value] = future.result()
+        return site_to_jobs
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pending = [item for queue in self._pending.values() for item in queue]
+            self._pending.clear()
+        for future, _ in pending:
+            future.cancel()
+        self.executor.shutdown(wait=wait)
+        with self._lock:
+            scrapers = [s for idle in self._idle_scrapers.values() for s in idle]
+            self._idle_scrapers.clear()
+        for scraper in scrapers:
+            scraper.close()
@@ -0,0 +1,629 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import inspect
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from functools import partial
+from queue import Empty, Full, Queue
+from typing import Callable, Iterator, Tuple
+
+import pandas as pd
+
+from jobspy.cache import SearchCache
+from jobspy.dedup import cluster_duplicates
+from jobspy.frame import (
+    compact_frame,
+    job_to_row,
+    jobs_to_dataframe,
+    select_fields,
+    select_row_fields,
+)
+from jobspy.incremental import IncrementalState
+from jobspy.metrics import ScrapeMetrics
+from jobspy.proxy import ProxyPool
+from jobspy.model import JobResponse, Country
+from jobspy.model import ScraperInput, Site
+from jobspy.scheduler import SCRAPER_MAPPING, Scheduler, site_log_name
+from jobspy.util import (
+    set_logger_level,
+    create_logger,
+    desired_order,
+    get_enum_from_value,
+    map_str_to_site,
+)
+
+
+def _get_site_types(
+    site_name: str | list[str] | Site | list[Site] | None,
+) -> list[Site]:
+    site_types = list(Site)
+    if isinstance(site_name, str):
+        site_types = [map_str_to_site(site_name)]
+    elif isinstance(site_name, Site):
+        site_types = [site_name]
+    elif isinstance(site_name, list):
+        site_types = [
+            map_str_to_site(site) if isinstance(site, str) else site
+            for site in site_name
+        ]
+    return site_types
+
+
+def _create_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    glassdoor_description_batch_size: int = 10,
+    offset: int | None = 0,
+    hours_old: int = None,
+    fields: list[str] | None = None,
+) -> ScraperInput:
+    job_type = get_enum_from_value(job_type) if job_type else None
+    if fields is not None:
+        unknown = set(fields) - set(desired_order)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        # sorted so equal selections share cache entries
+        fields = sorted(set(fields))
+    return ScraperInput(
+        site_type=_get_site_types(site_name),
+        country=Country.from_string(country_indeed),
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        results_wanted=results_wanted,
+        linkedin_company_ids=linkedin_company_ids,
+        glassdoor_description_batch_size=glassdoor_description_batch_size,
+        offset=offset,
+        hours_old=hours_old,
+        fields=fields,
+    )
+
+
+# search parameters a scrape_jobs_many query may set
+_query_keys = {
+    *inspect.signature(_create_scraper_input).parameters,
+    "enforce_annual_salary",
+}
+
+
+def _report_metrics(
+    jobs_df: pd.DataFrame,
+    metrics: ScrapeMetrics,
+    on_metrics: Callable[[ScrapeMetrics], None] | None,
+) -> pd.DataFrame:
+    metrics.finish()
+    jobs_df.attrs["metrics"] = metrics.to_dict()
+    if on_metrics:
+        on_metrics(metrics)
+    return jobs_df
+
+
+def scrape_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | ProxyPool | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    glassdoor_description_batch_size: int = 10,
+    offset: int | None = 0,
+    hours_old: int = None,
+    fields: list[str] | None = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    cache: SearchCache | None = None,
+    incremental: IncrementalState | None = None,
+    dedupe: bool = False,
+    compact: bool = False,
+    on_metrics: Callable[[ScrapeMetrics], None] | None = None,
+    scheduler: Scheduler | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Scrapes job data from job boards concurrently
+    :param fields: columns to return, all by default. Work needed only for the others
+        is skipped: detail page requests, description conversion, email and salary
+        parsing
+    :param dedupe: adds a cluster_id column shared by postings of the same job
+    :param compact: returns the columns with compact dtypes, see frame.compact_frame
+    :param on_metrics: called with the ScrapeMetrics of the run, which are also
+        stored as a dict in the DataFrame's attrs["metrics"]
+    :param scheduler: long-lived scheduler to run the search on, whose proxies,
+        ca_cert, cache and incremental state are used instead (see JobSpyClient)
+    :return: Pandas DataFrame containing job data
+    """
+    set_logger_level(verbose)
+    metrics = ScrapeMetrics()
+    scraper_input = _create_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        glassdoor_description_batch_size=glassdoor_description_batch_size,
+        offset=offset,
+        hours_old=hours_old,
+        fields=fields,
+    )
+
+    if scheduler is not None:
+        site_to_jobs_dict = scheduler.run(scraper_input, metrics)
+    else:
+        scheduler = Scheduler(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            max_workers=len(scraper_input.site_type) or None,
+            cache=cache,
+            incremental=incremental,
+            metrics=metrics,
+        )
+        try:
+            site_to_jobs_dict = scheduler.run(scraper_input)
+        finally:
+            scheduler.shutdown()
+
+    with metrics.timed("frame_time"):
+        jobs_df = jobs_to_dataframe(
+            site_to_jobs_dict,
+            country=scraper_input.country,
+            enforce_annual_salary=enforce_annual_salary,
+            fields=scraper_input.fields,
+        )
+    if dedupe and not jobs_df.empty:
+        jobs_df["cluster_id"] = cluster_duplicates(jobs_df)
+    jobs_df = select_fields(jobs_df, scraper_input.fields)
+    if compact:
+        jobs_df = compact_frame(jobs_df)
+    return _report_metrics(jobs_df, metrics, on_metrics)
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | ProxyPool | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    glassdoor_description_batch_size: int = 10,
+    offset: int | None = 0,
+    hours_old: int = None,
+    fields: list[str] | None = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    cache: SearchCache | None = None,
+    incremental: IncrementalState | None = None,
+    queue_size: int = 100,
+    on_metrics: Callable[[ScrapeMetrics], None] | None = None,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Scrapes job boards concurrently and yields each job as soon as its search page is parsed.
+    Scrapers block once queue_size jobs are waiting to be consumed.
+    :param on_metrics: called with the ScrapeMetrics of the run once every job is yielded
+    :return: iterator of job records keyed by the scrape_jobs DataFrame columns (the
+        requested fields only, if given)
+    """
+    set_logger_level(verbose)
+    scraper_input = _create_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        glassdoor_description_batch_size=glassdoor_description_batch_size,
+        offset=offset,
+        hours_old=hours_old,
+        fields=fields,
+    )
+    metrics = ScrapeMetrics()
+    jobs_queue: Queue = Queue(maxsize=max(queue_size, 1))
+    stopped = threading.Event()
+    site_done = object()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                jobs_queue.put(item, timeout=0.5)
+                return True
+            except Full:
+                continue
+        return False
+
+    def worker(site: Site):
+        scraper = pages = None
+        try:
+            with metrics.collect(site) as site_metrics:
+                cached = cache.get(site, scraper_input) if cache else None
+                if cached is not None:
+                    site_metrics.add(cache_hits=1)
+                    if incremental:
+                        cached = incremental.filter_new(site, scraper_input, cached)
+                    pages = [cached.jobs]
+                else:
+                    scraper = SCRAPER_MAPPING[site](proxies=proxies, ca_cert=ca_cert)
+                    if incremental:
+                        scraper.known_ids = incremental.known_ids(site, scraper_input)
+                    pages = scraper.scrape_pages(scraper_input.model_copy())
+                site_jobs = []
+                for page in pages:
+                    site_metrics.add(jobs=len(page))
+                    for job in page:
+                        row = job_to_row(
+                            site.value,
+                            job,
+                            scraper_input.country,
+                            enforce_annual_salary,
+                            scraper_input.fields,
+                        )
+                        if not put(select_row_fields(row, scraper_input.fields)):
+                            return
+                    if cached is None:
+                        site_jobs.extend(page)
+            # without the known jobs, the result is not the search's full result
+            if cache and scraper and not scraper.known_ids:
+                cache.set(site, scraper_input, JobResponse(jobs=site_jobs))
+            if incremental and scraper:
+                incremental.record(
+                    site,
+                    scraper_input,
+                    [job.id for job in site_jobs] + list(scraper.seen_known_ids),
+                )
+            create_logger(site_log_name(site)).info(f"finished scraping")
+        except Exception as e:
+            put(e)
+        finally:
+            # ends the scraper's page loop (and its worker pool) on an early exit
+            if hasattr(pages, "close"):
+                pages.close()
+            if scraper is not None:
+                scraper.close()
+            put(site_done)
+
+    executor = ThreadPoolExecutor(max_workers=len(scraper_input.site_type) or 1)
+    try:
+        for site in scraper_input.site_type:
+            executor.submit(worker, site)
+        sites_left = len(scraper_input.site_type)
+        while sites_left:
+            try:
+                item = jobs_queue.get(timeout=0.5)
+            except Empty:
+                continue
+            if item is site_done:
+                sites_left -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+        metrics.finish()
+        if on_metrics:
+            on_metrics(metrics)
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | ProxyPool | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    glassdoor_description_batch_size: int = 10,
+    offset: int | None = 0,
+    hours_old: int = None,
+    fields: list[str] | None = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    cache: SearchCache | None = None,
+    incremental: IncrementalState | None = None,
+    executor: Executor | None = None,
+    compact: bool = False,
+    on_metrics: Callable[[ScrapeMetrics], None] | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Coroutine version of scrape_jobs. Sites are scraped concurrently from the running
+    event loop. With httpx installed, all sites but Glassdoor and ZipRecruiter send
+    their requests and wait between them on the loop itself; those two fetch each
+    page on executor (the loop's default if None), which also runs the cache and
+    incremental stores.
+    :param compact: returns the columns with compact dtypes, see frame.compact_frame
+    :param on_metrics: called with the ScrapeMetrics of the run, which are also
+        stored as a dict in the DataFrame's attrs["metrics"]
+    :return: Pandas DataFrame containing job data
+    """
+    set_logger_level(verbose)
+    scraper_input = _create_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        glassdoor_description_batch_size=glassdoor_description_batch_size,
+        offset=offset,
+        hours_old=hours_old,
+        fields=fields,
+    )
+    loop = asyncio.get_running_loop()
+    metrics = ScrapeMetrics()
+
+    async def scrape_site(site: Site) -> Tuple[str, JobResponse]:
+        if cache:
+            cached = await loop.run_in_executor(
+                executor, cache.get, site, scraper_input
+            )
+            if cached is not None:
+                if incremental:
+                    cached = await loop.run_in_executor(
+                        executor, incremental.filter_new, site, scraper_input, cached
+                    )
+                metrics.site(site).add(cache_hits=1, jobs=len(cached.jobs))
+                return site.value, cached
+        with metrics.collect(site) as site_metrics:
+            scraper_class = SCRAPER_MAPPING[site]
+            # some scrapers do network warm-up in __init__
+            scraper = await loop.run_in_executor(
+                executor,
+                contextvars.copy_context().run,
+                partial(scraper_class, proxies=proxies, ca_cert=ca_cert),
+            )
+            try:
+                if incremental:
+                    scraper.known_ids = await loop.run_in_executor(
+                        executor, incremental.known_ids, site, scraper_input
+                    )
+                scraped_data = await scraper.scrape_async(
+                    scraper_input.model_copy(), executor
+                )
+            finally:
+                scraper.close()
+            site_metrics.add(jobs=len(scraped_data.jobs))
+        create_logger(site_log_name(site)).info(f"finished scraping")
+        # without the known jobs, the result is not the search's full result
+        if cache and not scraper.known_ids:
+            await loop.run_in_executor(
+                executor, cache.set, site, scraper_input, scraped_data
+            )
+        if incremental:
+            job_ids = [job.id for job in scraped_data.jobs]
+            job_ids += scraper.seen_known_ids
+            await loop.run_in_executor(
+                executor, incremental.record, site, scraper_input, job_ids
+            )
+        return site.value, scraped_data
+
+    results = await asyncio.gather(
+        *(scrape_site(site) for site in scraper_input.site_type)
+    )
+    with metrics.timed("frame_time"):
+        jobs_df = jobs_to_dataframe(
+            dict(results),
+            country=scraper_input.country,
+            enforce_annual_salary=enforce_annual_salary,
+            fields=scraper_input.fields,
+        )
+    jobs_df = select_fields(jobs_df, scraper_input.fields)
+    if compact:
+        jobs_df = compact_frame(jobs_df)
+    return _report_metrics(jobs_df, metrics, on_metrics)
+
+
+def scrape_jobs_many(
+    queries: list[dict],
+    proxies: list[str] | str | ProxyPool | None = None,
+    ca_cert: str | None = None,
+    max_workers: int | None = None,
+    site_concurrency: dict[str, int] | int | None = None,
+    stream: bool = False,
+    verbose: int = 0,
+    cache: SearchCache | None = None,
+    incremental: IncrementalState | None = None,
+    dedupe: bool = False,
+    compact: bool = False,
+    on_metrics: Callable[[ScrapeMetrics], None] | None = None,
+    scheduler: Scheduler | None = None,
+) -> pd.DataFrame | Iterator[Tuple[int, pd.DataFrame]]:
+    """
+    Scrapes many searches through one shared scheduler. Each query is a dict of
+    scrape_jobs search parameters (site_name, search_term, location, country_indeed,
+    results_wanted, enforce_annual_salary, ...).
+    Scrapers and their sessions are reused between queries and every site is limited
+    to site_concurrency simultaneous searches.
+    With dedupe, a cluster_id column links postings of the same job across sites and
+    queries (within each query's DataFrame when streaming).
+    With compact, the DataFrames have compact dtypes (see frame.compact_frame),
+    applied once the queries' DataFrames are combined.
+    on_metrics is called with the ScrapeMetrics of all queries once they are done;
+    they are also stored in the combined DataFrame's attrs["metrics"].
+    Queries may request different fields; the combined DataFrame has the columns
+    requested by any of them.
+    A long-lived scheduler (see JobSpyClient) replaces the proxies, ca_cert, max_workers,
+    site_concurrency, cache and incremental parameters and is left running.
+    :return: DataFrame of all jobs with a query_index column, or with stream=True an
+        iterator of (query index, DataFrame) in completion order
+    """
+    set_logger_level(verbose)
+    queries = [dict(query) for query in queries]
+    for index, query in enumerate(queries):
+        unknown = set(query) - _query_keys
+        if unknown:
+            raise ValueError(
+                f"Unknown keys in query {index}: {', '.join(sorted(unknown))} "
+                "(options of the whole run such as proxies or verbose are "
+                "scrape_jobs_many parameters)"
+            )
+    enforce_annual_salary = [
+        query.pop("enforce_annual_salary", False) for query in queries
+    ]
+    scraper_inputs = [_create_scraper_input(**query) for query in queries]
+    metrics = ScrapeMetrics()
+
+    def run() -> Iterator[Tuple[int, pd.DataFrame]]:
+        runner = scheduler or Scheduler(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            max_workers=max_workers,
+            site_concurrency=site_concurrency,
+            cache=cache,
+            incremental=incremental,
+        )
+        try:
+            future_to_query = {}
+            sites_left = {}
+            results: dict[int, dict[str, JobResponse]] = {}
+            for index, scraper_input in enumerate(scraper_inputs):
+                futures = runner.submit(scraper_input, metrics)
+                future_to_query.update(
+                    {future: (index, site) for future, site in futures.items()}
+                )
+                sites_left[index] = len(futures)
+                results[index] = {}
+                if not futures:
+                    yield index, pd.DataFrame()
+
+            for future in as_completed(future_to_query):
+                index, site = future_to_query[future]
+                results[index][site.value] = future.result()
+                sites_left[index] -= 1
+                if sites_left[index] == 0:
+                    with metrics.timed("frame_time"):
+                        jobs_df = jobs_to_dataframe(
+                            results.pop(index),
+                            country=scraper_inputs[index].country,
+                            enforce_annual_salary=enforce_annual_salary[index],
+                            fields=scraper_inputs[index].fields,
+                        )
+                    if stream:
+                        if dedupe and not jobs_df.empty:
+                            jobs_df["cluster_id"] = cluster_duplicates(jobs_df)
+                        jobs_df = select_fields(jobs_df, scraper_inputs[index].fields)
+                        if compact:
+                            jobs_df = compact_frame(jobs_df)
+                    yield index, jobs_df
+            if stream:
+                metrics.finish()
+                if on_metrics:
+                    on_metrics(metrics)
+        finally:
+            if runner is not scheduler:
+                runner.shutdown(wait=False)
+
+    if stream:
+        return run()
+
+    jobs_dfs = []
+    for index, jobs_df in sorted(run(), key=lambda result: result[0]):
+        if not jobs_df.empty:
+            jobs_dfs.append(jobs_df.assign(query_index=index))
+    if not jobs_dfs:
+        return _report_metrics(pd.DataFrame(), metrics, on_metrics)
+    with metrics.timed("frame_time"):
+        jobs_df = pd.concat(jobs_dfs, ignore_index=True)
+        jobs_df = jobs_df[["query_index", *jobs_df.columns[:-1]]]
+    if dedupe:
+        jobs_df["cluster_id"] = cluster_duplicates(jobs_df)
+    if all(scraper_input.fields is not None for scraper_input in scraper_inputs):
+        fields = {f for scraper_input in scraper_inputs for f in scraper_input.fields}
+        jobs_df = select_fields(jobs_df, fields)
+    if compact:
+        jobs_df = compact_frame(jobs_df)
+    return _report_metrics(jobs_df, metrics, on_metrics)
+
+
+def scrape_jobs_arrow(batch_size: int = 10000, **kwargs):
+    """
+    Scrapes like scrape_jobs (same parameters) but builds a pyarrow.Table straight
+    from the job records, with dictionary-encoded site, job_type, interval, currency
+    and listing_type columns. No pandas DataFrame is created.
+    :return: pyarrow.Table
+    """
+    from jobspy.arrow import rows_to_table
+
+    return rows_to_table(
+        iter_jobs(**kwargs), batch_size=batch_size, fields=kwargs.get("fields")
+    )
+
+
+def scrape_jobs_to_parquet(path: str, batch_size: int = 1000, **kwargs) -> int:
+    """
+    Scrapes like scrape_jobs (same parameters) and streams the jobs to a Parquet file
+    in record batches of batch_size while the scrape is running.
+    :return: number of jobs written
+    """
+    from jobspy.arrow import write_parquet
+
+    return write_parquet(
+        iter_jobs(**kwargs), path, batch_size=batch_size, fields=kwargs.get("fields")
+    )
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
 import logging
 import re
-from itertools import cycle
+import time
+from functools import cache
+from typing import TYPE_CHECKING, Callable
 
-import numpy as np
 import requests
-import tls_client
 import urllib3
-from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
+from jobspy import ratelimit
+from jobspy.analyzer import analyze_description, find_emails, salary_regex
+from jobspy.metrics import (
+    record_response,
+    record_retry,
+    record_sleep,
+)
 from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.proxy import DIRECT, ProxyPool, format_proxy
+from jobspy.ratelimit import BackoffPolicy, RateLimiter
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -29,32 +42,151 @@ def create_logger(name: str):
     return logger
 
 
+log = create_logger("Session")
+
+
 class RotatingProxySession:
-    def __init__(self, proxies=None):
-        if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
+    def __init__(
+        self,
+        proxies=None,
+        rate_limiter: RateLimiter | None = None,
+        backoff: BackoffPolicy | None = None,
+    ):
+        self.rate_limiter = rate_limiter
+        self.backoff = backoff
+        if isinstance(proxies, ProxyPool):
+            self.proxy_pool = proxies
         else:
-            self.proxy_cycle = None
+            self.proxy_pool = ProxyPool(proxies) if proxies else None
 
     @staticmethod
     def format_proxy(proxy):
         """Utility method to format a proxy string into a dictionary."""
-        if proxy.startswith("http://") or proxy.startswith("https://"):
-            return {"http": proxy, "https": proxy}
-        if proxy.startswith("socks5://"):
-            return {"http": proxy, "https": proxy}
-        return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+        proxy = format_proxy(proxy)
+        return {"http": proxy, "https": proxy}
+
+    def rotate_proxy(self, url: str | None = None) -> str | None:
+        """
+        Picks the proxy of the next request from the pool, avoiding those cooling off
+        for url. The session itself is left unchanged so it can be used by many threads.
+        :return: proxy url, DIRECT for the direct connection, None without a pool
+        """
+        if not self.proxy_pool:
+            return None
+        skip = None
+        if url and self.rate_limiter:
+            skip = lambda proxy: self.rate_limiter.cooling_off(url, proxy)
+        return self.proxy_pool.acquire(skip=skip)
+
+    def _wait_timeout(self, attempt: int, started: float) -> float | None:
+        # retries may only wait for the rest of the backoff budget
+        if not attempt:
+            return None
+        return self.backoff.budget - (time.monotonic() - started)
+
+    def _report(self, pool_proxy: str | None, response, elapsed: float):
+        record_response(response, elapsed)
+        if self.proxy_pool:
+            self.proxy_pool.report(
+                pool_proxy, elapsed, getattr(response, "status_code", None)
+            )
+
+    def _retry_delay(
+        self, url: str, proxy: str | None, response, attempt: int, started: float
+    ) -> float | None:
+        """
+        :return: seconds to sleep before retrying a throttled response (0 when the
+            rate limiter holds the proxy back instead), None to return the response
+        """
+        delay = self.backoff.retry_delay(response, attempt) if self.backoff else None
+        if delay is None:
+            return None
+        remaining = self.backoff.budget - (time.monotonic() - started)
+        if remaining <= 0 or (not self.rate_limiter and delay > remaining):
+            log.warning(f"retry budget exhausted for {url}")
+            return None
+        record_retry()
+        if self.rate_limiter:
+            self.rate_limiter.cool_off(url, proxy, delay)
+            return 0.0
+        record_sleep(delay)
+        return delay
+
+    def send_paced(self, url: str, send: Callable):
+        """
+        Sends through the next proxy once the rate limiter allows it. Throttled
+        responses put that proxy on cool-off (Retry-After or exponential delay) and
+        are retried through the following proxies until the backoff budget runs out.
+        :param send: makes the request through the proxy it is given (see rotate_proxy)
+        :return: response
+        """
+        started = time.monotonic()
+        attempt = 0
+        response = None
+        while True:
+            # proxies cooling off after a throttled response are skipped if possible
+            pool_proxy = self.rotate_proxy(url)
+            proxy = pool_proxy if pool_proxy != DIRECT else None
+            if self.rate_limiter:
+                timeout = self._wait_timeout(attempt, started)
+                if self.rate_limiter.wait(url, proxy, timeout=timeout) is None:
+                    log.warning(f"retry budget exhausted for {url}")
+                    return response
+            start = time.perf_counter()
+            response = None
+            try:
+                response = send(pool_proxy)
+            finally:
+                self._report(pool_proxy, response, time.perf_counter() - start)
+            delay = self._retry_delay(url, proxy, response, attempt, started)
+            if delay is None:
+                return response
+            if delay:
+                time.sleep(delay)
+            attempt += 1
+
+    async def send_paced_async(self, url: str, send: Callable):
+        """
+        Same as send_paced for a coroutine send, sleeping without blocking the loop
+        """
+        started = time.monotonic()
+        attempt = 0
+        response = None
+        while True:
+            pool_proxy = self.rotate_proxy(url)
+            proxy = pool_proxy if pool_proxy != DIRECT else None
+            if self.rate_limiter:
+                timeout = self._wait_timeout(attempt, started)
+                if await self.rate_limiter.wait_async(url, proxy, timeout) is None:
+                    log.warning(f"retry budget exhausted for {url}")
+                    return response
+            start = time.perf_counter()
+            response = None
+            try:
+                response = await send(pool_proxy)
+            finally:
+                self._report(pool_proxy, response, time.perf_counter() - start)
+            delay = self._retry_delay(url, proxy, response, attempt, started)
+            if delay is None:
+                return response
+            if delay:
+                await asyncio.sleep(delay)
+            attempt += 1
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        rate_limiter: RateLimiter | None = None,
+        backoff: BackoffPolicy | None = None,
+    ):
+        RotatingProxySession.__init__(
+            self, proxies=proxies, rate_limiter=rate_limiter, backoff=backoff
+        )
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
@@ -66,7 +198,8 @@ class RequestsRotating(RotatingProxySession, requests.Session):
                 total=3,
                 connect=3,
                 status=3,
-                status_forcelist=[500, 502, 503, 504, 429],
+                # 429 is retried by send_paced through another proxy
+                status_forcelist=[500, 502, 503, 504],
                 backoff_factor=delay,
             )
             adapter = HTTPAdapter(max_retries=retries)
@@ -77,58 +210,228 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         if self.clear_cookies:
             self.cookies.clear()
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
-
-
-class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
-        tls_client.Session.__init__(self, random_tls_extension_order=True)
-
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
+        def send(proxy: str | None):
+            if proxy == DIRECT:
+                # None values also override the environment's proxies
+                kwargs["proxies"] = {"http": None, "https": None}
+            elif proxy:
+                kwargs["proxies"] = self.format_proxy(proxy)
+            return requests.Session.request(self, method, url, **kwargs)
+
+        return self.send_paced(url, send)
+
+
+@cache
+def tls_session_class() -> type:
+    """
+    Session class of is_tls sessions, defined on first use as only ZipRecruiter and
+    Glassdoor need tls_client
+    """
+    import tls_client
+
+    class TLSRotating(RotatingProxySession, tls_client.Session):
+        def __init__(
+            self,
+            proxies=None,
+            rate_limiter: RateLimiter | None = None,
+            backoff: BackoffPolicy | None = None,
+        ):
+            RotatingProxySession.__init__(
+                self, proxies=proxies, rate_limiter=rate_limiter, backoff=backoff
+            )
+            tls_client.Session.__init__(self, random_tls_extension_order=True)
+
+        def execute_request(self, *args, **kwargs):
+            url = args[1] if len(args) > 1 else kwargs["url"]
+
+            def send(proxy: str | None):
+                if proxy == DIRECT:
+                    kwargs["proxy"] = {"http": ""}
+                elif proxy:
+                    kwargs["proxy"] = proxy
+                return tls_client.Session.execute_request(self, *args, **kwargs)
+
+            response = self.send_paced(url, send)
+            response.ok = response.status_code in range(200, 400)
+            return response
+
+    # found as jobspy.util.TLSRotating through the module __getattr__
+    TLSRotating.__qualname__ = "TLSRotating"
+    return TLSRotating
+
+
+def __getattr__(name: str):
+    if name == "TLSRotating":
+        return tls_session_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AsyncRotatingSession(RotatingProxySession):
+    """
+    Asyncio session on httpx, with the proxy pool, rate limiter and backoff of the
+    other sessions. httpx sets the proxy per client, so one client (and connection
+    pool) is kept per proxy. Responses get requests' ok attribute.
+    """
+
+    def __init__(
+        self,
+        proxies=None,
+        verify: bool | str = True,
+        headers: dict | None = None,
+        clear_cookies: bool = False,
+        rate_limiter: RateLimiter | None = None,
+        backoff: BackoffPolicy | None = None,
+    ):
+        super().__init__(proxies=proxies, rate_limiter=rate_limiter, backoff=backoff)
+        self.verify = verify
+        self.headers = dict(headers or {})
+        self.clear_cookies = clear_cookies
+        self._clients = {}
+
+    def _client(self, proxy: str | None):
+        client = self._clients.get(proxy)
+        if client is None:
+            import httpx
+
+            client = self._clients[proxy] = httpx.AsyncClient(
+                proxy=format_proxy(proxy) if proxy and proxy != DIRECT else None,
+                verify=self.verify,
+                headers=self.headers,
+                follow_redirects=True,
+                # the direct connection also ignores the environment's proxies
+                trust_env=proxy != DIRECT,
+            )
+        return client
+
+    async def request(self, method: str, url: str, **kwargs):
+        async def send(proxy: str | None):
+            client = self._client(proxy)
+            if self.clear_cookies:
+                client.cookies.clear()
+            return await client.request(method, url, **kwargs)
+
+        response = await self.send_paced_async(url, send)
+        if response is not None:
+            response.ok = response.status_code < 400
         return response
 
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+def create_async_session(
+    *,
+    proxies: list[str] | str | ProxyPool | None = None,
+    ca_cert: str | None = None,
+    verify: bool = True,
+    headers: dict | None = None,
+    clear_cookies: bool = False,
+    rate_limiter: RateLimiter | None = None,
+    backoff: BackoffPolicy | None = None,
+) -> AsyncRotatingSession:
+    """
+    Creates an asyncio session (needs httpx, pip install python-jobspy[async]).
+    Session hooks only apply to the sessions of create_session.
+    :param verify: checks certificates, ca_cert replaces the default ones
+    :param headers: sent with every request
+    :param clear_cookies: drops the cookies set by earlier responses before a request
+    """
+    return AsyncRotatingSession(
+        proxies=proxies,
+        verify=ca_cert or verify,
+        headers=headers,
+        clear_cookies=clear_cookies,
+        rate_limiter=rate_limiter or ratelimit.rate_limiter,
+        backoff=backoff or ratelimit.backoff_policy,
+    )
+
+
+def async_transport_available() -> bool:
+    """
+    Whether httpx is installed for the asyncio sessions
+    """
+    return importlib.util.find_spec("httpx") is not None
+
+
+# wraps or replaces every session made by create_session, see set_session_hook
+_session_hook: Callable | None = None
+
+
+def set_session_hook(hook: Callable | None) -> Callable | None:
+    """
+    Routes create_session through hook(session, **options), which returns the session
+    the scrapers will use (e.g. jobspy.replay records or replays their traffic)
+    :param hook: callable or None to remove it
+    :return: the previously installed hook
+    """
+    global _session_hook
+    previous, _session_hook = _session_hook, hook
+    return previous
+
 
 def create_session(
     *,
-    proxies: dict | str | None = None,
+    proxies: list[str] | str | ProxyPool | None = None,
     ca_cert: str | None = None,
     is_tls: bool = True,
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    rate_limiter: RateLimiter | None = None,
+    backoff: BackoffPolicy | None = None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    :param proxies: proxy or list of proxies, or a ProxyPool shared with other sessions
+    :param rate_limiter: waited on before each request, the shared one by default
+    :param backoff: retries of throttled responses, the shared policy by default
     :return: A session object
     """
+    rate_limiter = rate_limiter or ratelimit.rate_limiter
+    backoff = backoff or ratelimit.backoff_policy
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        session = tls_session_class()(
+            proxies=proxies, rate_limiter=rate_limiter, backoff=backoff
+        )
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
         )
 
     if ca_cert:
         session.verify = ca_cert
 
+    if _session_hook is not None:
+        session = _session_hook(
+            session,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            is_tls=is_tls,
+            has_retry=has_retry,
+            delay=delay,
+            clear_cookies=clear_cookies,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+        )
     return session
 
 
@@ -151,18 +454,54 @@ def set_logger_level(verbose: int):
         raise ValueError(f"Invalid log level: {level_name}")
 
 
+# tree builder of make_soup, lxml parses several times faster than html.parser but
+# repairs broken markup differently, so it is only used once selected
+html_parser = "html.parser"
+
+
+def set_html_parser(parser: str):
+    """
+    Selects the parser of every page, e.g. "lxml" (pip install python-jobspy[lxml]),
+    "html.parser" (the default) or "html5lib"
+    """
+    global html_parser
+    html_parser = parser
+
+
+def make_soup(
+    markup: str | bytes,
+    parse_only: SoupStrainer | None = None,
+    encoding: str | None = None,
+) -> BeautifulSoup:
+    """
+    Parses a page with the selected parser
+    :param markup: page, response.content bytes are decoded by the parser itself
+    :param parse_only: keeps only the matching tags instead of building the whole tree
+    :param encoding: of markup bytes, e.g. response.encoding, detected if None
+    """
+    from bs4 import BeautifulSoup
+
+    if not isinstance(markup, bytes) or not markup:
+        # empty bytes would make bs4 warn that they could not be decoded
+        markup, encoding = markup or "", None
+    return BeautifulSoup(
+        markup, html_parser, parse_only=parse_only, from_encoding=encoding
+    )
+
+
 def markdown_converter(description_html: str):
-    if description_html is None:
-        return None
-    markdown = md(description_html)
-    return markdown.strip()
+    """
+    Converts a description to markdown, see jobspy.markdown for the cache
+    """
+    from jobspy.markdown import html_to_markdown
+
+    return html_to_markdown(description_html)
 
 
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
-    return email_regex.findall(text)
+    return find_emails(text)
 
 
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
@@ -190,6 +529,8 @@ def currency_parser(cur_str):
     else:
         num = float(cur_str)
 
+    import numpy as np
+
     return np.round(num, 2)
 
 
@@ -214,8 +555,34 @@ def extract_salary(
     if not salary_str:
         return None, None, None, None
 
+    match = salary_regex.search(salary_str)
+    if not match:
+        return None, None, None, None
+    return parse_salary_range(
+        match.groups(),
+        lower_limit=lower_limit,
+        upper_limit=upper_limit,
+        hourly_threshold=hourly_threshold,
+        monthly_threshold=monthly_threshold,
+        enforce_annual_salary=enforce_annual_salary,
+    )
+
+
+def parse_salary_range(
+    salary_range: tuple[str, str, str, str],
+    lower_limit=1000,
+    upper_limit=700000,
+    hourly_threshold=350,
+    monthly_threshold=30000,
+    enforce_annual_salary=False,
+):
+    """
+    Turns a salary range found in a description, e.g. one of
+    DescriptionAnalysis.salaries, into the salary interval, min and max salary values,
+    and currency. The interval is guessed from the size of the amounts.
+    """
     annual_max_salary = None
-    min_max_pattern = r"\$(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)\s*[-—–]\s*(?:\$)?(\d+(?:,\d+)?(?:\.\d+)?)([kK]?)"
+    min_amount, min_suffix, max_amount, max_suffix = salary_range
 
     def to_int(s):
         return int(float(s.replace(",", "")))
@@ -226,66 +593,50 @@ def extract_salary(
     def convert_monthly_to_annual(monthly_wage):
         return monthly_wage * 12
 
-    match = re.search(min_max_pattern, salary_str)
-
-    if match:
-        min_salary = to_int(match.group(1))
-        max_salary = to_int(match.group(3))
-        # Handle 'k' suffix for min and max salaries independently
-        if "k" in match.group(2).lower() or "k" in match.group(4).lower():
-            min_salary *= 1000
-            max_salary *= 1000
-
-        # Convert to annual if less than the hourly threshold
-        if min_salary < hourly_threshold:
-            interval = CompensationInterval.HOURLY.value
-            annual_min_salary = convert_hourly_to_annual(min_salary)
-            if max_salary < hourly_threshold:
-                annual_max_salary = convert_hourly_to_annual(max_salary)
-
-        elif min_salary < monthly_threshold:
-            interval = CompensationInterval.MONTHLY.value
-            annual_min_salary = convert_monthly_to_annual(min_salary)
-            if max_salary < monthly_threshold:
-                annual_max_salary = convert_monthly_to_annual(max_salary)
+    min_salary = to_int(min_amount)
+    max_salary = to_int(max_amount)
+    # Handle 'k' suffix for min and max salaries independently
+    if "k" in min_suffix.lower() or "k" in max_suffix.lower():
+        min_salary *= 1000
+        max_salary *= 1000
+
+    # Convert to annual if less than the hourly threshold
+    if min_salary < hourly_threshold:
+        interval = CompensationInterval.HOURLY.value
+        annual_min_salary = convert_hourly_to_annual(min_salary)
+        if max_salary < hourly_threshold:
+            annual_max_salary = convert_hourly_to_annual(max_salary)
+
+    elif min_salary < monthly_threshold:
+        interval = CompensationInterval.MONTHLY.value
+        annual_min_salary = convert_monthly_to_annual(min_salary)
+        if max_salary < monthly_threshold:
+            annual_max_salary = convert_monthly_to_annual(max_salary)
+
+    else:
+        interval = CompensationInterval.YEARLY.value
+        annual_min_salary = min_salary
+        annual_max_salary = max_salary
 
+    # Ensure salary range is within specified limits
+    if not annual_max_salary:
+        return None, None, None, None
+    if (
+        lower_limit <= annual_min_salary <= upper_limit
+        and lower_limit <= annual_max_salary <= upper_limit
+        and annual_min_salary < annual_max_salary
+    ):
+        if enforce_annual_salary:
+            return interval, annual_min_salary, annual_max_salary, "USD"
         else:
-            interval = CompensationInterval.YEARLY.value
-            annual_min_salary = min_salary
-            annual_max_salary = max_salary
-
-        # Ensure salary range is within specified limits
-        if not annual_max_salary:
-            return None, None, None, None
-        if (
-            lower_limit <= annual_min_salary <= upper_limit
-            and lower_limit <= annual_max_salary <= upper_limit
-            and annual_min_salary < annual_max_salary
-        ):
-            if enforce_annual_salary:
-                return interval, annual_min_salary, annual_max_salary, "USD"
-            else:
-                return interval, min_salary, max_salary, "USD"
+            return interval, min_salary, max_salary, "USD"
     return None, None, None, None
 
 
 def extract_job_type(description: str):
     if not description:
         return []
-
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
-    listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
-            listing_types.append(key)
-
-    return listing_types if listing_types else None
+    return analyze_description(description).job_types or None
 
 
 def map_str_to_site(site_name: str) -> Site:
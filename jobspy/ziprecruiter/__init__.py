@@ -1,13 +1,12 @@
 from __future__ import annotations
 
+import contextvars
 import json
 import math
 import re
-import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-
-from bs4 import BeautifulSoup
+from typing import Iterator
 
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
@@ -16,12 +15,12 @@ from jobspy.util import (
     markdown_converter,
     remove_attributes,
     create_logger,
+    make_soup,
 )
 from jobspy.model import (
     JobPost,
     Compensation,
     Location,
-    JobResponse,
     Country,
     DescriptionFormat,
     Scraper,
@@ -50,37 +49,36 @@ class ZipRecruiter(Scraper):
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
-    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+    def scrape_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         """
-        Scrapes ZipRecruiter for jobs with scraper_input criteria.
+        Scrapes ZipRecruiter for jobs with scraper_input criteria, one page at a time.
         :param scraper_input: Information about job search criteria.
-        :return: JobResponse containing a list of jobs.
+        :return: iterator of the jobs on each page.
         """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        self.seen_urls = set()
+        job_count = 0
         continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
         for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+            if job_count >= scraper_input.results_wanted:
                 break
-            if page > 1:
-                time.sleep(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
             if jobs_on_page:
-                job_list.extend(jobs_on_page)
+                jobs_on_page = jobs_on_page[: scraper_input.results_wanted - job_count]
+                job_count += len(jobs_on_page)
+                yield jobs_on_page
             else:
                 break
             if not continue_token:
                 break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
@@ -115,8 +113,12 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
+        # worker threads record into the run's metrics too
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+            job_results = [
+                executor.submit(contextvars.copy_context().run, self._process_job, job)
+                for job in jobs_list
+            ]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
@@ -131,18 +133,20 @@ class ZipRecruiter(Scraper):
             return
         self.seen_urls.add(job_url)
 
-        description = job.get("job_description", "").strip()
+        description = None
+        if self.scraper_input.wants("description", "emails"):
+            description = job.get("job_description", "").strip()
+            description = (
+                markdown_converter(description)
+                if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
+                else description
+            )
         listing_type = job.get("buyer_type", "")
-        description = (
-            markdown_converter(description)
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
-            else description
-        )
         company = job.get("hiring_company", {}).get("name")
         country_value = "usa" if job.get("job_country") == "US" else "canada"
         country_enum = Country.from_string(country_value)
 
-        location = Location(
+        location = Location.build(
             city=job.get("job_city"), state=job.get("job_state"), country=country_enum
         )
         job_type = get_job_type_enum(
@@ -154,15 +158,17 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
+        description_full = job_url_direct = None
+        if self.scraper_input.wants("description", "job_url_direct"):
+            description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        return JobPost.build(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
             location=location,
             job_type=job_type,
-            compensation=Compensation(
+            compensation=Compensation.build(
                 interval=comp_interval,
                 min_amount=comp_min,
                 max_amount=comp_max,
@@ -171,7 +177,11 @@ class ZipRecruiter(Scraper):
             date_posted=date_posted,
             job_url=job_url,
             description=description_full if description_full else description,
-            emails=extract_emails_from_text(description) if description else None,
+            emails=(
+                extract_emails_from_text(description)
+                if description and self.scraper_input.wants("emails")
+                else None
+            ),
             job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
@@ -180,20 +190,9 @@ class ZipRecruiter(Scraper):
         res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None
         if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_descr_div = soup.find("div", class_="job_description")
-            company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = (
-                remove_attributes(job_descr_div).prettify(formatter="html")
-                if job_descr_div
-                else ""
-            )
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html")
-                if company_descr_section
-                else ""
-            )
-            description_full = job_description_clean + company_description_clean
+            soup = make_soup(res.content, encoding=res.encoding)
+            if self.scraper_input.wants("description"):
+                description_full = self._parse_descr(soup)
 
             try:
                 script_tag = soup.find("script", type="application/json")
@@ -206,11 +205,24 @@ class ZipRecruiter(Scraper):
             except:
                 job_url_direct = None
 
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
-
         return description_full, job_url_direct
 
+    def _parse_descr(self, soup) -> str:
+        sections = [
+            remove_attributes(section)
+            for section in (
+                soup.find("div", class_="job_description"),
+                soup.find("section", class_="company_description"),
+            )
+            if section
+        ]
+        description = "".join(
+            section.prettify(formatter="html") for section in sections
+        )
+        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            description = markdown_converter(description)
+        return description
+
     def _get_cookies(self):
         """
         Sends a session event to the API with device properties.
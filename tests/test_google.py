@@ -0,0 +1,28 @@
+import pytest
+
+from jobspy.google import Google
+from jobspy.model import ScraperInput, Site
+
+
+def job_info(description: str) -> list:
+    info = [None] * 29
+    info[0], info[1], info[2] = "Developer", "Acme", "Austin, TX, US"
+    info[3] = [["https://example.com/job"]]
+    info[19] = description
+    info[28] = "1"
+    return info
+
+
+@pytest.mark.parametrize(
+    "description, is_remote",
+    [
+        ("Fully remote team", True),
+        ("WFH two days a week", True),
+        ("Work from home on Fridays", False),
+        ("On site in Austin", False),
+    ],
+)
+def test_remote_keywords(description, is_remote):
+    scraper = Google()
+    scraper.scraper_input = ScraperInput(site_type=[Site.GOOGLE], search_term="dev")
+    assert scraper._parse_job(job_info(description)).is_remote is is_remote
@@ -0,0 +1,44 @@
+import asyncio
+import os
+
+import pytest
+
+from jobspy import iter_jobs, scrape_jobs, scrape_jobs_async
+from jobspy.cache import SearchCache
+from jobspy.incremental import IncrementalState
+from jobspy.replay import Cassette
+
+fixture = os.path.join(os.path.dirname(__file__), "..", "fixtures", "indeed.json")
+
+
+def run_scrape_jobs(**search) -> set[str]:
+    return set(scrape_jobs(**search).get("id", []))
+
+
+def run_iter_jobs(**search) -> set[str]:
+    return {row["id"] for row in iter_jobs(**search)}
+
+
+def run_scrape_jobs_async(**search) -> set[str]:
+    return set(asyncio.run(scrape_jobs_async(**search)).get("id", []))
+
+
+@pytest.mark.parametrize("run", [run_scrape_jobs, run_iter_jobs, run_scrape_jobs_async])
+def test_cache_hit_only_returns_new_jobs(tmp_path, run):
+    cache = SearchCache(path=str(tmp_path / "searches.sqlite"))
+    incremental = IncrementalState(path=str(tmp_path / "seen_jobs.sqlite"))
+    with Cassette(fixture) as cassette:
+        search = dict(cassette.search, cache=cache)
+        all_ids = run_scrape_jobs(**search)
+        assert all_ids
+
+        hits = []
+        search.update(incremental=incremental, on_metrics=hits.append)
+        # the cached result is new to the incremental state, then known
+        assert run(**search) == all_ids
+        assert run(**search) == set()
+        assert [m.to_dict()["sites"]["indeed"]["cache_hits"] for m in hits] == [1, 1]
+
+        # the cache hits were recorded, so a scrape skips the jobs too
+        del search["cache"], search["on_metrics"]
+        assert run_scrape_jobs(**search) == set()
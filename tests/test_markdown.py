@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+from jobspy.benchmark import compare_markdown_fixture
+
+fixtures = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+
+
+@pytest.mark.parametrize("site", ["linkedin", "indeed", "zip_recruiter", "glassdoor"])
+def test_markdown_descriptions_match_markdownify(site):
+    results = compare_markdown_fixture(os.path.join(fixtures, f"{site}.json"))
+    assert results["descriptions"]
+    assert results["cached_equal"] == results["descriptions"]
+    assert results["scraped_equal"] == results["descriptions"]
@@ -0,0 +1,23 @@
+import glob
+import os
+
+import pytest
+
+from jobspy import util
+from jobspy.benchmark import compare_parsers
+
+fixtures = sorted(
+    glob.glob(os.path.join(os.path.dirname(__file__), "..", "fixtures", "*.json"))
+)
+
+
+def test_html_parser_is_the_default():
+    assert util.html_parser == "html.parser"
+
+
+@pytest.mark.parametrize("path", fixtures, ids=os.path.basename)
+def test_lxml_gives_the_same_jobs(path):
+    pytest.importorskip("lxml")
+    results = compare_parsers(path, ["html.parser", "lxml"])
+    assert results["jobs"].nunique() == 1
+    assert list(results["differing_columns"]) == ["", ""]
@@ -0,0 +1,69 @@
+import os
+import threading
+
+import pytest
+import requests
+
+from jobspy import ratelimit, scrape_jobs
+from jobspy.linkedin import LinkedIn
+from jobspy.replay import Cassette, request_key
+
+fixture = os.path.join(os.path.dirname(__file__), "..", "fixtures", "linkedin.json")
+
+
+class FakeClock:
+    """
+    Clock of the rate limiter that stands still: sleeping does not take time, each
+    thread notes how long the limiter held back its last request instead
+    """
+
+    def __init__(self):
+        self.waited = threading.local()
+
+    def monotonic(self) -> float:
+        return 0.0
+
+    def time(self) -> float:
+        return 0.0
+
+    def sleep(self, seconds: float):
+        self.waited.seconds = seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", clock)
+    ratelimit.rate_limiter.reset()
+    yield clock
+    ratelimit.rate_limiter.reset()
+
+
+def test_detail_pages_of_a_search_page_start_together(clock, monkeypatch):
+    cassette = Cassette(fixture)
+    workers = LinkedIn().detail_workers
+    # the first detail requests only return once all of them are in flight
+    in_flight = threading.Barrier(workers, timeout=5)
+    detail_delays = []
+    lock = threading.Lock()
+
+    def request(session, method, url, params=None, **kwargs):
+        delay = getattr(clock.waited, "seconds", 0.0)
+        clock.waited.seconds = 0.0
+        if "/jobs/view/" in url:
+            with lock:
+                detail_delays.append(delay)
+                first = len(detail_delays) <= workers
+            if first:
+                in_flight.wait()
+        return cassette.replay(request_key(method, url, params))
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    jobs = scrape_jobs(**cassette.search)
+
+    assert not in_flight.broken
+    assert len(detail_delays) == len(jobs) > workers
+    detail_delays.sort()
+    # the first detail_workers requests go out at once, the rest at the page rate
+    assert detail_delays[:workers] == [0.0] * workers
+    assert detail_delays[workers] == 1.0